@@ -0,0 +1,300 @@
+"""
+Scripted benchmark scenarios.
+
+Each scenario builds a Level on an off-screen display, steps it for a fixed
+number of frames (with the frame clock, so results don't depend on timers)
+and reports p50/p95/p99 frame times per phase.
+
+    python benchmark.py                      # all scenarios
+    python benchmark.py day1_idle --frames 300 --out bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+import game_clock
+from settings import DAY_CYCLE_LENGTH, NIGHT_START_THRESHOLD, GAME_HEIGHT, TILE_SIZE
+
+SCREEN_SIZE: Tuple[int, int] = (1920, GAME_HEIGHT)
+ENEMY_VARIANTS: List[str] = [
+    "enemy01",
+    "enemy02",
+    "enemy03",
+    "enemy04",
+    "enemy05",
+    "enemy06",
+]
+
+
+def make_unkillable(level: Any) -> None:
+    """Keeps the player alive so the gameplay phases stay active."""
+    player = level.player.sprite
+    player.max_health = 10**9
+    player.current_health = player.max_health
+
+
+def start_night(level: Any, day: int) -> None:
+    """Moves the day/night cycle to the start of the given day's night."""
+    level.day_count = day
+    level.day_timer = (day - 1) * DAY_CYCLE_LENGTH + int(
+        DAY_CYCLE_LENGTH * (NIGHT_START_THRESHOLD + 0.1)
+    )
+    level.show_celebration = False
+    level.wave_generated = False
+
+
+def spawn_around_player(level: Any, count: int, spread: int) -> None:
+    player_x = level.player.sprite.rect.centerx
+    ground_y = 8 * TILE_SIZE
+    for _ in range(count):
+        x = player_x + random.randint(-spread, spread)
+        level.spawn_enemy(random.choice(ENEMY_VARIANTS), x, ground_y)
+
+
+def build_all_towers(level: Any) -> None:
+    for tile in [t for t in level.tiles if t.is_buyable]:
+        tower = level.build_tower(tile)
+        while tower.level < tower.max_level:
+            tower.upgrade()
+
+
+def setup_day1_idle(level: Any) -> None:
+    make_unkillable(level)
+
+
+def setup_day30_night(level: Any) -> None:
+    make_unkillable(level)
+    build_all_towers(level)
+    start_night(level, 30)
+    level.day_night_cycle()
+    # spawn the whole wave at once instead of over the night
+    while level.night_enemy_queue:
+        variant, hp_m, dmg_m = level.night_enemy_queue.pop(0)
+        x = random.randint(level.map_width // 2 - 3000, level.map_width // 2 + 3000)
+        level.spawn_enemy(variant, x, 8 * TILE_SIZE, hp_m, dmg_m)
+
+
+def setup_500_enemies(level: Any) -> None:
+    make_unkillable(level)
+    spawn_around_player(level, 500, SCREEN_SIZE[0] // 2)
+
+
+def setup_2000_enemies(level: Any) -> None:
+    make_unkillable(level)
+    spawn_around_player(level, 2000, 4000)
+
+
+def setup_siege(level: Any) -> None:
+    make_unkillable(level)
+    build_all_towers(level)
+    # unkillable enemies along the tower line keep every tower firing
+    for _ in range(500):
+        x = random.randint(level.map_width // 2 - 3000, level.map_width // 2 + 3000)
+        enemy = level.spawn_enemy(random.choice(ENEMY_VARIANTS), x, 8 * TILE_SIZE)
+        enemy.max_health = enemy.current_health = 10**9
+
+
+def setup_bullet_storm(level: Any) -> None:
+    make_unkillable(level)
+    for _ in range(200):
+        x = level.player.sprite.rect.centerx + random.randint(-2000, 2000)
+        enemy = level.spawn_enemy(random.choice(ENEMY_VARIANTS), x, 8 * TILE_SIZE)
+        enemy.max_health = enemy.current_health = 10**9
+
+
+def fire_volley(level: Any) -> None:
+    """Fires 60 projectiles per frame, about 5000 in flight at steady state."""
+    from bullet import Bullet
+
+    player_x = level.player.sprite.rect.centerx
+    for i in range(60):
+        x = player_x + random.randint(-1500, 1500)
+        y = 8 * TILE_SIZE - random.randint(50, 600)
+        direction = 1 if i % 2 else -1
+        if i % 3:
+            level.create_bullet(x, y, direction, Bullet.load_source("bullet.png"))
+        else:
+            arrow = Bullet.load_source("arrow.png")
+            level.create_bullet(x, y, direction, arrow, 10, 0.1)
+
+
+def setup_menu_idle(level: Any) -> None:
+    pass
+
+
+# name -> (setup, is_menu)
+SCENARIOS: Dict[str, Tuple[Callable[[Any], None], bool]] = {
+    "day1_idle": (setup_day1_idle, False),
+    "day30_night_all_towers": (setup_day30_night, False),
+    "enemies_500": (setup_500_enemies, False),
+    "enemies_2000": (setup_2000_enemies, False),
+    "siege_500": (setup_siege, False),
+    "bullet_storm": (setup_bullet_storm, False),
+    "menu_idle": (setup_menu_idle, True),
+}
+# name -> called before every frame
+FRAME_HOOKS: Dict[str, Callable[[Any], None]] = {
+    "bullet_storm": fire_volley,
+}
+
+
+def init_display() -> pygame.Surface:
+    """Opens an off-screen display so rendering is measured too."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    return pygame.display.set_mode(SCREEN_SIZE)
+
+
+def run_scenario(
+    name: str,
+    screen: pygame.Surface,
+    frames: int,
+    warmup: int,
+    seed: int,
+    array_projectiles: bool = False,
+    array_enemies: bool = False,
+) -> Dict[str, Any]:
+    from level import Level
+    from menu import Menu
+    from tile import Tile
+    from parallax import ParallaxCompositor
+    from utils import generate_map
+
+    setup, is_menu = SCENARIOS[name]
+    frame_hook = FRAME_HOOKS.get(name)
+
+    random.seed(seed)
+    game_clock.use_frame_clock()
+    background = ParallaxCompositor.load(screen.get_size())
+
+    build_start = time.perf_counter()
+    level = Level(
+        generate_map(),
+        screen,
+        array_projectiles=array_projectiles,
+        array_enemies=array_enemies,
+    )
+    if level.darkness is not None:
+        level.darkness.prepare(background.surfaces)
+    build_ms = (time.perf_counter() - build_start) * 1000
+    # what pressing R or PLAY after death costs
+    restart_start = time.perf_counter()
+    level.setup_level(level.level_data)
+    restart_ms = (time.perf_counter() - restart_start) * 1000
+    menu = Menu(screen, os.path.join("assets", "font.ttf")) if is_menu else None
+    setup(level)
+
+    profiler = level.profiler
+    profiler.enabled = True
+    for i in range(warmup + frames):
+        if i == warmup:
+            profiler.reset()
+        profiler.begin_frame()
+        pygame.event.pump()
+        game_clock.tick()
+        if frame_hook:
+            frame_hook(level)
+
+        camera = level.visible_sprites.offset
+        background.draw(screen, camera.x, camera.y, profiler, level.darkness)
+
+        level.run(is_menu=is_menu)
+        if menu:
+            with profiler.phase("menu"):
+                menu.draw()
+        profiler.end_frame()
+
+    return {
+        "frames": frames,
+        "level_build_ms": build_ms,
+        "level_restart_ms": restart_ms,
+        "enemies": len(level.enemies),
+        "bullets": level.bullet_count(),
+        "pools": level.pool_stats(),
+        "tile_cache": Tile.cache_stats(),
+        "background": background.stats(),
+        "darkness": level.darkness.stats(),
+        "text_cache": level.text_cache.stats(),
+        "phases": profiler.summary(),
+    }
+
+
+def print_report(name: str, result: Dict[str, Any]) -> None:
+    print(f"\n{name} ({result['frames']} frames, {result['enemies']} enemies)")
+    print(
+        f"  level build {result['level_build_ms']:.1f} ms,"
+        f" restart {result['level_restart_ms']:.1f} ms"
+    )
+    print(f"  {'phase':<20}{'p50':>9}{'p95':>9}{'p99':>9}")
+    for phase, stats in result["phases"].items():
+        print(
+            f"  {phase:<20}{stats['p50']:>9.3f}{stats['p95']:>9.3f}{stats['p99']:>9.3f}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run benchmark scenarios.")
+    parser.add_argument("scenarios", nargs="*", help=f"any of {list(SCENARIOS)}")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--warmup", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="benchmark.json")
+    parser.add_argument(
+        "--array-projectiles",
+        action="store_true",
+        help="use the NumPy projectile engine instead of Bullet sprites",
+    )
+    parser.add_argument(
+        "--array-enemies",
+        action="store_true",
+        help="update enemies in a NumPy EnemyStore instead of per sprite",
+    )
+    args = parser.parse_args(argv)
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    screen = init_display()
+    results = {}
+    for name in names:
+        results[name] = run_scenario(
+            name,
+            screen,
+            args.frames,
+            args.warmup,
+            args.seed,
+            args.array_projectiles,
+            args.array_enemies,
+        )
+        print_report(name, results[name])
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "screen": list(SCREEN_SIZE),
+            "frames": args.frames,
+            "seed": args.seed,
+            "array_projectiles": args.array_projectiles,
+            "array_enemies": args.array_enemies,
+        },
+        "scenarios": results,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nresults written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
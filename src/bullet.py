@@ -1,12 +1,30 @@
 # @generated "partially" Gemini: Added docstrings and type annotations
+import os
+from typing import Any, Dict, Optional, Tuple
+
 import pygame
 
+from collision_world import CollisionWorld
+from game_clock import get_ticks
+from utils import has_display, load_image
+
+# projectile images shared by the player and all towers
+PROJECTILE_IMAGES: Tuple[str, ...] = ("bullet.png", "arrow.png")
+
 
 class Bullet(pygame.sprite.Sprite):
     """
     Represents a projectile fired by the player or towers.
     """
 
+    # (file name, converted to the display format) -> source image, shared by
+    # every shooter
+    _SOURCE_CACHE: Dict[Tuple[str, bool], pygame.Surface] = {}
+    # (source image, direction sign) -> scaled and oriented bullet image
+    _SPRITE_CACHE: Dict[Tuple[pygame.Surface, int], pygame.Surface] = {}
+
+    life_time = 1500
+
     def __init__(
         self,
         x: int,
@@ -27,15 +45,25 @@ class Bullet(pygame.sprite.Sprite):
         """
         super().__init__()
         self.z = 2
+        # set by SpritePool, which gets the bullet back from kill()
+        self.pool: Optional[Any] = None
+        # kept for the bullet's whole life, reset() only moves and resizes it
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y, direction, surf, damage, gravity)
 
-        scale_factor = 4
-        w, h = surf.get_size()
-        self.image = pygame.transform.scale(surf, (w * scale_factor, h * scale_factor))
-
-        if direction < 0:
-            self.image = pygame.transform.flip(self.image, True, False)
-
-        self.rect = self.image.get_rect(center=(x, y))
+    def reset(
+        self,
+        x: int,
+        y: int,
+        direction: int,
+        surf: pygame.Surface,
+        damage: int = 10,
+        gravity: float = 0,
+    ) -> None:
+        """(Re)initializes the bullet; takes the same arguments as __init__."""
+        self.image = Bullet.get_sprite(surf, direction)
+        self.rect.size = self.image.get_size()
+        self.rect.center = (x, y)
         self.direction = direction
         self.speed = 12
         self.damage = damage
@@ -45,10 +73,44 @@ class Bullet(pygame.sprite.Sprite):
         if self.gravity > 0:
             self.vy = -6  # Initial upward velocity for arced shots
 
-        self.spawn_time = pygame.time.get_ticks()
-        self.life_time = 1500
+        self.spawn_time = get_ticks()
 
-    def update(self, tiles: pygame.sprite.Group) -> None:
+    def kill(self) -> None:
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
+    @classmethod
+    def load_source(cls, filename: str) -> pygame.Surface:
+        """Returns the source image of a projectile, loading it once."""
+        key = (filename, has_display())
+        if key not in cls._SOURCE_CACHE:
+            cls._SOURCE_CACHE[key] = load_image(os.path.join("assets", filename))
+        return cls._SOURCE_CACHE[key]
+
+    @classmethod
+    def get_sprite(cls, surf: pygame.Surface, direction: int) -> pygame.Surface:
+        """Returns the 4x scaled image for a source, flipped for leftward shots."""
+        key = (surf, -1 if direction < 0 else 1)
+        image = cls._SPRITE_CACHE.get(key)
+        if image is None:
+            scale_factor = 4
+            w, h = surf.get_size()
+            image = pygame.transform.scale(surf, (w * scale_factor, h * scale_factor))
+            if direction < 0:
+                image = pygame.transform.flip(image, True, False)
+            cls._SPRITE_CACHE[key] = image
+        return image
+
+    @classmethod
+    def preload(cls) -> None:
+        """Builds both orientations of every projectile image up front."""
+        for filename in PROJECTILE_IMAGES:
+            surf = cls.load_source(filename)
+            cls.get_sprite(surf, 1)
+            cls.get_sprite(surf, -1)
+
+    def update(self, world: CollisionWorld) -> None:
         """
         Moves the bullet and checks for collisions with walls.
         """
@@ -58,13 +120,11 @@ class Bullet(pygame.sprite.Sprite):
             self.vy += self.gravity
             self.rect.y += self.vy
 
-        for tile in tiles:
-            # Only collide with solid tiles
-            if getattr(tile, "is_solid", True):
-                if tile.rect.colliderect(self.rect):
-                    self.kill()
+        if world.collides(self.rect):
+            self.kill()
+            return
 
-        if pygame.time.get_ticks() - self.spawn_time > self.life_time:
+        if get_ticks() - self.spawn_time > self.life_time:
             self.kill()
 
         if self.rect.y > 2000:
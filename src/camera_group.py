@@ -1,17 +1,28 @@
 # @generated "partially" Gemini: Added docstrings and type annotations
-from typing import Dict, List, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import pygame
 
+from settings import TERRAIN_CHUNK_COLS, TILE_SIZE
+from terrain_chunks import TerrainChunks
+from tile import Tile
+from tower import Tower
+
+# sprite -> (add order, has health bars, hidden in menu, sprite)
+Entry = Tuple[int, bool, bool, pygame.sprite.Sprite]
+Bucket = Dict[pygame.sprite.Sprite, Entry]
+
 
 class CameraGroup(pygame.sprite.Group):
     """
     A custom sprite group that handles camera movement and layered rendering.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, surface: Optional[pygame.Surface] = None) -> None:
         super().__init__()
-        self.display_surface = pygame.display.get_surface()
+        if surface is None:
+            surface = pygame.display.get_surface()
+        self.display_surface = surface
         self.screen_w = self.display_surface.get_width()
         self.screen_h = self.display_surface.get_height()
 
@@ -20,15 +31,107 @@ class CameraGroup(pygame.sprite.Group):
         self.half_h = self.screen_h // 2
         self.camera_speed = 0.07
 
-    def custom_draw(
+        # tiles never move, so they are baked into chunks instead of being
+        # drawn one by one; everything else stays on the per-sprite path
+        self.terrain = TerrainChunks(TERRAIN_CHUNK_COLS * TILE_SIZE)
+
+        # Layered rendering: 0=Background, 1=Middle, 2=Player/Items, 3=Foreground
+        # Each layer is a spatial grid bucketed by the tile column of the
+        # sprite's left edge, so drawing only visits the columns on screen.
+        # Membership is kept up to date on add/remove, so drawing needs no
+        # type checks. Within a layer, sprites are drawn in the order they
+        # were added, whatever cell they are in.
+        self.cell_size = TILE_SIZE
+        self.grid: Dict[int, Dict[int, Bucket]] = {
+            0: {},
+            1: {},
+            2: {},
+            3: {},
+        }
+        self.sprite_cells: Dict[pygame.sprite.Sprite, Tuple[int, int]] = {}
+        self.add_count = 0
+        # widest sprite seen per layer, so sprites starting left of the screen
+        # but reaching into it are still visited
+        self.max_width: Dict[int, int] = {z: 0 for z in self.grid}
+        # towers never move; everything else is re-bucketed when it crosses
+        # a cell boundary (sprite -> column it is bucketed in)
+        self.moving_sprites: Dict[pygame.sprite.Sprite, int] = {}
+        # projectiles kept outside the group (ProjectileArrays), drawn with
+        # the bullet layer
+        self.projectiles: Optional[Any] = None
+        # night tinting (DarknessRenderer), applied to everything drawn here
+        self.darkness: Optional[Any] = None
+
+    def add_internal(self, sprite: pygame.sprite.Sprite, layer=None) -> None:
+        super().add_internal(sprite, layer)
+        if isinstance(sprite, Tile):
+            self.terrain.add(sprite)
+            return
+
+        # the layer is read once: z must not change while the sprite is in
+        # the group (re-add it to move it to another layer)
+        z = getattr(sprite, "z", 1)
+        has_bars = hasattr(sprite, "draw_bars")
+        # the player (and its bars) is hidden in the menu
+        hide_in_menu = hasattr(sprite, "max_stamina")
+
+        col = sprite.rect.x // self.cell_size
+        entry = (self.add_count, has_bars, hide_in_menu, sprite)
+        self.add_count += 1
+        self.grid[z].setdefault(col, {})[sprite] = entry
+        self.sprite_cells[sprite] = (z, col)
+        self.max_width[z] = max(self.max_width[z], sprite.rect.width)
+        if not isinstance(sprite, Tower):
+            self.moving_sprites[sprite] = col
+
+    def remove_internal(self, sprite: pygame.sprite.Sprite) -> None:
+        super().remove_internal(sprite)
+        if isinstance(sprite, Tile):
+            self.terrain.remove(sprite)
+            return
+
+        z, col = self.sprite_cells.pop(sprite)
+        cells = self.grid[z]
+        del cells[col][sprite]
+        if not cells[col]:
+            del cells[col]
+        self.moving_sprites.pop(sprite, None)
+
+    def refresh_cells(self) -> None:
+        """Moves sprites that crossed a cell boundary into their new bucket."""
+        cell_size = self.cell_size
+        moving = self.moving_sprites
+        # one comparison per sprite; only the few that changed column are
+        # touched further
+        moved = [
+            sprite
+            for sprite, col in moving.items()
+            if sprite.rect.x // cell_size != col
+        ]
+        for sprite in moved:
+            rect = sprite.rect
+            z, col = self.sprite_cells[sprite]
+            new_col = rect.x // cell_size
+
+            cells = self.grid[z]
+            entry = cells[col].pop(sprite)
+            if not cells[col]:
+                del cells[col]
+            cells.setdefault(new_col, {})[sprite] = entry
+            self.sprite_cells[sprite] = (z, new_col)
+            moving[sprite] = new_col
+            if rect.width > self.max_width[z]:
+                self.max_width[z] = rect.width
+
+    def update_camera(
         self, player: pygame.sprite.Sprite, show_player: bool = True
     ) -> None:
         """
-        Draws all sprites in the group with an offset based on the player's position.
+        Moves the camera offset towards the player (or the menu position).
 
         Args:
             player: The player sprite to follow.
-            show_player: If False, the player and UI bars are hidden (used in menu).
+            show_player: If False, the camera goes to the default menu position.
         """
         if player and show_player:
             target_x = player.rect.centerx - self.half_w
@@ -41,35 +144,60 @@ class CameraGroup(pygame.sprite.Group):
         self.offset.x += (target_x - self.offset.x) * self.camera_speed
         self.offset.y += (target_y - self.offset.y) * self.camera_speed
 
-        # Layered rendering: 0=Background, 1=Middle, 2=Player/Items, 3=Foreground
-        layers: Dict[int, List[Tuple[pygame.sprite.Sprite, Tuple[float, float]]]] = {
-            0: [],
-            1: [],
-            2: [],
-            3: [],
-        }
+    def custom_draw(
+        self, player: pygame.sprite.Sprite, show_player: bool = True
+    ) -> None:
+        """
+        Draws all sprites in the group with an offset based on the player's position.
+
+        Args:
+            player: The player sprite to follow.
+            show_player: If False, the player and UI bars are hidden (used in menu).
+        """
+        self.update_camera(player, show_player)
+
+        surface = self.display_surface
+        offset_x = self.offset.x
+        offset_y = self.offset.y
+        screen_w = self.screen_w
+        screen_h = self.screen_h
+
+        darkness = self.darkness
+        tint = darkness.tint if darkness is not None and darkness.active else None
+
+        self.terrain.draw(surface, self.offset, tint)
+        self.refresh_cells()
+
+        # one extra column of slack for sprites whose frames grew since added
+        last_col = int((offset_x + screen_w) // self.cell_size)
+        for z, cells in self.grid.items():
+            first_col = int((offset_x - self.max_width[z]) // self.cell_size) - 1
+            entries = []
+            for col in range(first_col, last_col + 1):
+                cell = cells.get(col)
+                if cell:
+                    entries.extend(cell.values())
+            # back into add order, which the cells do not keep
+            entries.sort()
+
+            for _, has_bars, hide_in_menu, sprite in entries:
+                if hide_in_menu and not show_player:
+                    continue
+
+                rect = sprite.rect
+                offset_pos_x = rect.x - offset_x
+                offset_pos_y = rect.y - offset_y
 
-        for sprite in self.sprites():
-            if not show_player and isinstance(sprite, pygame.sprite.GroupSingle):
-                continue
-            if not show_player and hasattr(sprite, "max_stamina"):
-                continue
-
-            offset_pos_x = sprite.rect.x - self.offset.x
-            offset_pos_y = sprite.rect.y - self.offset.y
-
-            # Frustum culling (only draw what is on screen)
-            if (
-                -sprite.rect.width < offset_pos_x < self.screen_w
-                and -sprite.rect.height < offset_pos_y < self.screen_h
-            ):
-                if hasattr(sprite, "z"):
-                    layers[sprite.z].append((sprite, (offset_pos_x, offset_pos_y)))
-                else:
-                    layers[1].append((sprite, (offset_pos_x, offset_pos_y)))
-
-        for z in range(4):
-            for sprite, pos in layers[z]:
-                self.display_surface.blit(sprite.image, pos)
-                if show_player and hasattr(sprite, "draw_bars"):
-                    sprite.draw_bars(self.display_surface, self.offset.x, self.offset.y)
+                # Frustum culling (only draw what is on screen)
+                if (
+                    -rect.width < offset_pos_x < screen_w
+                    and -rect.height < offset_pos_y < screen_h
+                ):
+                    image = sprite.image if tint is None else tint(sprite.image)
+                    surface.blit(image, (offset_pos_x, offset_pos_y))
+                    if has_bars and show_player:
+                        bars = sprite.draw_bars(surface, offset_x, offset_y)
+                        if tint is not None:
+                            darkness.shade_rects(surface, bars)
+            if z == 2 and self.projectiles is not None:
+                self.projectiles.draw(surface, offset_x, offset_y, tint)
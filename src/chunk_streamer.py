@@ -0,0 +1,72 @@
+import math
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+import pygame
+
+from settings import STREAM_KEEP_CHUNKS, STREAM_MARGIN_CHUNKS
+
+
+class ChunkStreamer:
+    """
+    Keeps the sprites of fixed-width map column chunks alive only near the view.
+
+    update() is given the world x spans that must be visible (camera, player)
+    and loads every chunk within `margin` chunks of them through the load
+    callback. Chunks are evicted, killing their sprites, once they are more
+    than `keep` chunks away, so a camera moving back and forth near a chunk
+    boundary does not reload it every frame.
+    """
+
+    def __init__(
+        self,
+        chunk_width: int,
+        load: Callable[[int], List[pygame.sprite.Sprite]],
+        margin: int = STREAM_MARGIN_CHUNKS,
+        keep: int = STREAM_KEEP_CHUNKS,
+    ) -> None:
+        self.chunk_width = chunk_width
+        self.load = load
+        self.margin = margin
+        self.keep = max(keep, margin)
+        self.num_chunks = 0
+        # chunk index -> sprites created for it
+        self.loaded: Dict[int, List[pygame.sprite.Sprite]] = {}
+
+        self.loads = 0
+        self.evictions = 0
+
+    def reset(self, num_chunks: int) -> None:
+        """Forgets every chunk (their sprites were removed with the groups)."""
+        self.num_chunks = num_chunks
+        self.loaded.clear()
+
+    def chunks_near(
+        self, spans: Iterable[Tuple[float, float]], margin: int
+    ) -> Set[int]:
+        width = self.chunk_width
+        near: Set[int] = set()
+        for left, right in spans:
+            first = max(math.floor(left / width) - margin, 0)
+            last = min(math.floor(right / width) + margin, self.num_chunks - 1)
+            near.update(range(first, last + 1))
+        return near
+
+    def update(self, spans: Iterable[Tuple[float, float]]) -> None:
+        spans = list(spans)
+        for index in sorted(self.chunks_near(spans, self.margin) - self.loaded.keys()):
+            self.loaded[index] = self.load(index)
+            self.loads += 1
+
+        keep = self.chunks_near(spans, self.keep)
+        for index in [index for index in self.loaded if index not in keep]:
+            for sprite in self.loaded.pop(index):
+                sprite.kill()
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "loaded": len(self.loaded),
+            "sprites": sum(len(sprites) for sprites in self.loaded.values()),
+            "loads": self.loads,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,182 @@
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from settings import TILE_SIZE
+
+
+class CollisionWorld:
+    """
+    Solid tiles of the level as a grid of TILE_SIZE cells, one byte per cell.
+
+    Every cell a solid tile overlaps is marked solid; non-solid tiles (the
+    oversized destroyed-tower tiles) leave no trace, however large they are.
+    Map tiles sit exactly on the grid, so a cell and its tile have the same
+    rect and collision answers match testing the tile sprites. Cells outside
+    the grid are empty.
+
+    Player, Enemy and Bullet query rects one at a time; EnemyStore and
+    ProjectileArrays use the vectorized box_cells() on the same bytes.
+    """
+
+    def __init__(self, cell_size: int = TILE_SIZE) -> None:
+        self.cell_size = cell_size
+        self.col0 = 0
+        self.row0 = 0
+        self.cols = 0
+        self.rows = 0
+        # row-major solidity, cell (col, row) at (row - row0) * cols + col - col0
+        self.cells = bytearray()
+
+    def build(self, tiles: Iterable[pygame.sprite.Sprite]) -> None:
+        """Rasterizes the solid tiles (replaces the previous layout)."""
+        size = self.cell_size
+        marked: List[Tuple[int, int]] = []
+        for tile in tiles:
+            if not getattr(tile, "is_solid", True):
+                continue
+            rect = tile.rect
+            left, right, top, bottom = self.cell_span(rect)
+            for col in range(left, right + 1):
+                for row in range(top, bottom + 1):
+                    marked.append((col, row))
+
+        if not marked:
+            self.col0 = self.row0 = self.cols = self.rows = 0
+            self.cells = bytearray()
+            return
+        cols = [col for col, _ in marked]
+        rows = [row for _, row in marked]
+        self.col0, self.row0 = min(cols), min(rows)
+        self.cols = max(cols) - self.col0 + 1
+        self.rows = max(rows) - self.row0 + 1
+        self.cells = bytearray(self.cols * self.rows)
+        for col, row in marked:
+            self.cells[(row - self.row0) * self.cols + col - self.col0] = 1
+
+    def build_grid(self, solid: np.ndarray) -> None:
+        """Replaces the layout with a (rows, cols) bool grid of cells from (0, 0)."""
+        self.col0 = self.row0 = 0
+        self.rows, self.cols = solid.shape
+        self.cells = bytearray(np.ascontiguousarray(solid, np.bool_).tobytes())
+
+    def cell_span(self, rect: pygame.Rect) -> Tuple[int, int, int, int]:
+        """First and last column and row a rect overlaps (edges are exclusive)."""
+        size = self.cell_size
+        return (
+            int(rect.left // size),
+            int(-(-rect.right // size)) - 1,
+            int(rect.top // size),
+            int(-(-rect.bottom // size)) - 1,
+        )
+
+    def is_solid(self, col: int, row: int) -> bool:
+        c = col - self.col0
+        r = row - self.row0
+        if 0 <= c < self.cols and 0 <= r < self.rows:
+            return self.cells[r * self.cols + c] == 1
+        return False
+
+    def grid_span(self, rect: pygame.Rect) -> Tuple[int, int, int, int]:
+        """cell_span() in grid coordinates, clamped to the grid (may be empty)."""
+        size = self.cell_size
+        left = int(rect.left // size) - self.col0
+        right = int(-(-rect.right // size)) - 1 - self.col0
+        top = int(rect.top // size) - self.row0
+        bottom = int(-(-rect.bottom // size)) - 1 - self.row0
+        if left < 0:
+            left = 0
+        if right >= self.cols:
+            right = self.cols - 1
+        if top < 0:
+            top = 0
+        if bottom >= self.rows:
+            bottom = self.rows - 1
+        return left, right, top, bottom
+
+    def solid_cells(self, rect: pygame.Rect) -> List[Tuple[int, int]]:
+        """Returns (col, row) of every solid cell overlapping rect, row by row."""
+        left, right, top, bottom = self.grid_span(rect)
+        found: List[Tuple[int, int]] = []
+        if left > right:
+            return found
+        cells, cols = self.cells, self.cols
+        for r in range(top, bottom + 1):
+            start = r * cols + left
+            # one C-level scan per row; most rows under an entity are empty
+            span = cells[start : start + right - left + 1]
+            if 1 in span:
+                row = r + self.row0
+                for i, solid in enumerate(span):
+                    if solid:
+                        found.append((left + i + self.col0, row))
+        return found
+
+    def collides(self, rect: pygame.Rect) -> bool:
+        left, right, top, bottom = self.grid_span(rect)
+        if left > right:
+            return False
+        cells, cols = self.cells, self.cols
+        for r in range(top, bottom + 1):
+            start = r * cols + left
+            if 1 in cells[start : start + right - left + 1]:
+                return True
+        return False
+
+    def ground_below(
+        self, x: float, y: float, max_depth: Optional[float] = None
+    ) -> Optional[int]:
+        """
+        Returns the top edge of the first solid cell in the column of x whose
+        bottom is below y, or None if there is none (within max_depth of y).
+        """
+        size = self.cell_size
+        col = int(x // size) - self.col0
+        if not 0 <= col < self.cols:
+            return None
+        last = self.rows - 1
+        if max_depth is not None:
+            last = min(last, int(-(-(y + max_depth) // size)) - 1 - self.row0)
+        cells, cols = self.cells, self.cols
+        for r in range(max(int(y // size) - self.row0, 0), last + 1):
+            if cells[r * cols + col]:
+                return (r + self.row0) * size
+        return None
+
+    def array(self) -> np.ndarray:
+        """The cells as a (rows, cols) bool array sharing this world's memory."""
+        if not self.cells:
+            return np.zeros((1, 1), np.bool_)
+        return np.frombuffer(self.cells, np.bool_).reshape(self.rows, self.cols)
+
+    def box_cells(
+        self, x: np.ndarray, y: np.ndarray, w: np.ndarray, h: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized solid_cells() for many boxes at once.
+
+        Returns:
+            First column and row of each box, and a (boxes, rows, cols) mask
+            of which of the cells it overlaps are solid.
+        """
+        size = self.cell_size
+        c0 = (x // size).astype(np.int64)
+        c1 = (-(-(x + w) // size)).astype(np.int64) - 1
+        r0 = (y // size).astype(np.int64)
+        r1 = (-(-(y + h) // size)).astype(np.int64) - 1
+
+        cols = c0[:, None] + np.arange(int((c1 - c0).max()) + 1)
+        rows = r0[:, None] + np.arange(int((r1 - r0).max()) + 1)
+        grid = self.array()
+        grid_rows, grid_cols = grid.shape
+        gc = cols - self.col0
+        gr = rows - self.row0
+        valid_c = (cols <= c1[:, None]) & (gc >= 0) & (gc < grid_cols)
+        valid_r = (rows <= r1[:, None]) & (gr >= 0) & (gr < grid_rows)
+        gc = np.clip(gc, 0, grid_cols - 1)
+        gr = np.clip(gr, 0, grid_rows - 1)
+
+        solid = grid[gr[:, :, None], gc[:, None, :]]
+        solid &= valid_r[:, :, None] & valid_c[:, None, :]
+        return c0, r0, solid
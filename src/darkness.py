@@ -0,0 +1,231 @@
+import weakref
+from typing import Dict, Iterable, List, Tuple
+
+import pygame
+
+from settings import (
+    DARKNESS_COLOR,
+    DARKNESS_HOLD_FRAMES,
+    DARKNESS_TINT_PIXELS,
+    MAX_DARKNESS,
+)
+
+Color = Tuple[int, int, int]
+
+# side of the square factor surfaces, blitted as tiles over larger images
+FACTOR_TILE = 512
+
+
+def tint_factors(color: Color, alpha: int) -> Tuple[Color, Color]:
+    """
+    Per channel (multiplier, offset) for a BLEND_RGB_MULT blit followed by a
+    BLEND_RGB_ADD blit, picked so that ((x * mul + 255) >> 8) + add stays
+    within 1 of x + ((c - x) * alpha >> 8), the result of blitting the
+    opaque color over x with set_alpha(alpha).
+    """
+
+    def error(c: int, mul: int, add: int) -> int:
+        return max(
+            abs(((x * mul + 255) >> 8) + add - (x + ((c - x) * alpha >> 8)))
+            for x in range(256)
+        )
+
+    if alpha >= 255:
+        return (0, 0, 0), color  # opaque blits copy the color
+    muls: List[int] = []
+    adds: List[int] = []
+    for c in color:
+        base_add = c * alpha >> 8
+        candidates = [
+            (mul, add)
+            for mul in range(max(254 - alpha, 0), min(259 - alpha, 256))
+            for add in range(max(base_add - 2, 0), min(base_add + 3, 256))
+        ]
+        mul, add = min(candidates, key=lambda f: error(c, *f))
+        muls.append(mul)
+        adds.append(add)
+    return (muls[0], muls[1], muls[2]), (adds[0], adds[1], adds[2])
+
+
+class DarknessRenderer:
+    """
+    Darkens the world for the day/night cycle.
+
+    While the darkness changes (dusk, dawn) the overlay color is alpha
+    blended over the whole screen after the world is drawn. Once it has held
+    still at night_level for DARKNESS_HOLD_FRAMES (night), `level` is set and
+    the world is drawn from tinted copies of its surfaces instead (terrain
+    chunks, background strips, sprite images), so a night frame costs the
+    same blits as a day frame.
+
+    Copies are only made for night_level, so they are kept from one night to
+    the next until their source surface goes away. Surfaces known at load
+    (the background strips) are tinted right away by prepare(); the others
+    drawn in the dark before night starts are queued and tinted ahead, about
+    DARKNESS_TINT_PIXELS per frame, and night waits for that queue to empty.
+    Surfaces first drawn at night (a chunk baked after dark, a new sprite
+    frame) are tinted when they show up, which the blit-based tint keeps to a
+    few milliseconds even for a whole chunk.
+    """
+
+    def __init__(
+        self,
+        size: Tuple[int, int],
+        color: Color = DARKNESS_COLOR,
+        night_level: int = MAX_DARKNESS,
+        hold_frames: int = DARKNESS_HOLD_FRAMES,
+        tint_pixels: int = DARKNESS_TINT_PIXELS,
+    ) -> None:
+        self.color = color
+        self.night_level = night_level
+        self.hold_frames = hold_frames
+        self.tint_pixels = tint_pixels
+        self.overlay = pygame.Surface(size)
+        self.overlay.fill(color)
+
+        mul, add = tint_factors(color, night_level)
+        self.mul_tile = pygame.Surface((FACTOR_TILE, FACTOR_TILE))
+        self.mul_tile.fill(mul)
+        self.add_tile = pygame.Surface((FACTOR_TILE, FACTOR_TILE))
+        self.add_tile.fill(add)
+        # colorkey of tinted copies: the tint squeezes every channel into
+        # [add, mul + add], so a channel outside of it never matches a pixel
+        self.key = tuple(255 if m + a < 255 else 0 for m, a in zip(mul, add))
+
+        self.darkness = 0
+        self.held = 0  # frames the darkness has not changed
+        # night_level while the world is drawn tinted, 0 while the overlay is
+        self.level = 0
+        # source surface -> tinted copy at night_level
+        self.tinted: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        # surfaces drawn in the dark that have no tinted copy yet
+        self.pending: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+        self.overlay_frames = 0
+        self.tinted_frames = 0
+        self.tinted_ahead = 0
+        self.tinted_late = 0
+
+    @property
+    def active(self) -> bool:
+        """Whether it is dark at all, i.e. whether surfaces go through tint()."""
+        return self.darkness > 0 or self.level > 0
+
+    def tinted_copy(self, image: pygame.Surface) -> pygame.Surface:
+        """Copy of an image with its color pixels tinted to the night level."""
+        tinted = image.copy()
+        key = image.get_colorkey()
+        if key is not None:
+            # the pixels hidden by the colorkey, to give them the new key
+            hidden = pygame.mask.from_surface(image)
+            hidden.invert()
+
+        width, height = image.get_size()
+        spots = [
+            (x, y)
+            for y in range(0, height, FACTOR_TILE)
+            for x in range(0, width, FACTOR_TILE)
+        ]
+        for spot in spots:
+            tinted.blit(self.mul_tile, spot, special_flags=pygame.BLEND_RGB_MULT)
+        for spot in spots:
+            tinted.blit(self.add_tile, spot, special_flags=pygame.BLEND_RGB_ADD)
+
+        # RLEACCELOK is what get_flags() reports once set_alpha/set_colorkey
+        # asked for RLE
+        rle = 0
+        if image.get_flags() & (pygame.RLEACCEL | pygame.RLEACCELOK):
+            rle = pygame.RLEACCEL
+        if key is not None:
+            hidden.to_surface(tinted, setcolor=self.key, unsetcolor=None)
+            tinted.set_colorkey(self.key, rle)
+        elif rle:
+            tinted.set_alpha(image.get_alpha(), rle)
+        return tinted
+
+    def queue(self, images: Iterable[pygame.Surface]) -> None:
+        """Has images without a tinted copy tinted ahead of the night."""
+        for image in images:
+            if image not in self.tinted:
+                self.pending[image] = None
+
+    def prepare(self, images: Iterable[pygame.Surface]) -> None:
+        """Tints images right away, for surfaces known at load (background)."""
+        for image in images:
+            if image not in self.tinted:
+                self.tinted[image] = self.tinted_copy(image)
+            self.pending.pop(image, None)
+
+    def tint(self, image: pygame.Surface) -> pygame.Surface:
+        """The image to draw (itself while not tinting, queued in the dark)."""
+        if not self.level:
+            if image not in self.tinted:
+                self.pending[image] = None
+            return image
+        tinted = self.tinted.get(image)
+        if tinted is None:
+            tinted = self.tinted[image] = self.tinted_copy(image)
+            self.tinted_late += 1
+        return tinted
+
+    def tint_ahead(self) -> None:
+        """Tints queued images until about tint_pixels have been done."""
+        budget = self.tint_pixels
+        while self.pending and budget > 0:
+            image, _ = self.pending.popitem()
+            if image in self.tinted:
+                continue
+            self.tinted[image] = self.tinted_copy(image)
+            self.tinted_ahead += 1
+            width, height = image.get_size()
+            budget -= width * height
+
+    def shade_rects(
+        self, surface: pygame.Surface, rects: Iterable[pygame.Rect]
+    ) -> None:
+        """Darkens shapes drawn directly onto a tinted frame (health bars)."""
+        if not self.level:
+            return
+        self.overlay.set_alpha(self.level)
+        for rect in rects:
+            surface.blit(self.overlay, rect.topleft, (0, 0, rect.width, rect.height))
+
+    def draw(self, surface: pygame.Surface, darkness: int) -> None:
+        """
+        Darkens the frame just drawn, then picks how the next one is drawn.
+
+        Frames drawn tinted are already dark; otherwise the overlay is
+        blended over the whole surface.
+        """
+        if self.level:
+            self.tinted_frames += 1
+        elif darkness > 0:
+            self.overlay.set_alpha(darkness)
+            surface.blit(self.overlay, (0, 0))
+            self.overlay_frames += 1
+
+        if darkness == self.darkness:
+            self.held += 1
+        else:
+            self.darkness = darkness
+            self.held = 0
+
+        if not self.level and self.pending:
+            self.tint_ahead()
+        night = (
+            darkness == self.night_level
+            and self.held >= self.hold_frames
+            and not self.pending
+        )
+        self.level = self.night_level if night else 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "level": self.level,
+            "tinted_images": len(self.tinted),
+            "pending": len(self.pending),
+            "overlay_frames": self.overlay_frames,
+            "tinted_frames": self.tinted_frames,
+            "tinted_ahead": self.tinted_ahead,
+            "tinted_late": self.tinted_late,
+        }
@@ -0,0 +1,106 @@
+from typing import Dict, List
+
+import pygame
+
+from profiler import FrameProfiler
+
+
+class DebugOverlay:
+    """
+    Frame profiler overlay (toggled with F3): a rolling frame-time graph,
+    per-phase timings of the last frame and live sprite counts.
+    """
+
+    def __init__(self, surface: pygame.Surface, font_path: str) -> None:
+        self.display_surface = surface
+        self.font = pygame.font.Font(font_path, 16)
+        self.visible = False
+
+        self.width = 420
+        self.graph_h = 80
+        # the pixel font has a lot of built-in leading, so rows overlap on purpose
+        self.line_h = 22
+        self.padding = 10
+        # graph scale: full height = 2 frames at 60 FPS
+        self.graph_max_ms = 1000 / 30
+
+    def toggle(self, profiler: FrameProfiler) -> None:
+        """Shows or hides the overlay; the profiler only runs while it is shown."""
+        self.visible = not self.visible
+        profiler.enabled = self.visible
+        if self.visible:
+            # drop frames left over from the last time it was shown
+            profiler.reset()
+
+    def draw_row(
+        self, label: str, value: str, x: int, y: int, color=(230, 230, 230)
+    ) -> None:
+        """Draws a label with its value right-aligned to the panel edge."""
+        self.display_surface.blit(self.font.render(label, True, color), (x, y))
+        value_surf = self.font.render(value, True, color)
+        right = x + self.width - 2 * self.padding
+        self.display_surface.blit(value_surf, value_surf.get_rect(topright=(right, y)))
+
+    def draw_graph(self, frame_times: List[float], x: int, y: int) -> None:
+        """Draws one vertical bar per frame, newest on the right."""
+        w = self.width - 2 * self.padding
+        frame_times = frame_times[-w:]
+        scale = self.graph_h / self.graph_max_ms
+
+        for i, ms in enumerate(frame_times):
+            bar_h = min(self.graph_h, int(ms * scale))
+            if ms > 1000 / 30:
+                color = (220, 60, 60)
+            elif ms > 1000 / 60:
+                color = (230, 200, 40)
+            else:
+                color = (60, 200, 90)
+            bar_x = x + w - len(frame_times) + i
+            pygame.draw.line(
+                self.display_surface,
+                color,
+                (bar_x, y + self.graph_h),
+                (bar_x, y + self.graph_h - bar_h),
+            )
+
+        # 60 FPS budget line
+        budget_y = y + self.graph_h - int(1000 / 60 * scale)
+        pygame.draw.line(
+            self.display_surface, (255, 255, 255), (x, budget_y), (x + w, budget_y)
+        )
+
+    def draw(self, profiler: FrameProfiler, counts: Dict[str, int]) -> None:
+        """Renders the overlay using the last completed frame of the profiler."""
+        if not self.visible or not profiler.frames:
+            return
+
+        phases = profiler.frames[-1]
+        frame_ms = profiler.frame_times[-1]
+        rows = len(phases) + len(counts) + 3
+        height = self.graph_h + rows * self.line_h + 3 * self.padding
+
+        x = self.display_surface.get_width() - self.width - 20
+        y = 20
+        panel = pygame.Surface((self.width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        self.display_surface.blit(panel, (x, y))
+
+        text_x = x + self.padding
+        cursor_y = y + self.padding
+        fps = 1000 / frame_ms if frame_ms else 0
+        self.draw_row("frame", f"{frame_ms:.2f} ms ({fps:.0f} fps)", text_x, cursor_y)
+        cursor_y += self.line_h + 4
+
+        self.draw_graph(list(profiler.frame_times), text_x, cursor_y)
+        cursor_y += self.graph_h + self.padding
+
+        for name, ms in phases.items():
+            share = ms / frame_ms if frame_ms else 0
+            color = (255, 120, 120) if share > 0.25 else (230, 230, 230)
+            self.draw_row(name, f"{ms:.2f} ms", text_x, cursor_y, color)
+            cursor_y += self.line_h
+
+        cursor_y += self.line_h
+        for name, count in counts.items():
+            self.draw_row(name, str(count), text_x, cursor_y, (150, 200, 255))
+            cursor_y += self.line_h
@@ -4,7 +4,9 @@ from typing import Optional, Tuple, Dict, List, Any
 
 import pygame
 
-from settings import TILE_SIZE
+from collision_world import CollisionWorld
+from game_clock import get_ticks
+from utils import has_display, load_image
 
 
 class Enemy(pygame.sprite.Sprite):
@@ -13,7 +15,8 @@ class Enemy(pygame.sprite.Sprite):
     """
 
     # class-level cache to prevent reloading images from disk for every enemy instance
-    _ASSET_CACHE: Dict[str, Dict[str, List[pygame.Surface]]] = {}
+    # (variant, scale, converted to the display format) -> animations
+    _ASSET_CACHE: Dict[Tuple[str, float, bool], Dict[str, List[pygame.Surface]]] = {}
 
     def __init__(
         self,
@@ -27,7 +30,35 @@ class Enemy(pygame.sprite.Sprite):
     ) -> None:
         super().__init__()
         self.z = 1
+        # set by SpritePool, which gets the enemy back from kill()
+        self.pool: Optional[Any] = None
+        self.direction = pygame.math.Vector2()
+        # shared run frames of the variant, from the asset cache
         self.animations: Dict[str, List[pygame.Surface]] = {}
+        # kept for the enemy's whole life, reset() only moves and resizes them
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.hitbox = pygame.Rect(0, 0, 0, 0)
+        self.reset(
+            pos_x,
+            pos_y,
+            enemy_variant,
+            scale_factor,
+            health_mult,
+            damage_mult,
+            facing_right,
+        )
+
+    def reset(
+        self,
+        pos_x: int,
+        pos_y: int,
+        enemy_variant: str = "enemy01",
+        scale_factor: Optional[float] = None,
+        health_mult: float = 1.0,
+        damage_mult: float = 1.0,
+        facing_right: bool = True,
+    ) -> None:
+        """(Re)initializes the enemy; takes the same arguments as __init__."""
         self.import_assets(enemy_variant, scale_factor)
 
         # animation
@@ -37,10 +68,8 @@ class Enemy(pygame.sprite.Sprite):
 
         # movement
         self.facing_right = facing_right
-        if self.facing_right:
-            self.direction = pygame.math.Vector2(1, 0)
-        else:
-            self.direction = pygame.math.Vector2(-1, 0)
+        self.direction.x = 1 if self.facing_right else -1
+        self.direction.y = 0
 
         self.gravity = 0.8
 
@@ -96,20 +125,24 @@ class Enemy(pygame.sprite.Sprite):
 
         self.on_ground = False
 
-        self.rect = self.image.get_rect(midbottom=(pos_x, pos_y))
-        self.hitbox = self.rect.inflate(-20, 0)
+        self.rect.size = self.image.get_size()
+        self.rect.midbottom = (pos_x, pos_y)
+        # the rect narrowed by 20 px, like rect.inflate(-20, 0)
+        self.hitbox.size = (self.rect.width - 20, self.rect.height)
+        self.hitbox.center = self.rect.center
 
-        self.last_update_time = pygame.time.get_ticks()
+        self.last_update_time = get_ticks()
 
     def import_assets(self, variant: str, scale: Optional[float]) -> None:
         """
-        Loads run animation assets for the enemy.
+        Loads run animation assets for the enemy, plus pre-flipped
+        left-facing copies ("run_left").
         Uses caching to avoid disk I/O lags on spawn.
         """
         if not scale:
             scale = 1.0
 
-        cache_key = f"{variant}_{scale}"
+        cache_key = (variant, scale, has_display())
 
         # return cached assets if they exist
         if cache_key in Enemy._ASSET_CACHE:
@@ -117,13 +150,13 @@ class Enemy(pygame.sprite.Sprite):
             return
 
         # If not in cache, load them
-        self.animations = {"run": []}
+        frames = []
         full_path = os.path.join("assets", variant, "run")
         try:
             files = sorted([f for f in os.listdir(full_path) if f.endswith(".png")])
             for file in files:
                 img_path = os.path.join(full_path, file)
-                image = pygame.image.load(img_path).convert_alpha()
+                image = load_image(img_path)
 
                 # force transparent corner fix
                 corner_color = image.get_at((0, 0))
@@ -134,55 +167,51 @@ class Enemy(pygame.sprite.Sprite):
 
                 w, h = image.get_size()
                 image = pygame.transform.scale(image, (int(w * scale), int(h * scale)))
-                self.animations["run"].append(image)
-
-            # save to cache
-            Enemy._ASSET_CACHE[cache_key] = self.animations
+                frames.append(image)
 
         except FileNotFoundError:
             surf = pygame.Surface((32, 32))
             surf.fill("red")
-            self.animations["run"].append(surf)
+            frames = [surf]
+
+        # flip once here instead of every frame in animate()
+        self.animations = {
+            "run": frames,
+            "run_left": [pygame.transform.flip(f, True, False) for f in frames],
+        }
+
+        # save to cache
+        Enemy._ASSET_CACHE[cache_key] = self.animations
 
     def apply_gravity(self) -> None:
         self.direction.y += self.gravity
         self.hitbox.y += self.direction.y
 
-    def get_nearby_tiles(self, tiles_by_col: Dict[int, List[Any]]) -> List[Any]:
-        """Returns a small list of tiles from the columns surrounding the enemy."""
-        col = int(self.hitbox.centerx // TILE_SIZE)
-        nearby_tiles = []
-        # check current column and immediate neighbors (col-1, col, col+1)
-        for c in range(col - 1, col + 2):
-            if c in tiles_by_col:
-                nearby_tiles.extend(tiles_by_col[c])
-        return nearby_tiles
-
     def jump(self) -> None:
         if self.on_ground:
             self.direction.y = self.jump_speed
             self.on_ground = False
 
-    def check_vertical_collisions(self, tiles_by_col: Dict[int, List[Any]]) -> None:
-        """Handles gravity and floor collision using optimized tile lookup."""
+    def check_vertical_collisions(self, world: CollisionWorld) -> None:
+        """Handles gravity and floor collision using the collision grid."""
         self.apply_gravity()
-        nearby_tiles = self.get_nearby_tiles(tiles_by_col)
 
         self.on_ground = False
 
-        for tile in nearby_tiles:
-            if getattr(tile, "is_solid", True):
-                if tile.rect.colliderect(self.hitbox):
-                    if self.direction.y > 0:
-                        self.hitbox.bottom = tile.rect.top
-                        self.direction.y = 0
-                        self.on_ground = True
-                    elif self.direction.y < 0:
-                        self.hitbox.top = tile.rect.bottom
-                        self.direction.y = 0
-
-    def check_ledge(self, tiles_by_col: Dict[int, List[Any]]) -> bool:
-        """Checks if there is ground ahead using optimized tile lookup."""
+        cells = world.solid_cells(self.hitbox)
+        if cells:
+            size = world.cell_size
+            # cells come row by row, so the first is the highest one
+            if self.direction.y > 0:
+                self.hitbox.bottom = cells[0][1] * size
+                self.direction.y = 0
+                self.on_ground = True
+            elif self.direction.y < 0:
+                self.hitbox.top = (cells[-1][1] + 1) * size
+                self.direction.y = 0
+
+    def check_ledge(self, world: CollisionWorld) -> bool:
+        """Checks if there is ground ahead (within 20 px below the feet)."""
         if self.direction.y != 0:
             return True
 
@@ -192,16 +221,7 @@ class Enemy(pygame.sprite.Sprite):
         else:
             look_x = self.hitbox.left - look_ahead_distance
 
-        look_y = self.hitbox.bottom + 10
-        check_rect = pygame.Rect(look_x - 5, look_y - 10, 10, 20)
-
-        nearby_tiles = self.get_nearby_tiles(tiles_by_col)
-
-        for tile in nearby_tiles:
-            if getattr(tile, "is_solid", True):
-                if tile.rect.colliderect(check_rect):
-                    return True
-        return False
+        return world.ground_below(look_x, self.hitbox.bottom, 20) is not None
 
     def get_player_data(self, player: Any) -> Tuple[float, float, float]:
         """Calculates distance and direction vector to the player."""
@@ -243,33 +263,31 @@ class Enemy(pygame.sprite.Sprite):
         if self.is_jumping_type and self.on_ground:
             self.jump()
 
-    def move_and_check_walls(self, tiles_by_col: Dict[int, List[Any]]) -> None:
-        """Handles X-axis movement using optimized tile lookup."""
+    def move_and_check_walls(self, world: CollisionWorld) -> None:
+        """Handles X-axis movement using the collision grid."""
         self.hitbox.x += self.direction.x * self.speed
 
-        nearby_tiles = self.get_nearby_tiles(tiles_by_col)
-
-        for tile in nearby_tiles:
-            if getattr(tile, "is_solid", True):
-                if tile.rect.colliderect(self.hitbox):
-                    if self.direction.x > 0:
-                        self.hitbox.right = tile.rect.left
-                        if self.state == "chase" and self.on_ground:
-                            self.jump()
-                        else:
-                            self.direction.x = -1
-                            self.facing_right = False
-
-                    elif self.direction.x < 0:
-                        self.hitbox.left = tile.rect.right
-                        if self.state == "chase" and self.on_ground:
-                            self.jump()
-                        else:
-                            self.direction.x = 1
-                            self.facing_right = True
+        cells = world.solid_cells(self.hitbox)
+        if cells:
+            size = world.cell_size
+            if self.direction.x > 0:
+                self.hitbox.right = min(col for col, _ in cells) * size
+                if self.state == "chase" and self.on_ground:
+                    self.jump()
+                else:
+                    self.direction.x = -1
+                    self.facing_right = False
+
+            elif self.direction.x < 0:
+                self.hitbox.left = (max(col for col, _ in cells) + 1) * size
+                if self.state == "chase" and self.on_ground:
+                    self.jump()
+                else:
+                    self.direction.x = 1
+                    self.facing_right = True
 
         if self.on_ground:
-            is_safe = self.check_ledge(tiles_by_col)
+            is_safe = self.check_ledge(world)
             if not is_safe:
                 if self.state == "patrol":
                     self.direction.x *= -1
@@ -277,8 +295,8 @@ class Enemy(pygame.sprite.Sprite):
 
     def animate(self) -> None:
         """Updates sprite frame based on animation state."""
-        animation = self.animations["run"]
-        current_time = pygame.time.get_ticks()
+        animation = self.animations["run" if self.facing_right else "run_left"]
+        current_time = get_ticks()
 
         speed_modifier = 0.5 if self.state == "chase" else 1.0
         frame_duration = 100 * speed_modifier
@@ -289,20 +307,16 @@ class Enemy(pygame.sprite.Sprite):
                 self.frame_index = 0
             self.last_update_time = current_time
 
-        current_image = animation[self.frame_index]
-
-        if not self.facing_right:
-            self.image = pygame.transform.flip(current_image, True, False)
-        else:
-            self.image = current_image
+        self.image = animation[self.frame_index]
 
-        self.rect = self.image.get_rect()
+        # reuse the rect instead of allocating one per frame
+        self.rect.size = self.image.get_size()
         self.rect.midbottom = self.hitbox.midbottom
 
     def draw_bars(
         self, surface: pygame.Surface, offset_x: float, offset_y: float
-    ) -> None:
-        """Draws a health bar above the enemy if damaged."""
+    ) -> List[pygame.Rect]:
+        """Draws a health bar above the enemy if damaged, returns its rect."""
         if self.current_health < self.max_health:
             bar_width = 40
             bar_height = 5
@@ -320,6 +334,13 @@ class Enemy(pygame.sprite.Sprite):
             pygame.draw.rect(surface, (30, 0, 40), bg_rect)
             pygame.draw.rect(surface, (138, 43, 226), fill_rect)
             pygame.draw.rect(surface, (0, 0, 0), bg_rect, 1)
+            return [bg_rect]
+        return []
+
+    def kill(self) -> None:
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
 
     def get_damage(self, amount: int) -> bool:
         """Reduces health and returns True if the enemy died."""
@@ -329,9 +350,9 @@ class Enemy(pygame.sprite.Sprite):
             return True
         return False
 
-    def update(self, tiles_by_col: Dict[int, List[Any]], player: Any) -> None:
+    def update(self, world: CollisionWorld, player: Any) -> None:
         """Main update loop."""
         self.behavior(player)
-        self.move_and_check_walls(tiles_by_col)
-        self.check_vertical_collisions(tiles_by_col)
+        self.move_and_check_walls(world)
+        self.check_vertical_collisions(world)
         self.animate()
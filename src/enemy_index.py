@@ -0,0 +1,42 @@
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable, List, Optional, Tuple
+
+
+class EnemyIndex:
+    """
+    Enemies sorted by their center x, rebuilt once per frame so towers can
+    find targets with a binary search instead of scanning the whole group.
+
+    The sort is deferred to the first query after rebuild(), so frames where
+    no tower is ready to fire don't pay for it.
+    """
+
+    def __init__(self) -> None:
+        self.xs: List[float] = []
+        self.enemies: List[Any] = []
+        self.pending: Optional[Iterable[Any]] = None
+
+    def rebuild(self, enemies: Iterable[Any]) -> None:
+        self.pending = enemies
+
+    def sort(self) -> None:
+        # stable sort: enemies on the same x keep the group order
+        self.enemies = sorted(self.pending, key=lambda enemy: enemy.rect.centerx)
+        self.xs = [enemy.rect.centerx for enemy in self.enemies]
+        self.pending = None
+
+    def window(self, x_min: float, x_max: float) -> Tuple[int, int]:
+        """Returns the index range of enemies with x_min <= centerx <= x_max."""
+        if self.pending is not None:
+            self.sort()
+        return bisect_left(self.xs, x_min), bisect_right(self.xs, x_max)
+
+    def nearest(self, x: float, x_min: float, x_max: float) -> Optional[Any]:
+        """Enemy in [x_min, x_max] closest to x, O(log n)."""
+        lo, hi = self.window(x_min, x_max)
+        if lo == hi:
+            return None
+        i = min(max(bisect_left(self.xs, x, lo, hi), lo), hi - 1)
+        if i > lo and x - self.xs[i - 1] <= self.xs[i] - x:
+            i -= 1
+        return self.enemies[i]
@@ -0,0 +1,263 @@
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pygame
+
+from collision_world import CollisionWorld
+from game_clock import get_ticks
+
+# per-enemy columns, one row per enemy in self.enemies order
+FIELDS: Dict[str, Any] = {
+    "x": np.float64,  # hitbox left
+    "y": np.float64,  # hitbox top
+    "w": np.int32,  # hitbox size
+    "h": np.int32,
+    "image_h": np.int32,  # height of the first run frame, for the sight check
+    "dir_x": np.int8,
+    "vy": np.float64,
+    "gravity": np.float64,
+    "speed": np.int32,
+    "walk_speed": np.int32,
+    "chase_speed": np.int32,
+    "jump_speed": np.float64,
+    "sight_range": np.float64,
+    "jumper": np.bool_,
+    "chasing": np.bool_,
+    "facing_right": np.bool_,
+    "on_ground": np.bool_,
+    "frame": np.int32,
+    "frame_count": np.int32,
+    "last_frame_time": np.int64,
+}
+
+
+class EnemyStore:
+    """
+    Enemy movement state in contiguous NumPy columns.
+
+    Runs the same per-frame logic as Enemy.update (behavior, walls, ledges,
+    gravity and animation timing) for all enemies at once against the cells
+    of the CollisionWorld. The Enemy sprites become render views: after each
+    update only their image and rect are written back, for drawing,
+    collisions and tower targeting. Health stays on the sprite, since it is
+    only touched when something hits the enemy.
+    """
+
+    ledge_look_ahead = 20
+
+    def __init__(self, capacity: int = 64) -> None:
+        self.count = 0
+        self.capacity = capacity
+        self.columns: Dict[str, np.ndarray] = {
+            name: np.zeros(capacity, dtype) for name, dtype in FIELDS.items()
+        }
+        self.enemies: List[Any] = []
+        # per row: (right facing frames, left facing frames)
+        self.frames: List[Tuple[List[pygame.Surface], List[pygame.Surface]]] = []
+
+        self.world = CollisionWorld()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        # live view of a column, e.g. store.x
+        columns = self.__dict__.get("columns")
+        if columns is None or name not in columns:
+            raise AttributeError(name)
+        return columns[name][: self.count]
+
+    def empty(self) -> None:
+        self.count = 0
+        self.enemies = []
+        self.frames = []
+
+    def set_world(self, world: CollisionWorld) -> None:
+        self.world = world
+
+    def grow(self) -> None:
+        self.capacity *= 2
+        for name, column in self.columns.items():
+            grown = np.zeros(self.capacity, column.dtype)
+            grown[: self.count] = column[: self.count]
+            self.columns[name] = grown
+
+    def add(self, enemy: Any) -> None:
+        """Copies an enemy's movement state into a new row."""
+        if self.count == self.capacity:
+            self.grow()
+        i = self.count
+        c = self.columns
+        hitbox = enemy.hitbox
+        c["x"][i] = hitbox.x
+        c["y"][i] = hitbox.y
+        c["w"][i] = hitbox.width
+        c["h"][i] = hitbox.height
+        c["image_h"][i] = enemy.rect.height
+        c["dir_x"][i] = 1 if enemy.direction.x > 0 else -1
+        c["vy"][i] = enemy.direction.y
+        c["gravity"][i] = enemy.gravity
+        c["speed"][i] = enemy.speed
+        c["walk_speed"][i] = enemy.walk_speed
+        c["chase_speed"][i] = enemy.chase_speed
+        c["jump_speed"][i] = enemy.jump_speed
+        c["sight_range"][i] = enemy.sight_range
+        c["jumper"][i] = enemy.is_jumping_type
+        c["chasing"][i] = enemy.state == "chase"
+        c["facing_right"][i] = enemy.facing_right
+        c["on_ground"][i] = enemy.on_ground
+        c["frame"][i] = enemy.frame_index
+        c["frame_count"][i] = len(enemy.animations["run"])
+        c["last_frame_time"][i] = enemy.last_update_time
+        self.enemies.append(enemy)
+        self.frames.append((enemy.animations["run"], enemy.animations["run_left"]))
+        self.count += 1
+
+    def cull(self) -> None:
+        """Drops the rows of enemies that left their groups (killed)."""
+        # a pooled enemy can be killed and respawned before the next update,
+        # in which case only its newest row is live
+        newest = {enemy: i for i, enemy in enumerate(self.enemies)}
+        keep = [
+            i
+            for i, enemy in enumerate(self.enemies)
+            if newest[enemy] == i and enemy.alive()
+        ]
+        if len(keep) == self.count:
+            return
+        for column in self.columns.values():
+            column[: len(keep)] = column[keep]
+        self.enemies = [self.enemies[i] for i in keep]
+        self.frames = [self.frames[i] for i in keep]
+        self.count = len(keep)
+
+    def jump(self, mask: np.ndarray) -> None:
+        mask = mask & self.on_ground
+        self.vy[mask] = self.jump_speed[mask]
+        self.on_ground[mask] = False
+
+    def behavior(self, player: Any) -> None:
+        """Patrol/chase switching and chase jumps (Enemy.behavior)."""
+        px, py = player.rect.centerx, player.rect.centery
+        dx = px - (self.x + self.w // 2)
+        dy = py - (self.y + self.h - self.image_h // 2)
+        # squared distances, no square root needed for a range check
+        chasing = self.chasing
+        chasing[:] = dx * dx + dy * dy < self.sight_range**2
+
+        self.speed[:] = np.where(chasing, self.chase_speed, self.walk_speed)
+        right = dx > 0
+        self.dir_x[chasing] = np.where(right, 1, -1)[chasing]
+        self.facing_right[chasing] = right[chasing]
+
+        self.jump(chasing & (dy < -100))
+        # enemy 05 jumps whenever it lands
+        self.jump(self.jumper)
+
+    def move_and_check_walls(self) -> None:
+        """Horizontal movement, wall bounces and ledge turns."""
+        x, y, w, h = self.x, self.y, self.w, self.h
+        dir_x = self.dir_x
+        x += dir_x * self.speed
+
+        c0, _, solid = self.world.box_cells(x, y, w, h)
+        col_hit = solid.any(axis=1)
+        hit = col_hit.any(axis=1)
+        if hit.any():
+            span = col_hit.shape[1]
+            first = np.argmax(col_hit, axis=1)
+            last = span - 1 - np.argmax(col_hit[:, ::-1], axis=1)
+            size = self.world.cell_size
+            right = hit & (dir_x > 0)
+            left = hit & (dir_x < 0)
+            # push back out of the closest wall
+            x[right] = ((c0 + first) * size - w)[right]
+            x[left] = ((c0 + last + 1) * size)[left]
+
+            # chasing enemies jump walls, the rest turn around
+            climb = hit & self.chasing & self.on_ground
+            self.jump(climb)
+            turn = hit & ~climb
+            dir_x[turn] = -dir_x[turn]
+            self.facing_right[turn] = dir_x[turn] > 0
+
+        # patrolling enemies turn around at ledges
+        check = self.on_ground & (self.vy == 0) & ~self.chasing
+        if check.any():
+            facing = self.facing_right[check]
+            look_x = np.where(
+                facing,
+                x[check] + w[check] + self.ledge_look_ahead,
+                x[check] - self.ledge_look_ahead,
+            )
+            # CollisionWorld.ground_below(look_x, bottom, 20) for each enemy
+            n = len(look_x)
+            _, _, ground = self.world.box_cells(
+                look_x, y[check] + h[check], np.ones(n), np.full(n, 20)
+            )
+            turn = np.flatnonzero(check)[~ground.any(axis=(1, 2))]
+            dir_x[turn] = -dir_x[turn]
+            self.facing_right[turn] = ~self.facing_right[turn]
+
+    def check_vertical_collisions(self) -> None:
+        """Gravity, landing on floors and bumping into ceilings."""
+        y, h, vy = self.y, self.h, self.vy
+        vy += self.gravity
+        # pygame rects round to whole pixels
+        y[:] = np.rint(y + vy)
+        on_ground = self.on_ground
+        on_ground[:] = False
+
+        _, r0, solid = self.world.box_cells(self.x, y, self.w, h)
+        row_hit = solid.any(axis=2)
+        hit = row_hit.any(axis=1)
+        if not hit.any():
+            return
+        span = row_hit.shape[1]
+        top = np.argmax(row_hit, axis=1)
+        bottom = span - 1 - np.argmax(row_hit[:, ::-1], axis=1)
+        size = self.world.cell_size
+        falling = hit & (vy > 0)
+        rising = hit & (vy < 0)
+        y[falling] = ((r0 + top) * size - h)[falling]
+        y[rising] = ((r0 + bottom + 1) * size)[rising]
+        vy[falling | rising] = 0
+        on_ground[falling] = True
+
+    def animate(self) -> None:
+        """Advances run frames, twice as fast while chasing."""
+        now = get_ticks()
+        duration = np.where(self.chasing, 50, 100)
+        advance = now - self.last_frame_time > duration
+        frame = self.frame
+        frame[advance] = (frame[advance] + 1) % self.frame_count[advance]
+        self.last_frame_time[advance] = now
+
+    def sync_views(self) -> None:
+        """Writes image and rect back to the enemy sprites."""
+        centers = (self.x + self.w // 2).astype(np.int64).tolist()
+        bottoms = (self.y + self.h).astype(np.int64).tolist()
+        for enemy, (run, run_left), facing, frame, cx, bottom in zip(
+            self.enemies,
+            self.frames,
+            self.facing_right.tolist(),
+            self.frame.tolist(),
+            centers,
+            bottoms,
+        ):
+            image = (run if facing else run_left)[frame]
+            enemy.image = image
+            rect = enemy.rect
+            rect.size = image.get_size()
+            rect.midbottom = (cx, bottom)
+
+    def update(self, player: Any) -> None:
+        """Runs one frame of Enemy.update for every enemy."""
+        self.cull()
+        if not self.count:
+            return
+        self.behavior(player)
+        self.move_and_check_walls()
+        self.check_vertical_collisions()
+        self.animate()
+        self.sync_views()
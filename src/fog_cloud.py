@@ -1,21 +1,19 @@
 # @generated "partially" Gemini: Added docstrings and type annotations
-import random
 from typing import Tuple
 
 import pygame
 
+from settings import CLOUD_VIEW_MARGIN
+
 
 class FogCloud(pygame.sprite.Sprite):
     """
     Ambient fog cloud that floats across the screen.
     """
 
-    def __init__(
-        self, x: int, y: int, map_width: int, image: pygame.Surface, speed: float
-    ) -> None:
+    def __init__(self, x: int, y: int, image: pygame.Surface, speed: float) -> None:
         super().__init__()
         self.z = 3
-        self.map_width = map_width
         self.speed = speed
         self.image = image
         self.rect = self.image.get_rect(topleft=(x, y))
@@ -27,12 +25,17 @@ class FogCloud(pygame.sprite.Sprite):
         viewport_size: Tuple[int, int],
     ) -> None:
         """
-        Moves the cloud and loops it around the map boundaries.
-        Note: dt, camera_offset, and viewport_size are kept for interface compatibility
-        but might not be used if logic is simple.
+        Moves the cloud and loops it around the view.
+
+        The loop spans the view plus CLOUD_VIEW_MARGIN on each side, so a
+        cloud leaving it (drifting off, or left behind by the camera) comes
+        back on the far side while off screen, and a fixed set of clouds
+        covers the view wherever the camera goes.
+        Note: dt is kept for interface compatibility.
         """
         self.rect.x += self.speed
 
-        # loop around map
-        if self.rect.left > self.map_width:
-            self.rect.right = -random.randint(0, 200)
+        left = int(camera_offset.x) - CLOUD_VIEW_MARGIN
+        span = viewport_size[0] + 2 * CLOUD_VIEW_MARGIN
+        if not left <= self.rect.x < left + span:
+            self.rect.x = left + (self.rect.x - left) % span
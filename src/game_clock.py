@@ -0,0 +1,46 @@
+"""
+Game time source.
+
+Gameplay timers (cooldowns, animations, bullet lifetime) read the time from here
+instead of pygame.time.get_ticks(), so a headless simulation can swap the
+wall clock for a fixed-step frame clock and run faster than real time.
+"""
+
+from typing import Optional
+
+import pygame
+
+FRAME_MS: float = 1000 / 60
+
+_frame_ticks: Optional[float] = None
+
+
+def get_ticks() -> int:
+    """Returns the current game time in milliseconds."""
+    if _frame_ticks is None:
+        return pygame.time.get_ticks()
+    return int(_frame_ticks)
+
+
+def use_frame_clock(start: float = 0) -> None:
+    """Switches to the fixed-step clock, advanced only by tick()."""
+    global _frame_ticks
+    _frame_ticks = start
+
+
+def use_real_clock() -> None:
+    """Switches back to pygame's wall clock."""
+    global _frame_ticks
+    _frame_ticks = None
+
+
+def is_frame_clock() -> bool:
+    """Returns True while the fixed-step frame clock is in use."""
+    return _frame_ticks is not None
+
+
+def tick(ms: float = FRAME_MS) -> None:
+    """Advances the fixed-step clock by one frame (no-op on the wall clock)."""
+    global _frame_ticks
+    if _frame_ticks is not None:
+        _frame_ticks += ms
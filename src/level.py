@@ -1,22 +1,54 @@
 # @generated "partially" Gemini: Added docstrings and type annotations
+import math
 import os
 import random
-from typing import List, Tuple, Any, Optional, Dict
+from typing import List, Tuple, Any, Optional, Dict, Set
 
+import numpy as np
 import pygame
 import particlepy.particle
 import particlepy.shape
 
 from camera_group import CameraGroup
+from chunk_streamer import ChunkStreamer
+from collision_world import CollisionWorld
+from darkness import DarknessRenderer
+from profiler import FrameProfiler
+from pool import SpritePool
+from spatial_hash import SpatialHash, groupcollide
+from enemy_index import EnemyIndex
+from enemy_store import EnemyStore
 from fog_cloud import FogCloud
+from map_loader import (
+    DECOR,
+    ENEMY,
+    ENEMY_VARIANTS,
+    KINDS,
+    MAP_SCAN_COLS,
+    TERRAIN,
+    WALL,
+    Layout,
+    MapFile,
+    compile_layout,
+    layout_size,
+    map_columns,
+    occupied_cells,
+)
 from rain import Rain
+from overlay import bake_overlay
+from text_cache import TextCache
 from tile import Tile
 from player import Player
 from enemy import Enemy
 from bullet import Bullet
+from projectiles import ProjectileArrays
 from tower import Tower
 from settings import (
     TILE_SIZE,
+    STREAM_CHUNK_COLS,
+    ARRAY_PROJECTILES,
+    ARRAY_ENEMIES,
+    COLLISION_HASH_MIN_PAIRS,
     DAY_CYCLE_LENGTH,
     NIGHT_START_THRESHOLD,
     NIGHT_END_THRESHOLD,
@@ -24,6 +56,7 @@ from settings import (
     CELEBRATION_DURATION,
     BORDER_LEFT_INDEX,
     BORDER_RIGHT_INDEX,
+    CLOUD_VIEW_MARGIN,
 )
 
 
@@ -32,10 +65,31 @@ class Level:
     Manages the game world, including entities, day/night cycle, and game logic.
     """
 
-    def __init__(self, level_data: List[str], surface: pygame.Surface) -> None:
+    def __init__(
+        self,
+        level_data: Layout,
+        surface: pygame.Surface,
+        headless: bool = False,
+        array_projectiles: bool = ARRAY_PROJECTILES,
+        array_enemies: bool = ARRAY_ENEMIES,
+    ) -> None:
+        """
+        Args:
+            level_data: Map rows as comma-separated tile IDs, a tile ID grid
+                or a binary MapFile.
+            surface: Target surface; in headless mode it only provides the viewport size.
+            headless: Simulate without rendering (no decor, clouds, rain, UI, fonts,
+                sound or drawing).
+            array_projectiles: Keep projectiles in NumPy arrays instead of Bullet sprites.
+            array_enemies: Update enemies batched in an EnemyStore instead of per sprite.
+        """
         self.display_surface = surface
+        self.headless = headless
 
-        self.visible_sprites = CameraGroup()
+        self.visible_sprites = CameraGroup(surface)
+        # only records while the F3 overlay is shown (or under benchmark.py)
+        self.profiler = FrameProfiler(enabled=False)
+        Bullet.preload()
         self.tiles = pygame.sprite.Group()
         self.enemies = pygame.sprite.Group()
         self.bullets = pygame.sprite.Group()
@@ -43,14 +97,40 @@ class Level:
         self.player = pygame.sprite.GroupSingle()
         self.clouds = pygame.sprite.Group()
 
-        self.cloud_surf_cache = self.generate_cloud_cache()
+        # killed bullets and enemies go back to these pools for reuse
+        self.bullet_pool = SpritePool(
+            Bullet, lambda: Bullet(0, 0, 1, Bullet.load_source("bullet.png"))
+        )
+        self.enemy_pool = SpritePool(Enemy, lambda: Enemy(0, 0))
+        # replaces self.bullets when enabled
+        self.projectiles: Optional[ProjectileArrays] = None
+        if array_projectiles:
+            self.projectiles = ProjectileArrays()
+            self.visible_sprites.projectiles = self.projectiles
+        # when enabled, enemy sprites are only render views of the store
+        self.enemy_store: Optional[EnemyStore] = None
+        if array_enemies:
+            self.enemy_store = EnemyStore()
+
+        self.cloud_surf_cache: List[pygame.Surface] = []
+        if not self.headless:
+            self.cloud_surf_cache = self.generate_cloud_cache()
 
         self.level_data = level_data
-        self.map_width = len(level_data[0].split(",")) * TILE_SIZE
-        self.map_height = len(level_data) * TILE_SIZE
+        rows, cols = layout_size(level_data)
+        self.map_width = cols * TILE_SIZE
+        self.map_height = rows * TILE_SIZE
 
-        # spatial Partitioning for tiles
-        self.tiles_by_col: Dict[int, List[Tile]] = {}
+        # solid tile grid used by every entity for tile collisions
+        self.world = CollisionWorld()
+        # tile sprites exist only for the map chunks near the view
+        self.map_source: Any = None
+        self.chunks = ChunkStreamer(STREAM_CHUNK_COLS * TILE_SIZE, self.load_chunk)
+
+        # collision broadphase for enemies, rebuilt every frame
+        self.enemy_hash = SpatialHash(TILE_SIZE)
+        # enemies sorted by x for tower targeting, rebuilt every frame
+        self.enemy_index = EnemyIndex()
 
         # wave management
         self.night_enemy_queue: List[Tuple[str, float, float]] = []
@@ -59,11 +139,17 @@ class Level:
 
         self.setup_level(level_data)
 
-        self.rain = Rain(self.display_surface)
-
-        font_path = os.path.join("assets", "font.ttf")
-        self.font = pygame.font.Font(font_path, 74)
-        self.ui_font = pygame.font.Font(font_path, 20)
+        self.rain: Optional[Rain] = None
+        self.font: Optional[pygame.font.Font] = None
+        self.ui_font: Optional[pygame.font.Font] = None
+        self.text_cache: Optional[TextCache] = None
+        if not self.headless:
+            self.rain = Rain(self.display_surface)
+            font_path = os.path.join("assets", "font.ttf")
+            self.font = pygame.font.Font(font_path, 74)
+            self.ui_font = pygame.font.Font(font_path, 20)
+            self.text_cache = TextCache()
+        self.game_over_layer: Optional[pygame.Surface] = None
 
         # day/night counter
         self.day_timer = 0
@@ -80,13 +166,11 @@ class Level:
         self.hs_celebration_timer = 0
         self.hs_celebrated_this_run = False
 
-        # instead of a full-screen surface, use a tiny one and scale it up.
-        # this significantly reduces the cost of alpha blending every frame.
-        self.small_overlay = pygame.Surface((32, 18))
-        self.small_overlay.fill((10, 10, 35))
-        self.dark_overlay_scaled = pygame.transform.scale(
-            self.small_overlay, self.display_surface.get_size()
-        )
+        # night is drawn from tinted surfaces, dusk and dawn with an overlay
+        self.darkness: Optional[DarknessRenderer] = None
+        if not self.headless:
+            self.darkness = DarknessRenderer(self.display_surface.get_size())
+            self.visible_sprites.darkness = self.darkness
 
         self.spawn_timer = 0
 
@@ -131,25 +215,22 @@ class Level:
 
         return cache
 
-    def setup_level(self, layout: List[str]) -> None:
-        """Parses the level map and creates sprite objects."""
+    def setup_level(self, layout: Layout) -> None:
+        """Creates the sprite objects of a level map (rows of cells or a tile grid)."""
         self.visible_sprites.empty()
         self.tiles.empty()
         self.enemies.empty()
+        if self.enemy_store is not None:
+            self.enemy_store.empty()
         self.bullets.empty()
+        if self.projectiles is not None:
+            self.projectiles.empty()
         self.towers.empty()
         self.player.empty()
         self.clouds.empty()
-        self.tiles_by_col = {}
-
-        enemy_map = {
-            "e01": "enemy01",
-            "e02": "enemy02",
-            "e03": "enemy03",
-            "e04": "enemy04",
-            "e05": "enemy05",
-            "e06": "enemy06",
-        }
+        # emptying the groups skips kill(), so hand everything back at once
+        self.bullet_pool.release_all()
+        self.enemy_pool.release_all()
 
         self.day_timer = 0
         self.day_count = 1
@@ -164,51 +245,38 @@ class Level:
         self.night_enemy_queue = []
         self.wave_generated = False
 
-        for row_index, row in enumerate(layout):
-            row_values = row.split(",")
-            for col_index, val in enumerate(row_values):
-                val = val.strip()
-                x = col_index * TILE_SIZE
-                y = row_index * TILE_SIZE
-
-                def register_tile(t):
-                    col = int(t.rect.centerx // TILE_SIZE)
-                    if col not in self.tiles_by_col:
-                        self.tiles_by_col[col] = []
-                    self.tiles_by_col[col].append(t)
-
-                if val == "99":
-                    tile = Tile((x, y), TILE_SIZE, val)
-                    self.tiles.add(tile)
-                    register_tile(tile)
-
-                if val in [f"{i}" for i in range(1, 9)]:
-                    tile = Tile((x, y), TILE_SIZE, val)
-                    self.tiles.add(tile)
-                    self.visible_sprites.add(tile)
-                    register_tile(tile)
-                elif val in [f"{i}" for i in range(100, 109)]:
-                    tile = Tile((x, y), TILE_SIZE, val)
-                    self.visible_sprites.add(tile)
-
-                elif val in enemy_map:
-                    enemy_variant = enemy_map[val]
-                    # Calculate facing
-                    facing = True
-                    if x > self.map_width // 2:
-                        facing = False
-                    if enemy_variant in ["enemy_06", "enemy_02"]:
-                        enemy = Enemy(x, y, enemy_variant, 6, facing_right=facing)
-                    else:
-                        enemy = Enemy(x, y, enemy_variant, 4, facing_right=facing)
-                    self.enemies.add(enemy)
-                    self.visible_sprites.add(enemy)
+        # rows of cells are parsed once, map files are read block by block
+        if isinstance(layout, MapFile):
+            self.map_source = layout
+        else:
+            self.map_source = compile_layout(layout)
+        rows, cols = layout_size(self.map_source)
+        self.map_width = cols * TILE_SIZE
+        self.map_height = rows * TILE_SIZE
+
+        # the collision grid and the enemies cover the whole map, tile
+        # sprites are only streamed in around the view
+        solid = np.zeros((rows, cols), np.bool_)
+        for start in range(0, cols, MAP_SCAN_COLS):
+            block = map_columns(self.map_source, start, start + MAP_SCAN_COLS)
+            kinds = KINDS[block]
+            solid[:, start : start + block.shape[1]] = (kinds == WALL) | (
+                kinds == TERRAIN
+            )
+            for row, col in zip(*np.nonzero(kinds == ENEMY)):
+                variant = ENEMY_VARIANTS[int(block[row, col])]
+                x = int(start + col) * TILE_SIZE
+                self.spawn_enemy(variant, x, int(row) * TILE_SIZE)
+        self.world.build_grid(solid)
+        if self.enemy_store is not None:
+            self.enemy_store.set_world(self.world)
+        self.chunks.reset(-(-cols // STREAM_CHUNK_COLS))
 
         # center spawn calculation
         center_x = self.map_width // 2
         ground_y = 8 * TILE_SIZE
 
-        p = Player(center_x, ground_y, 1)
+        p = Player(center_x, ground_y, 1, sound=not self.headless)
         self.player.add(p)
         self.visible_sprites.add(p)
 
@@ -226,20 +294,61 @@ class Level:
 
         for offset, t_type, flip in left_towers + right_towers:
             tower = Tile((center_x + offset, ground_y), TILE_SIZE, t_type, flip_x=flip)
+            # painted over the map tiles, as if added after all of them
+            tower.paint_order = rows * cols
             self.visible_sprites.add(tower)
             # Add to tiles too so we can find it easily for interaction
             self.tiles.add(tower)
 
-        num_clouds = self.map_width // 150
-        for _ in range(num_clouds):
-            cx = random.randint(0, self.map_width)
+        if not self.headless:
+            self.spawn_clouds()
+            self.stream_chunks()
+
+    def spawn_clouds(self) -> None:
+        """Scatters the fog clouds over the view, which they then loop around."""
+        camera = self.visible_sprites
+        span = camera.screen_w + 2 * CLOUD_VIEW_MARGIN
+        left = int(camera.offset.x) - CLOUD_VIEW_MARGIN
+        # one cloud per 150 px, as when the whole map was populated
+        for _ in range(span // 150):
+            cx = random.randint(left, left + span - 1)
             cy = random.randint(0, self.map_height)
             image = random.choice(self.cloud_surf_cache)
             speed = random.uniform(0.3, 0.8)
-            cloud = FogCloud(cx, cy, self.map_width, image, speed)
+            cloud = FogCloud(cx, cy, image, speed)
             self.clouds.add(cloud)
             self.visible_sprites.add(cloud)
 
+    def load_chunk(self, index: int) -> List[pygame.sprite.Sprite]:
+        """Creates the tile sprites of one map column chunk."""
+        sprites: List[pygame.sprite.Sprite] = []
+        start = index * STREAM_CHUNK_COLS
+        block = map_columns(self.map_source, start, start + STREAM_CHUNK_COLS)
+        map_cols = self.map_width // TILE_SIZE
+        for row, col, tile_id, kind in zip(*occupied_cells(block)):
+            col += start
+            # walls only block movement, which the collision grid handles
+            if kind == TERRAIN or (kind == DECOR and not self.headless):
+                tile = Tile((col * TILE_SIZE, row * TILE_SIZE), TILE_SIZE, str(tile_id))
+                # same stacking as building the map row by row
+                tile.paint_order = row * map_cols + col
+                self.visible_sprites.add(tile)
+                if kind == TERRAIN:
+                    self.tiles.add(tile)
+                sprites.append(tile)
+        return sprites
+
+    def stream_chunks(self) -> None:
+        """Loads the map chunks around the camera and the player, evicts far ones."""
+        camera = self.visible_sprites
+        spans = [(camera.offset.x, camera.offset.x + camera.screen_w)]
+        player = self.player.sprite
+        if player:
+            # the camera is heading there
+            x = player.rect.centerx
+            spans.append((x - camera.half_w, x + camera.half_w))
+        self.chunks.update(spans)
+
     def create_bullet(
         self,
         x: int,
@@ -250,7 +359,10 @@ class Level:
         gravity: float = 0,
     ) -> None:
         """Callback function to create a bullet from player or tower."""
-        bullet = Bullet(x, y, direction, surf, damage, gravity)
+        if self.projectiles is not None:
+            self.projectiles.spawn(x, y, direction, surf, damage, gravity)
+            return
+        bullet = self.bullet_pool.acquire(x, y, direction, surf, damage, gravity)
         self.bullets.add(bullet)
         self.visible_sprites.add(bullet)
 
@@ -282,6 +394,26 @@ class Level:
         self.spawn_cooldown = max(20, total_spawn_time // num_enemies)
         self.spawn_timer = self.spawn_cooldown
 
+        self.reserve_pools(num_enemies)
+
+    def reserve_pools(self, num_enemies: int) -> None:
+        """Pre-sizes the pools so the night doesn't allocate sprites mid-wave."""
+        self.enemy_pool.reserve(len(self.enemies) + num_enemies)
+        if self.projectiles is not None:
+            return
+        # every shooter keeps about life_time / cooldown bullets in flight
+        cooldowns = [tower.cooldown for tower in self.towers]
+        cooldowns.append(self.player.sprite.shoot_cooldown)
+        in_flight = sum(math.ceil(Bullet.life_time / cd) for cd in cooldowns)
+        self.bullet_pool.reserve(in_flight)
+
+    def pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """Returns hit/miss/high-water counters of the sprite pools."""
+        return {
+            "bullets": self.bullet_pool.stats(),
+            "enemies": self.enemy_pool.stats(),
+        }
+
     def day_night_cycle(self) -> None:
         """Updates the game time and handles day/night transitions."""
         prev_day_index = self.day_timer // DAY_CYCLE_LENGTH
@@ -324,7 +456,6 @@ class Level:
             self.is_night = False
 
         self.current_darkness = target_alpha
-        self.small_overlay.set_alpha(self.current_darkness)
 
     def spawn_night_enemies(self) -> None:
         """Spawns enemies from queue during night time."""
@@ -340,22 +471,54 @@ class Level:
                     max_x = BORDER_RIGHT_INDEX * TILE_SIZE - 10 * TILE_SIZE
                     x = random.randint(min_x, max_x)
                     y = -100
+                    self.spawn_enemy(variant, x, y, hp_m, dmg_m)
+
+    def spawn_enemy(
+        self,
+        variant: str,
+        x: int,
+        y: int,
+        health_mult: float = 1.0,
+        damage_mult: float = 1.0,
+    ) -> Enemy:
+        """Creates an enemy facing the map center and adds it to the world."""
+        # Calculate facing
+        facing = True
+        if x > self.map_width // 2:
+            facing = False
+
+        if variant in ["enemy_06", "enemy_02"]:
+            enemy = self.enemy_pool.acquire(
+                x, y, variant, 6, health_mult, damage_mult, facing_right=facing
+            )
+        else:
+            enemy = self.enemy_pool.acquire(
+                x, y, variant, 4, health_mult, damage_mult, facing_right=facing
+            )
+        self.add_enemy(enemy)
+        return enemy
+
+    def add_enemy(self, enemy: Enemy) -> None:
+        """Adds an enemy to the world (and to the enemy store, if enabled)."""
+        self.enemies.add(enemy)
+        self.visible_sprites.add(enemy)
+        if self.enemy_store is not None:
+            self.enemy_store.add(enemy)
+
+    def build_tower(self, destroyed: Tile) -> Tower:
+        """Replaces a destroyed tower tile with a working tower."""
+        new_tower = Tower(
+            destroyed.rect.midbottom,
+            destroyed.tile_type,
+            destroyed.flip_x,
+            self.create_bullet,
+        )
+        self.towers.add(new_tower)
+        self.visible_sprites.add(new_tower)
 
-                    # Calculate facing
-                    facing = True
-                    if x > self.map_width // 2:
-                        facing = False
-
-                    if variant in ["enemy_06", "enemy_02"]:
-                        enemy = Enemy(
-                            x, y, variant, 6, hp_m, dmg_m, facing_right=facing
-                        )
-                    else:
-                        enemy = Enemy(
-                            x, y, variant, 4, hp_m, dmg_m, facing_right=facing
-                        )
-                    self.enemies.add(enemy)
-                    self.visible_sprites.add(enemy)
+        # remove destroyed tower
+        destroyed.kill()
+        return new_tower
 
     def handle_interaction(self) -> Optional[Any]:
         """Handles mouse clicks for buying/repairing towers."""
@@ -394,19 +557,7 @@ class Level:
                 if isinstance(hovered_obj, Tile):
                     if self.player.sprite.money >= hovered_obj.price:
                         self.player.sprite.money -= hovered_obj.price
-
-                        # create repaired tower
-                        new_tower = Tower(
-                            hovered_obj.rect.midbottom,
-                            hovered_obj.tile_type,
-                            hovered_obj.flip_x,
-                            self.create_bullet,
-                        )
-                        self.towers.add(new_tower)
-                        self.visible_sprites.add(new_tower)
-
-                        # remove destroyed tower
-                        hovered_obj.kill()
+                        self.build_tower(hovered_obj)
                         hovered_obj = None  # No longer hovering
 
                 # If it's a built tower (Tower)
@@ -423,52 +574,27 @@ class Level:
         """Renders user interface (money, tooltips, celebrations)."""
         screen_w, screen_h = self.display_surface.get_size()
 
-        money_text = f"${self.player.sprite.money}"
-        money_surf = self.ui_font.render(money_text, True, (255, 215, 0))
-        money_rect = money_surf.get_rect(topleft=(20, 0))
-
-        money_shadow = self.ui_font.render(money_text, True, (0, 0, 0))
-        money_shadow_rect = money_rect.copy()
-        money_shadow_rect.x += 2
-        money_shadow_rect.y += 2
-
-        self.display_surface.blit(money_shadow, money_shadow_rect)
-        self.display_surface.blit(money_surf, money_rect)
-
-        wpn_cost = self.player.sprite.weapon_upgrade_cost
-        wpn_level = self.player.sprite.weapon_level
-        wpn_text = f"[E] upgrade weapon Lvl{wpn_level} (${wpn_cost})"
-        wpn_surf = self.ui_font.render(wpn_text, True, (200, 200, 200))
-        wpn_rect = wpn_surf.get_rect(topleft=(20, 50))
-        wpn_shadow = self.ui_font.render(wpn_text, True, (0, 0, 0))
-        wpn_sh_rect = wpn_rect.copy()
-        wpn_sh_rect.x += 2
-        wpn_sh_rect.y += 2
-        self.display_surface.blit(wpn_shadow, wpn_sh_rect)
-        self.display_surface.blit(wpn_surf, wpn_rect)
-
-        reg_cost = self.player.sprite.regen_upgrade_cost
-        reg_level = self.player.sprite.regen_level
-        reg_text = f"[C] upgrade regeneration Lv{reg_level} (${reg_cost})"
-        reg_surf = self.ui_font.render(reg_text, True, (200, 200, 200))
-        reg_rect = reg_surf.get_rect(topleft=(20, 80))
-        reg_shadow = self.ui_font.render(reg_text, True, (0, 0, 0))
-        reg_sh_rect = reg_rect.copy()
-        reg_sh_rect.x += 2
-        reg_sh_rect.y += 2
-        self.display_surface.blit(reg_shadow, reg_sh_rect)
-        self.display_surface.blit(reg_surf, reg_rect)
-
-        heal_cost = self.player.sprite.quick_heal_cost
-        heal_text = f"[Q] full heal (${heal_cost})"
-        heal_surf = self.ui_font.render(heal_text, True, (200, 200, 200))
-        heal_rect = heal_surf.get_rect(topleft=(20, 110))
-        heal_shadow = self.ui_font.render(heal_text, True, (0, 0, 0))
-        heal_sh_rect = heal_rect.copy()
-        heal_sh_rect.x += 2
-        heal_sh_rect.y += 2
-        self.display_surface.blit(heal_shadow, heal_sh_rect)
-        self.display_surface.blit(heal_surf, heal_rect)
+        # HUD lines come from the text cache, re-rendered only when they change
+        player = self.player.sprite
+        surface = self.display_surface
+        hud = self.text_cache
+        gold = (255, 215, 0)
+        grey = (200, 200, 200)
+
+        money_text = f"${player.money}"
+        hud.draw(surface, self.ui_font, money_text, gold, (2, 2), topleft=(20, 0))
+        wpn_text = (
+            f"[E] upgrade weapon Lvl{player.weapon_level}"
+            f" (${player.weapon_upgrade_cost})"
+        )
+        hud.draw(surface, self.ui_font, wpn_text, grey, (2, 2), topleft=(20, 50))
+        reg_text = (
+            f"[C] upgrade regeneration Lv{player.regen_level}"
+            f" (${player.regen_upgrade_cost})"
+        )
+        hud.draw(surface, self.ui_font, reg_text, grey, (2, 2), topleft=(20, 80))
+        heal_text = f"[Q] full heal (${player.quick_heal_cost})"
+        hud.draw(surface, self.ui_font, heal_text, grey, (2, 2), topleft=(20, 110))
 
         # tooltip for buying/upgrading
         cost = 0
@@ -491,7 +617,7 @@ class Level:
 
             col = (0, 255, 0) if self.player.sprite.money >= cost else (255, 0, 0)
 
-            tooltip_surf = self.ui_font.render(text, True, col)
+            tooltip_surf = self.text_cache.render(self.ui_font, text, col)
             tooltip_rect = tooltip_surf.get_rect(topleft=(mx + 15, my))
 
             bg_rect = tooltip_rect.inflate(10, 10)
@@ -505,18 +631,9 @@ class Level:
             if self.celebration_timer <= 0:
                 self.show_celebration = False
             else:
-                msg = f"day {self.day_count}"
-                big_text = self.font.render(msg, True, (255, 215, 0))
-                big_rect = big_text.get_rect(
-                    center=(screen_w // 2, screen_h // 2 - 100)
-                )
-
-                big_shadow = self.font.render(msg, True, (0, 0, 0))
-                big_shadow_rect = big_rect.copy()
-                big_shadow_rect.center = (screen_w // 2 + 4, screen_h // 2 - 96)
-
-                self.display_surface.blit(big_shadow, big_shadow_rect)
-                self.display_surface.blit(big_text, big_rect)
+                day_text = f"day {self.day_count}"
+                center = (screen_w // 2, screen_h // 2 - 100)
+                hud.draw(surface, self.font, day_text, gold, (4, 4), center=center)
 
         # High Score Celebration
         if self.show_hs_celebration:
@@ -525,44 +642,31 @@ class Level:
                 self.show_hs_celebration = False
             else:
                 msg = "NEW HIGH SCORE!"
-                big_text = self.font.render(msg, True, (0, 255, 255))  # Cyan color
-                big_rect = big_text.get_rect(
-                    center=(screen_w // 2, screen_h // 2 - 200)
-                )
+                cyan = (0, 255, 255)
+                center = (screen_w // 2, screen_h // 2 - 200)
+                hud.draw(surface, self.font, msg, cyan, (4, 4), center=center)
 
-                big_shadow = self.font.render(msg, True, (0, 0, 0))
-                big_shadow_rect = big_rect.copy()
-                big_shadow_rect.center = (screen_w // 2 + 4, screen_h // 2 - 196)
-
-                self.display_surface.blit(big_shadow, big_shadow_rect)
-                self.display_surface.blit(big_text, big_rect)
+    def build_game_over_layer(self) -> pygame.Surface:
+        """The dimmed game over screen, rendered once and kept."""
+        screen_w, screen_h = self.display_surface.get_size()
+        center_x, center_y = screen_w // 2, screen_h // 2
+        game_over = self.font.render("GAME OVER", True, "Red")
+        restart = self.font.render("Press 'R' to Restart", True, "White")
+        pieces = [
+            (game_over, game_over.get_rect(center=(center_x, center_y - 50))),
+            (restart, restart.get_rect(center=(center_x, center_y + 50))),
+        ]
+        return bake_overlay((screen_w, screen_h), 150, pieces)
 
     def check_game_over(self) -> bool:
         """Checks player status and displays Game Over screen if dead."""
         player = self.player.sprite
+        if player.is_dead and self.headless:
+            return True
         if player.is_dead:
-            overlay = pygame.Surface(self.display_surface.get_size())
-            overlay.set_alpha(150)
-            overlay.fill((0, 0, 0))
-            self.display_surface.blit(overlay, (0, 0))
-
-            text_surf = self.font.render("GAME OVER", True, "Red")
-            text_rect = text_surf.get_rect(
-                center=(
-                    self.display_surface.get_width() // 2,
-                    self.display_surface.get_height() // 2 - 50,
-                )
-            )
-            self.display_surface.blit(text_surf, text_rect)
-
-            restart_surf = self.font.render("Press 'R' to Restart", True, "White")
-            restart_rect = restart_surf.get_rect(
-                center=(
-                    self.display_surface.get_width() // 2,
-                    self.display_surface.get_height() // 2 + 50,
-                )
-            )
-            self.display_surface.blit(restart_surf, restart_rect)
+            if self.game_over_layer is None:
+                self.game_over_layer = self.build_game_over_layer()
+            self.display_surface.blit(self.game_over_layer, (0, 0))
 
             keys = pygame.key.get_pressed()
             if keys[pygame.K_r]:
@@ -576,59 +680,122 @@ class Level:
             self.day_night_cycle()
             self.spawn_night_enemies()
 
-        self.visible_sprites.custom_draw(self.player.sprite, show_player=not is_menu)
+        if self.headless:
+            self.visible_sprites.update_camera(
+                self.player.sprite, show_player=not is_menu
+            )
+        else:
+            with self.profiler.phase("stream_chunks"):
+                self.stream_chunks()
+            with self.profiler.phase("custom_draw"):
+                self.visible_sprites.custom_draw(
+                    self.player.sprite, show_player=not is_menu
+                )
 
-        if self.current_darkness > 0:
-            self.dark_overlay_scaled.set_alpha(self.current_darkness)
-            self.display_surface.blit(self.dark_overlay_scaled, (0, 0))
+            with self.profiler.phase("darkness"):
+                self.darkness.draw(self.display_surface, self.current_darkness)
 
-        self.rain.update()
-        self.rain.draw()
-        self.clouds.update(1.0, None, None)
+            with self.profiler.phase("rain"):
+                self.rain.update()
+                self.rain.draw()
+            with self.profiler.phase("clouds"):
+                camera = self.visible_sprites
+                viewport = (camera.screen_w, camera.screen_h)
+                self.clouds.update(1.0, camera.offset, viewport)
         if is_menu:
             return
 
-        hovered_tile = self.handle_interaction()
-
-        self.draw_ui(hovered_tile)
+        if not self.headless:
+            with self.profiler.phase("handle_interaction"):
+                hovered_tile = self.handle_interaction()
+            with self.profiler.phase("draw_ui"):
+                self.draw_ui(hovered_tile)
 
         if self.check_game_over():
             return
 
-        # only check collisions for tiles that are currently on screen + margin
-        screen_w = self.display_surface.get_width()
-        cam_x = self.visible_sprites.offset.x
-
-        # calculate start and end columns for the camera view
-        start_col = int(cam_x // TILE_SIZE) - 2
-        end_col = int((cam_x + screen_w) // TILE_SIZE) + 2
-
-        active_tiles = pygame.sprite.Group()
-        for col in range(start_col, end_col + 1):
-            if col in self.tiles_by_col:
-                active_tiles.add(self.tiles_by_col[col])
-
-        self.enemies.update(self.tiles_by_col, self.player.sprite)
-        self.bullets.update(active_tiles)
-        self.player.sprite.update(active_tiles, self.create_bullet)
-
-        self.towers.update(self.enemies)
+        with self.profiler.phase("enemies"):
+            if self.enemy_store is not None:
+                self.enemy_store.update(self.player.sprite)
+            else:
+                self.enemies.update(self.world, self.player.sprite)
+        with self.profiler.phase("bullets"):
+            if self.projectiles is not None:
+                self.projectiles.update(self.world)
+            else:
+                self.bullets.update(self.world)
+        with self.profiler.phase("player"):
+            self.player.sprite.update(self.world, self.create_bullet)
+        with self.profiler.phase("towers"):
+            if self.towers:
+                self.enemy_index.rebuild(self.enemies)
+                self.towers.update(self.enemy_index)
+
+        with self.profiler.phase("collisions"):
+            self.check_collisions()
+
+    def bullet_count(self) -> int:
+        """Returns the number of projectiles in flight."""
+        if self.projectiles is not None:
+            return len(self.projectiles)
+        return len(self.bullets)
+
+    def entity_counts(self) -> Dict[str, int]:
+        """Returns the number of sprites in each group (for debugging)."""
+        return {
+            "visible": len(self.visible_sprites),
+            "tiles": len(self.tiles),
+            "chunks": len(self.chunks.loaded),
+            "enemies": len(self.enemies),
+            "bullets": self.bullet_count(),
+            "towers": len(self.towers),
+            "clouds": len(self.clouds),
+            "player": len(self.player),
+        }
 
-        # bullet collisions with enemies
-        hits_bullets = pygame.sprite.groupcollide(
-            self.enemies, self.bullets, False, True
-        )
-        if hits_bullets:
-            for enemy, bullets in hits_bullets.items():
-                for bullet in bullets:
-                    if enemy.get_damage(bullet.damage):
-                        # enemy killed!
-                        reward = random.randint(10, 20)
-                        self.player.sprite.money += reward
-                        self.player.sprite.score += reward
+    def check_collisions(self) -> None:
+        """Resolves bullet hits on enemies and enemy contact with the player."""
+        # pygame's brute force loops are cheaper until there are enough
+        # enemy/bullet pairs to pay for hashing every enemy each frame
+        pairs = len(self.enemies) * self.bullet_count()
+        use_hash = pairs >= COLLISION_HASH_MIN_PAIRS
+        if use_hash:
+            self.enemy_hash.rebuild(self.enemies)
+        killed: Set[Enemy] = set()
+
+        # bullet collisions with enemies, as enemy -> damage of each hit
+        hits_bullets: Dict[Enemy, List[int]]
+        if self.projectiles is not None:
+            hits_bullets = self.projectiles.collide(self.enemies)
+        else:
+            if use_hash:
+                hit_sprites = groupcollide(self.enemy_hash, self.bullets, True)
+            else:
+                hit_sprites = pygame.sprite.groupcollide(
+                    self.enemies, self.bullets, False, True
+                )
+            hits_bullets = {
+                enemy: [bullet.damage for bullet in bullets]
+                for enemy, bullets in hit_sprites.items()
+            }
+        for enemy, damages in hits_bullets.items():
+            for damage in damages:
+                if enemy.get_damage(damage):
+                    # enemy killed!
+                    killed.add(enemy)
+                    reward = random.randint(10, 20)
+                    self.player.sprite.money += reward
+                    self.player.sprite.score += reward
 
         # enemy collisions with player
-        hits = pygame.sprite.spritecollide(self.player.sprite, self.enemies, False)
+        if use_hash:
+            hits = [
+                sprite
+                for sprite in self.enemy_hash.collide(self.player.sprite.rect)
+                if sprite not in killed
+            ]
+        else:
+            hits = pygame.sprite.spritecollide(self.player.sprite, self.enemies, False)
         if hits:
             for sprite in hits:
                 self.player.sprite.get_damage(sprite.damage)
@@ -2,10 +2,16 @@
 import os
 import pygame
 
+from debug_overlay import DebugOverlay
 from level import Level
 from menu import Menu
+from parallax import ParallaxCompositor
 from settings import GAME_HEIGHT
-from utils import tower_defense_map, load_bg, draw_bg, load_high_score, save_high_score
+from utils import (
+    tower_defense_map,
+    load_high_score,
+    save_high_score,
+)
 
 
 pygame.init()
@@ -21,17 +27,13 @@ screen_w, screen_h = screen.get_size()
 pygame.display.set_caption("BDV2")
 clock = pygame.time.Clock()
 
-zoom_factor = 1.2
-bg_w = int(screen_w * zoom_factor)
-bg_h = int(screen_h * zoom_factor)
-
-bg_1 = load_bg("background1.png", (bg_w, bg_h), transparency=False)
-bg_2 = load_bg("background4a.png", (bg_w, bg_h), transparency=True)
-bg_3 = load_bg("background4b.png", (bg_w, bg_h), transparency=True)
-bg_4 = load_bg("background3.png", (bg_w, bg_h), transparency=True)
+background = ParallaxCompositor.load((screen_w, screen_h))
 
 level = Level(tower_defense_map, screen)
+# the background strips are tinted for the night once, not at dusk
+level.darkness.prepare(background.surfaces)
 menu = Menu(screen, os.path.join("assets", "font.ttf"))
+debug_overlay = DebugOverlay(screen, os.path.join("assets", "font.ttf"))
 game_state = "MENU"
 
 music_path = os.path.join("assets", "sound", "main_music.wav")
@@ -44,6 +46,7 @@ session_start_best_score = best_score
 has_started = False
 
 while True:
+    level.profiler.begin_frame()
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             pygame.quit()
@@ -51,28 +54,13 @@ while True:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 game_state = "MENU"
+            elif event.key == pygame.K_F3:
+                debug_overlay.toggle(level.profiler)
 
     camera_x = level.visible_sprites.offset.x
     camera_y = level.visible_sprites.offset.y
 
-    speed_1 = 0.05
-    speed_2 = 0.09
-    speed_3 = 0.11
-    speed_4 = 0.15
-
-    bg_1_x = -(camera_x * speed_1)
-    bg_1_y = (screen_h - bg_h) // 2 - (camera_y * speed_1)
-    bg_2_x = -(camera_x * speed_2)
-    bg_2_y = (screen_h - bg_h) // 2 - (camera_y * speed_2)
-    bg_3_x = -(camera_x * speed_3)
-    bg_3_y = (screen_h - bg_h) // 2 - (camera_y * speed_3)
-    bg_4_x = -(camera_x * speed_4)
-    bg_4_y = (screen_h - bg_h) // 2 - (camera_y * speed_4)
-
-    draw_bg(screen, bg_1, bg_1_x, bg_1_y, bg_w, screen_w)
-    draw_bg(screen, bg_2, bg_2_x, bg_2_y, bg_w, screen_w)
-    draw_bg(screen, bg_3, bg_3_x, bg_3_y, bg_w, screen_w)
-    draw_bg(screen, bg_4, bg_4_x, bg_4_y, bg_w, screen_w)
+    background.draw(screen, camera_x, camera_y, level.profiler, level.darkness)
 
     if level.player.sprite:
         current = level.player.sprite.score
@@ -110,5 +98,8 @@ while True:
     else:
         level.run(is_menu=False)
 
+    debug_overlay.draw(level.profiler, level.entity_counts())
+
     pygame.display.flip()
+    level.profiler.end_frame()
     clock.tick(60)
@@ -0,0 +1,202 @@
+"""
+Level maps as grids of tile IDs.
+
+Maps come either as rows of comma-separated cells (utils.generate_map) or as
+binary .map files: a 16 byte header (magic, version, tile size, width and
+height in cells) followed by the uint16 tile IDs column by column. Binary
+maps are memory-mapped, so a range of columns can be read without loading
+or parsing the rest of the file. Convert a layout with
+
+    python map_loader.py level.map [--rows level.txt]
+"""
+
+import argparse
+import struct
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from settings import TILE_SIZE
+
+# what setup_level builds for a cell
+EMPTY = 0
+WALL = 1  # invisible solid tile (map borders)
+TERRAIN = 2  # solid, visible tile
+DECOR = 3  # visible only, skipped when headless
+ENEMY = 4  # enemy spawn
+
+# enemy spawn codes get IDs above every tile type
+ENEMY_VARIANTS: Dict[int, str] = {
+    1001: "enemy01",
+    1002: "enemy02",
+    1003: "enemy03",
+    1004: "enemy04",
+    1005: "enemy05",
+    1006: "enemy06",
+}
+ENEMY_CODES: Dict[str, int] = {
+    f"e{tile_id - 1000:02d}": tile_id for tile_id in ENEMY_VARIANTS
+}
+
+# tile ID -> kind, for the whole uint16 range so any grid can be indexed
+KINDS = np.zeros(1 << 16, np.uint8)
+KINDS[99] = WALL
+KINDS[1:9] = TERRAIN
+KINDS[100:109] = DECOR
+KINDS[list(ENEMY_VARIANTS)] = ENEMY
+
+MAP_MAGIC = b"BDMP"
+MAP_VERSION = 1
+# magic, version, tile size, width, height
+HEADER = struct.Struct("<4sHHII")
+
+
+class MapFile:
+    """
+    A binary map opened read-only through numpy.memmap.
+
+    Columns are stored contiguously, so columns(start, stop) only reads the
+    pages of those columns from disk.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"{path}: not a map file")
+        magic, version, tile_size, width, height = HEADER.unpack(header)
+        if magic != MAP_MAGIC or version != MAP_VERSION:
+            raise ValueError(f"{path}: not a version {MAP_VERSION} map file")
+
+        self.tile_size = tile_size
+        self.width = width
+        self.height = height
+        # (columns, rows)
+        self.data = np.memmap(
+            path, np.dtype("<u2"), "r", offset=HEADER.size, shape=(width, height)
+        )
+
+    def columns(self, start: int, stop: int) -> np.ndarray:
+        """Copies columns [start, stop) into a (rows, cols) tile ID grid."""
+        return np.array(self.data[start:stop].T, np.uint16)
+
+
+def save_map(path: str, layout: "Layout", tile_size: int = TILE_SIZE) -> None:
+    """Writes a layout (rows of cells or a tile ID grid) as a binary map."""
+    grid = compile_layout(layout)
+    height, width = grid.shape
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAP_MAGIC, MAP_VERSION, tile_size, width, height))
+        f.write(np.ascontiguousarray(grid.T, np.dtype("<u2")).tobytes())
+
+
+Layout = Union[Sequence[str], np.ndarray, MapFile]
+
+# columns read at once when a whole map is scanned
+MAP_SCAN_COLS = 1024
+
+
+def cell_id(value: str) -> int:
+    """Tile ID of one map cell ("0", "101", "e03", ...); unknown cells are empty."""
+    value = value.strip()
+    if value in ENEMY_CODES:
+        return ENEMY_CODES[value]
+    if value.isdigit() and int(value) < 1 << 16:
+        return int(value)
+    return 0
+
+
+@lru_cache(maxsize=8)
+def _compile_rows(rows: Tuple[str, ...]) -> np.ndarray:
+    ids: Dict[str, int] = {}
+    parsed: List[List[int]] = []
+    for row in rows:
+        values = row.split(",")
+        for value in values:
+            if value not in ids:
+                ids[value] = cell_id(value)
+        parsed.append([ids[value] for value in values])
+
+    grid = np.array(parsed, np.uint16)
+    # shared between calls with the same layout
+    grid.flags.writeable = False
+    return grid
+
+
+def compile_layout(layout: Layout) -> np.ndarray:
+    """
+    Parses a layout of comma-separated rows into a (rows, cols) uint16 grid
+    of tile IDs. Grids are returned as they are, map files are read in full,
+    and compiling the same rows again (level restarts) returns the cached grid.
+    """
+    if isinstance(layout, np.ndarray):
+        return layout
+    if isinstance(layout, MapFile):
+        if layout.tile_size != TILE_SIZE:
+            raise ValueError(
+                f"{layout.path}: tile size {layout.tile_size}, expected {TILE_SIZE}"
+            )
+        return layout.columns(0, layout.width)
+    return _compile_rows(tuple(layout))
+
+
+def map_columns(
+    source: Union[np.ndarray, MapFile], start: int, stop: int
+) -> np.ndarray:
+    """Tile IDs of columns [start, stop) of a compiled grid or a map file."""
+    if isinstance(source, MapFile):
+        return source.columns(start, stop)
+    return source[:, start:stop]
+
+
+def layout_size(layout: Layout) -> Tuple[int, int]:
+    """Rows and columns of a layout (map files only read their header)."""
+    if isinstance(layout, MapFile):
+        return layout.height, layout.width
+    rows, cols = compile_layout(layout).shape
+    return rows, cols
+
+
+def occupied_cells(
+    grid: np.ndarray,
+) -> Tuple[List[int], List[int], List[int], List[int]]:
+    """
+    Returns rows, columns, tile IDs and kinds of every cell that builds
+    something, in row-major order. Empty cells are dropped in one pass.
+    """
+    kinds = KINDS[grid]
+    rows, cols = np.nonzero(kinds)
+    return (
+        rows.tolist(),
+        cols.tolist(),
+        grid[rows, cols].tolist(),
+        kinds[rows, cols].tolist(),
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Convert a map layout to a .map file.")
+    parser.add_argument("out", help="binary map to write")
+    parser.add_argument(
+        "--rows",
+        help="text file with one comma-separated row per line"
+        " (default: a generated map)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.rows:
+        with open(args.rows) as f:
+            layout = [line.strip() for line in f if line.strip()]
+    else:
+        from utils import generate_map
+
+        layout = generate_map()
+    save_map(args.out, layout)
+    height, width = compile_layout(layout).shape
+    print(f"{args.out}: {width} x {height} tiles")
+
+
+if __name__ == "__main__":
+    main()
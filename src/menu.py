@@ -1,8 +1,11 @@
 # @generated "partially" Gemini: Added docstrings and type annotations
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 
 import pygame
 
+from overlay import bake_overlay
+from text_cache import TextCache
+
 
 class Menu:
     """
@@ -32,38 +35,57 @@ class Menu:
             "SOUND": [("BACK", "MAIN")],
         }
 
+        # text that never changes on a page: (text, y, large font), baked
+        # into the page's dim layer
+        self.page_text: Dict[str, List[Tuple[str, int, bool]]] = {
+            "MAIN": [],
+            "CREDITS": [
+                ("CREDITS", 100, True),
+                ("programming: asilukas", 250, False),
+                ("music: schmauz", 300, False),
+                ("art: asilukas, szadiart ", 350, False),
+            ],
+            "CONTROLS": [
+                ("CONTROLS", 100, True),
+                ("A/D - move | SHIFT - sprint | SPACE - jump", 250, False),
+                ("Mouse Click - shoot", 320, False),
+                ("E - upgrade gun | C - upgrade regen", 390, False),
+            ],
+            "SOUND": [
+                ("SOUND SETTINGS", 100, True),
+                ("use Up/Down arrows", 320, False),
+            ],
+        }
+        self.layers: Dict[str, pygame.Surface] = {}
+        # scores, volume and button labels (one surface per hover color)
+        self.text_cache = TextCache()
+
+    def build_layer(self, state: str) -> pygame.Surface:
+        """The dim overlay of a page with its static text drawn in."""
+        center_x = self.display_surface.get_width() // 2
+        pieces = []
+        for text, y, large in self.page_text[state]:
+            surf = (self.font if large else self.small_font).render(text, True, "White")
+            pieces.append((surf, surf.get_rect(center=(center_x, y))))
+        return bake_overlay(self.display_surface.get_size(), 120, pieces)
+
     def draw(self) -> None:
         """Renders the current menu state."""
-        overlay = pygame.Surface(self.display_surface.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 120))
-        self.display_surface.blit(overlay, (0, 0))
+        layer = self.layers.get(self.state)
+        if layer is None:
+            layer = self.layers[self.state] = self.build_layer(self.state)
+        self.display_surface.blit(layer, (0, 0))
 
+        # only the pieces that can change are drawn on top
         if self.state == "MAIN":
             score_text = (
                 f"Current Score: {self.current_score}   Best Score: {self.best_score}"
             )
             self.draw_text(score_text, 100, self.small_font, color="Yellow")
-            self.draw_buttons(self.buttons["MAIN"])
-        elif self.state == "CREDITS":
-            self.draw_text("CREDITS", 100)
-            self.draw_text("programming: asilukas", 250, self.small_font)
-            self.draw_text("music: schmauz", 300, self.small_font)
-            self.draw_text("art: asilukas, szadiart ", 350, self.small_font)
-            self.draw_buttons(self.buttons["CREDITS"])
-        elif self.state == "CONTROLS":
-            self.draw_text("CONTROLS", 100)
-            self.draw_text(
-                "A/D - move | SHIFT - sprint | SPACE - jump", 250, self.small_font
-            )
-            self.draw_text("Mouse Click - shoot", 320, self.small_font)
-            self.draw_text("E - upgrade gun | C - upgrade regen", 390, self.small_font)
-            self.draw_buttons(self.buttons["CONTROLS"])
         elif self.state == "SOUND":
-            self.draw_text("SOUND SETTINGS", 100)
             vol_text = f"volume: {int(self.volume * 100)}"
             self.draw_text(vol_text, 250, self.small_font)
-            self.draw_text("use Up/Down arrows", 320, self.small_font)
-            self.draw_buttons(self.buttons["SOUND"])
+        self.draw_buttons(self.buttons[self.state])
 
     def draw_text(
         self,
@@ -75,7 +97,7 @@ class Menu:
         """Helper to draw centered text."""
         if not font:
             font = self.font
-        surf = font.render(text, True, color)
+        surf = self.text_cache.render(font, text, color)
         rect = surf.get_rect(center=(self.display_surface.get_width() // 2, y))
         self.display_surface.blit(surf, rect)
 
@@ -91,7 +113,7 @@ class Menu:
                 60,
             )
             color = "yellow" if rect.collidepoint(mx, my) else "white"
-            surf = self.small_font.render(text, True, color)
+            surf = self.text_cache.render(self.small_font, text, color)
             self.display_surface.blit(surf, surf.get_rect(center=rect.center))
 
     def update_resume_state(self, is_resumable: bool) -> None:
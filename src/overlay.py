@@ -0,0 +1,48 @@
+from typing import Iterable, Tuple
+
+import numpy as np
+import pygame
+
+from text_cache import premultiplied
+
+
+def unpremultiply(surface: pygame.Surface, rect: pygame.Rect) -> None:
+    """Turns premultiplied pixels inside rect back into straight alpha."""
+    rect = rect.clip(surface.get_rect())
+    if not rect.width or not rect.height:
+        return
+    area = (slice(rect.left, rect.right), slice(rect.top, rect.bottom))
+    alpha = pygame.surfarray.pixels_alpha(surface)[area]
+    rgb = pygame.surfarray.pixels3d(surface)[area]
+    shown = alpha > 0
+    a = alpha[shown].astype(np.int32)[:, None]
+    straight = (rgb[shown].astype(np.int32) * 255 + a // 2) // a
+    rgb[shown] = np.minimum(straight, 255)
+    del alpha, rgb  # unlocks the surface
+
+
+def bake_overlay(
+    size: Tuple[int, int],
+    alpha: int,
+    pieces: Iterable[Tuple[pygame.Surface, pygame.Rect]],
+) -> pygame.Surface:
+    """
+    A screen-sized black layer of the given alpha with static pieces (text)
+    drawn into it, for screens that dim the game behind them.
+
+    The pieces are composited in premultiplied alpha and converted back, so
+    one plain blit of the layer looks like filling the dim overlay and then
+    blitting every piece onto the screen, without paying for either again.
+    """
+    layer = pygame.Surface(size, pygame.SRCALPHA)
+    layer.fill((0, 0, 0, alpha))
+    rects = []
+    for image, rect in pieces:
+        layer.blit(
+            premultiplied(image), rect, special_flags=pygame.BLEND_PREMULTIPLIED
+        )
+        rects.append(rect)
+    if rects:
+        # once over everything drawn, overlapping pieces included
+        unpremultiply(layer, rects[0].unionall(rects[1:]))
+    return layer
@@ -0,0 +1,301 @@
+import argparse
+import os
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+from settings import BG_ZOOM_FACTOR, GAME_HEIGHT, PARALLAX_LAYERS
+from utils import load_bg
+
+# per layer: x of the left copy, x of the right copy (None when off screen), y
+Placement = Tuple[int, Optional[int], int]
+# part of a layer: surface and its position inside the layer
+Piece = Tuple[pygame.Surface, int, int]
+# darkness level the layers are tinted with, then the layer placements
+CompositeKey = Tuple[int, Tuple[Placement, ...]]
+
+EMPTY, OPAQUE, MIXED = 0, 1, 2
+# shorter empty or opaque row runs are folded into the mixed strip around them
+MIN_STRIP_ROWS = 16
+# colorkeys tried for strips with on/off alpha, the first unused one wins
+COLORKEYS = [(255, 0, 255), (0, 255, 255), (255, 255, 0), (1, 2, 3)]
+
+
+def merge_layers(
+    layers: Sequence[Tuple[pygame.Surface, float]],
+) -> List[Tuple[pygame.Surface, float]]:
+    """
+    Pre-blits neighbouring layers with the same speed into one surface.
+
+    The result is exact when the first layer of a group is opaque, which is
+    the usual case (a backdrop with cut-out layers in front of it).
+    """
+    groups: List[Tuple[List[pygame.Surface], float]] = []
+    for image, speed in layers:
+        if groups and groups[-1][1] == speed:
+            groups[-1][0].append(image)
+        else:
+            groups.append(([image], speed))
+
+    merged: List[Tuple[pygame.Surface, float]] = []
+    for images, speed in groups:
+        image = images[0]
+        if len(images) > 1:
+            # never draw into a loaded layer
+            image = image.copy()
+            for other in images[1:]:
+                image.blit(other, (0, 0))
+        merged.append((image, speed))
+    return merged
+
+
+def row_runs(kinds: np.ndarray, min_rows: int) -> List[Tuple[int, int, int]]:
+    """(kind, first row, end row) runs, short non-mixed runs merged into mixed."""
+    runs: List[Tuple[int, int, int]] = []
+    start = 0
+    for row in range(1, len(kinds) + 1):
+        if row == len(kinds) or kinds[row] != kinds[start]:
+            kind = int(kinds[start])
+            if kind != MIXED and row - start < min_rows:
+                kind = MIXED
+            if runs and runs[-1][0] == kind:
+                runs[-1] = (kind, runs[-1][1], row)
+            else:
+                runs.append((kind, start, row))
+            start = row
+    return runs
+
+
+def keyed_copy(part: pygame.Surface, alpha: np.ndarray) -> Optional[pygame.Surface]:
+    """
+    Copies a part whose pixels are fully opaque or fully transparent into a
+    colorkeyed surface, or returns None if every candidate key is in use.
+    """
+    rgb = pygame.surfarray.array3d(part)[alpha == 255].astype(np.int64)
+    used = (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+    for key in COLORKEYS:
+        if not np.any(used == (key[0] << 16) | (key[1] << 8) | key[2]):
+            surf = pygame.Surface(part.get_size()).convert()
+            surf.fill(key)
+            surf.blit(part, (0, 0))
+            # RLE skips the transparent runs instead of testing every pixel
+            surf.set_colorkey(key, pygame.RLEACCEL)
+            return surf
+    return None
+
+
+def split_layer(image: pygame.Surface, min_rows: int = MIN_STRIP_ROWS) -> List[Piece]:
+    """
+    Cuts a layer into horizontal strips, each blitted the cheapest way.
+
+    Fully transparent rows are dropped, fully opaque runs become plain
+    surfaces (copied without blending), and the rest is trimmed to its
+    bounding rect and colorkeyed when its alpha is only on or off, per-pixel
+    alpha (RLE encoded) otherwise. Layers without per-pixel alpha stay whole.
+    """
+    if not image.get_flags() & pygame.SRCALPHA:
+        return [(image, 0, 0)]
+
+    alpha = pygame.surfarray.array_alpha(image)  # (w, h)
+    kinds = np.full(alpha.shape[1], MIXED, np.int8)
+    kinds[alpha.max(axis=0) == 0] = EMPTY
+    kinds[alpha.min(axis=0) == 255] = OPAQUE
+
+    width = image.get_width()
+    pieces: List[Piece] = []
+    for kind, top, bottom in row_runs(kinds, min_rows):
+        if kind == EMPTY:
+            continue
+        rect = pygame.Rect(0, top, width, bottom - top)
+        if kind == OPAQUE:
+            pieces.append((image.subsurface(rect).convert(), 0, top))
+            continue
+
+        bounds = image.subsurface(rect).get_bounding_rect()
+        if not bounds.width or not bounds.height:
+            continue
+        rect = bounds.move(0, top)
+        part = image.subsurface(rect)
+        part_alpha = alpha[rect.left : rect.right, rect.top : rect.bottom]
+        surf = None
+        if np.all((part_alpha == 0) | (part_alpha == 255)):
+            surf = keyed_copy(part, part_alpha)
+        if surf is None:
+            surf = part.convert_alpha()
+            surf.set_alpha(255, pygame.RLEACCEL)
+        pieces.append((surf, rect.x, rect.y))
+    return pieces
+
+
+def surface_bytes(surf: pygame.Surface) -> int:
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+
+class ParallaxCompositor:
+    """
+    Draws the looping parallax background layers behind the level.
+
+    Layers are drawn back to front, each offset by the camera times its speed
+    and repeated horizontally. Layers sharing a speed are merged into one
+    surface up front, and every layer is cut into the strips that actually
+    show something (split_layer). While the camera holds still (menu, idle
+    player) the finished background is captured once and then drawn as a
+    single opaque blit instead of up to two passes per layer. At night the
+    strips are swapped for tinted copies from the DarknessRenderer.
+    """
+
+    def __init__(
+        self,
+        layers: Sequence[Tuple[pygame.Surface, float]],
+        bg_w: int,
+        bg_h: int,
+    ) -> None:
+        """
+        Args:
+            layers: (image, speed) tuples, back to front; the first is opaque.
+            bg_w: Width of the layer images.
+            bg_h: Height of the layer images.
+        """
+        self.layers = merge_layers(layers)
+        self.pieces = [split_layer(image) for image, _ in self.layers]
+        self.surfaces = [piece for pieces in self.pieces for piece, _, _ in pieces]
+        self.bg_w = bg_w
+        self.bg_h = bg_h
+
+        self.composite: Optional[pygame.Surface] = None
+        self.composite_key: Optional[CompositeKey] = None
+        self.last_key: Optional[CompositeKey] = None
+
+        self.reused = 0  # frames drawn from the composite
+        self.redrawn = 0  # frames that blitted the layers
+
+    @classmethod
+    def load(
+        cls,
+        screen_size: Tuple[int, int],
+        config: Sequence[Tuple[str, float, bool]] = PARALLAX_LAYERS,
+        zoom: float = BG_ZOOM_FACTOR,
+    ) -> "ParallaxCompositor":
+        """Loads the configured layers, scaled slightly larger than the screen."""
+        bg_w = int(screen_size[0] * zoom)
+        bg_h = int(screen_size[1] * zoom)
+        layers = [
+            (load_bg(filename, (bg_w, bg_h), transparency), speed)
+            for filename, speed, transparency in config
+        ]
+        return cls(layers, bg_w, bg_h)
+
+    def placements(
+        self, camera_x: float, camera_y: float, screen_w: int, screen_h: int
+    ) -> Tuple[Placement, ...]:
+        """Pixel positions of every layer, truncated as blit() would."""
+        bg_w = self.bg_w
+        placed = []
+        for _, speed in self.layers:
+            relative_x = -(camera_x * speed) % bg_w
+            y = (screen_h - self.bg_h) // 2 - (camera_y * speed)
+            right = int(relative_x) if relative_x < screen_w else None
+            placed.append((int(relative_x - bg_w), right, int(y)))
+        return tuple(placed)
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        camera_x: float,
+        camera_y: float,
+        profiler: Optional[Any] = None,
+        darkness: Optional[Any] = None,
+    ) -> None:
+        """Draws the background for a camera offset, timed as "background"."""
+        if profiler:
+            with profiler.phase("background"):
+                self.draw_layers(surface, camera_x, camera_y, darkness)
+        else:
+            self.draw_layers(surface, camera_x, camera_y, darkness)
+
+    def draw_layers(
+        self,
+        surface: pygame.Surface,
+        camera_x: float,
+        camera_y: float,
+        darkness: Optional[Any] = None,
+    ) -> None:
+        screen_w, screen_h = surface.get_size()
+        level = darkness.level if darkness is not None else 0
+        tint = darkness is not None and darkness.active
+        if tint and not level:
+            # the composite may hide them, queue every strip for the night
+            darkness.queue(self.surfaces)
+        key = (level, self.placements(camera_x, camera_y, screen_w, screen_h))
+
+        if key == self.composite_key and self.composite is not None:
+            surface.blit(self.composite, (0, 0))
+            self.reused += 1
+            return
+
+        blits = []
+        for pieces, (left, right, y) in zip(self.pieces, key[1]):
+            for piece, dx, dy in pieces:
+                if tint:
+                    piece = darkness.tint(piece)
+                blits.append((piece, (left + dx, y + dy)))
+                if right is not None:
+                    blits.append((piece, (right + dx, y + dy)))
+        surface.blits(blits, doreturn=False)
+        self.redrawn += 1
+
+        # same placement two frames in a row: the camera has settled, keep
+        # the result (moving frames never pay for the copy)
+        if key == self.last_key:
+            if self.composite is None or self.composite.get_size() != (
+                screen_w,
+                screen_h,
+            ):
+                # same pixel format as the screen, so both blits are copies
+                self.composite = pygame.Surface((screen_w, screen_h), 0, surface)
+            self.composite.blit(surface, (0, 0))
+            self.composite_key = key
+        self.last_key = key
+
+    def stats(self) -> Dict[str, int]:
+        return {"reused": self.reused, "redrawn": self.redrawn}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Report memory and blit time of each parallax layer."
+    )
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=GAME_HEIGHT)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    screen = pygame.display.set_mode((args.width, args.height))
+    bg_w = int(args.width * BG_ZOOM_FACTOR)
+    bg_h = int(args.height * BG_ZOOM_FACTOR)
+    y = (args.height - bg_h) // 2
+
+    def blit_ms(pieces: List[Piece]) -> float:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            screen.blits([(p, (dx, y + dy)) for p, dx, dy in pieces], doreturn=False)
+        return (time.perf_counter() - start) * 1000 / args.repeat
+
+    print(f"{'layer':<20}{'MiB':>7}{'-> MiB':>8}{'ms':>8}{'-> ms':>8}  strips")
+    for filename, _, transparency in PARALLAX_LAYERS:
+        image = load_bg(filename, (bg_w, bg_h), transparency)
+        pieces = split_layer(image)
+        before = surface_bytes(image) / 2**20
+        after = sum(surface_bytes(piece) for piece, _, _ in pieces) / 2**20
+        print(
+            f"{filename:<20}{before:>7.1f}{after:>8.1f}"
+            f"{blit_ms([(image, 0, 0)]):>8.2f}{blit_ms(pieces):>8.2f}  {len(pieces)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
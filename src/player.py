@@ -1,34 +1,49 @@
 # @generated "partially" Gemini: Added docstrings and type annotations
 import os
-from typing import Optional, Callable, Dict, List
+from typing import Optional, Callable, Dict, List, Tuple
 
 import pygame
 
+from bullet import Bullet
+from collision_world import CollisionWorld
+from game_clock import get_ticks
+from utils import has_display, load_image, load_sound
+
 
 class Player(pygame.sprite.Sprite):
     """
     The main character controlled by the user. Handles movement, shooting, health, and upgrades.
     """
 
+    # (scale, converted to the display format) -> (animations, hidden_frames),
+    # so level restarts skip the disk
+    _ASSET_CACHE: Dict[
+        Tuple[Optional[float], bool],
+        Tuple[Dict[str, List[pygame.Surface]], Dict[Tuple[int, int], pygame.Surface]],
+    ] = {}
+
     def __init__(
-        self, pos_x: int, pos_y: int, scale_factor: Optional[float] = None
+        self,
+        pos_x: int,
+        pos_y: int,
+        scale_factor: Optional[float] = None,
+        sound: bool = True,
     ) -> None:
         super().__init__()
         self.z = 2
         self.animations: Dict[str, List[pygame.Surface]] = {}
+        self.hidden_frames: Dict[Tuple[int, int], pygame.Surface] = {}
         self.import_character_assets(scale_factor)
 
         # Load bullet assets
-        self.bullet_surf = pygame.image.load(
-            os.path.join("assets", "bullet.png")
-        ).convert_alpha()
-        self.shoot_sound = pygame.mixer.Sound(
-            os.path.join("assets", "sound", "bullet_sound.wav")
-        )
-        self.shoot_sound.set_volume(0.4)
-
-        self.hit_sound = pygame.mixer.Sound(os.path.join("assets", "sound", "hit.wav"))
-        self.hit_sound.set_volume(0.5)
+        self.bullet_surf = Bullet.load_source("bullet.png")
+        self.shoot_sound: Optional[pygame.mixer.Sound] = None
+        self.hit_sound: Optional[pygame.mixer.Sound] = None
+        if sound:
+            self.shoot_sound = load_sound(
+                os.path.join("assets", "sound", "bullet_sound.wav"), 0.4
+            )
+            self.hit_sound = load_sound(os.path.join("assets", "sound", "hit.wav"), 0.5)
 
         # movement
         self.direction = pygame.math.Vector2(0, 0)
@@ -80,13 +95,23 @@ class Player(pygame.sprite.Sprite):
         self.image = self.animations["idle"][self.frame_index]
         self.rect = self.image.get_rect(midbottom=(pos_x, pos_y))
 
-        self.last_update_time = pygame.time.get_ticks()
+        self.last_update_time = get_ticks()
 
     def import_character_assets(self, scale: Optional[float]) -> None:
-        """Loads animation frames from folders."""
+        """
+        Loads animation frames from folders, plus pre-flipped left-facing
+        copies ("idle_left", "run_left") and fully transparent frames used
+        by the invincibility flicker.
+        Uses caching to avoid disk I/O when a level is rebuilt.
+        """
+        cache_key = (scale, has_display())
+        if cache_key in Player._ASSET_CACHE:
+            self.animations, self.hidden_frames = Player._ASSET_CACHE[cache_key]
+            return
+
         self.animations = {"idle": [], "run": []}
 
-        for animation in self.animations:
+        for animation in ("idle", "run"):
             full_path = os.path.join("assets", "player", animation)
             self.animations[animation] = []
 
@@ -95,7 +120,7 @@ class Player(pygame.sprite.Sprite):
 
                 for file in files:
                     img_path = os.path.join(full_path, file)
-                    image = pygame.image.load(img_path).convert_alpha()
+                    image = load_image(img_path)
 
                     rect = image.get_bounding_rect()
                     rect = rect.inflate(2, 2).clamp(image.get_rect())
@@ -113,13 +138,26 @@ class Player(pygame.sprite.Sprite):
             except FileNotFoundError:
                 print(f"Error: Folder not found at {full_path}")
 
+            self.animations[f"{animation}_left"] = [
+                pygame.transform.flip(image, True, False)
+                for image in self.animations[animation]
+            ]
+
+        sizes = {image.get_size() for image in self.animations["idle"]}
+        sizes.update(image.get_size() for image in self.animations["run"])
+        self.hidden_frames = {
+            size: pygame.Surface(size, pygame.SRCALPHA) for size in sizes
+        }
+
+        Player._ASSET_CACHE[cache_key] = (self.animations, self.hidden_frames)
+
     def get_input(self, create_bullet_callback: Callable) -> None:
         """Checks keyboard/mouse input for movement, actions, and upgrades."""
         if self.is_dead:
             return
 
         keys = pygame.key.get_pressed()
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
 
         just_pressed_e = keys[pygame.K_e] and not self.previous_keys[pygame.K_e]
         just_pressed_c = keys[pygame.K_c] and not self.previous_keys[pygame.K_c]
@@ -139,7 +177,8 @@ class Player(pygame.sprite.Sprite):
         # shooting
         if pygame.mouse.get_pressed()[0]:
             if current_time - self.last_shoot_time >= self.shoot_cooldown:
-                self.shoot_sound.play()
+                if self.shoot_sound:
+                    self.shoot_sound.play()
                 direction = 1 if self.facing_right else -1
                 bullet_y = self.rect.centery + 10
 
@@ -194,7 +233,7 @@ class Player(pygame.sprite.Sprite):
                 self.hit_sound.play()
             self.current_health -= amount
             self.invincible = True
-            self.hit_time = pygame.time.get_ticks()
+            self.hit_time = get_ticks()
 
             self.direction.y = -10  # Knockback
 
@@ -222,7 +261,7 @@ class Player(pygame.sprite.Sprite):
     def passive_regeneration(self) -> None:
         """Regenerates health over time if upgrade is purchased."""
         if self.regen_level > 0 and not self.is_dead:
-            current_time = pygame.time.get_ticks()
+            current_time = get_ticks()
             if current_time - self.last_regen_time >= 1000:
                 heal_amount = self.regen_level
 
@@ -236,10 +275,9 @@ class Player(pygame.sprite.Sprite):
     def invincibility_timer(self) -> None:
         """Disables invincibility after the duration expires."""
         if self.invincible:
-            current_time = pygame.time.get_ticks()
+            current_time = get_ticks()
             if current_time - self.hit_time >= self.invincibility_duration:
                 self.invincible = False
-                self.image.set_alpha(255)
 
     def jump(self) -> None:
         self.direction.y = self.jump_speed
@@ -248,32 +286,32 @@ class Player(pygame.sprite.Sprite):
         self.direction.y += self.gravity
         self.rect.y += self.direction.y
 
-    def check_horizontal_collisions(self, tiles: pygame.sprite.Group) -> None:
+    def check_horizontal_collisions(self, world: CollisionWorld) -> None:
         """Handles collisions on the X axis."""
         self.rect.x += self.direction.x * self.speed
 
-        for tile in tiles:
-            # Check is_solid property (default to True if attribute missing)
-            if getattr(tile, "is_solid", True):
-                if tile.rect.colliderect(self.rect):
-                    if self.direction.x > 0:  # right
-                        self.rect.right = tile.rect.left
-                    elif self.direction.x < 0:  # left
-                        self.rect.left = tile.rect.right
+        cells = world.solid_cells(self.rect)
+        if cells:
+            size = world.cell_size
+            if self.direction.x > 0:  # right
+                self.rect.right = min(col for col, _ in cells) * size
+            elif self.direction.x < 0:  # left
+                self.rect.left = (max(col for col, _ in cells) + 1) * size
 
-    def check_vertical_collisions(self, tiles: pygame.sprite.Group) -> None:
+    def check_vertical_collisions(self, world: CollisionWorld) -> None:
         """Handles collisions on the Y axis (gravity)."""
         self.apply_gravity()
 
-        for tile in tiles:
-            if getattr(tile, "is_solid", True):
-                if tile.rect.colliderect(self.rect):
-                    if self.direction.y > 0:  # falling
-                        self.rect.bottom = tile.rect.top
-                        self.direction.y = 0
-                    elif self.direction.y < 0:  # ceiling
-                        self.rect.top = tile.rect.bottom
-                        self.direction.y = 0
+        cells = world.solid_cells(self.rect)
+        if cells:
+            size = world.cell_size
+            # cells come row by row, so the first is the highest one
+            if self.direction.y > 0:  # falling
+                self.rect.bottom = cells[0][1] * size
+                self.direction.y = 0
+            elif self.direction.y < 0:  # ceiling
+                self.rect.top = (cells[-1][1] + 1) * size
+                self.direction.y = 0
 
     def get_status(self) -> None:
         """Updates the animation state based on movement."""
@@ -286,8 +324,11 @@ class Player(pygame.sprite.Sprite):
 
     def animate(self) -> None:
         """Updates the sprite image based on the current frame index."""
-        animation = self.animations[self.status]
-        current_time = pygame.time.get_ticks()
+        if self.facing_right:
+            animation = self.animations[self.status]
+        else:
+            animation = self.animations[f"{self.status}_left"]
+        current_time = get_ticks()
 
         if self.status == "idle":
             if self.frame_index in (6, 7, 8, 9, 10):
@@ -303,29 +344,23 @@ class Player(pygame.sprite.Sprite):
                 self.frame_index = 0
             self.last_update_time = current_time
 
-        current_image = animation[self.frame_index]
+        self.image = animation[self.frame_index]
 
-        if not self.facing_right:
-            self.image = pygame.transform.flip(current_image, True, False)
-        else:
-            self.image = current_image
+        if self.invincible and (current_time // 100) % 2 == 0:
+            # flicker every 100ms by swapping in a transparent frame of the
+            # same size (the cached frames themselves are never modified)
+            self.image = self.hidden_frames[self.image.get_size()]
 
-        if self.invincible:
-            # flicker every 100ms
-            alpha = 0 if (current_time // 100) % 2 == 0 else 255
-            self.image.set_alpha(alpha)
-        else:
-            self.image.set_alpha(255)
         previous_feet_position = self.rect.midbottom
         self.rect = self.image.get_rect()
         self.rect.midbottom = previous_feet_position
 
     def draw_bars(
         self, surface: pygame.Surface, offset_x: float, offset_y: float
-    ) -> None:
-        """Draws health and stamina bars above the player."""
+    ) -> List[pygame.Rect]:
+        """Draws health and stamina bars above the player, returns their rects."""
         if self.is_dead:
-            return
+            return []
         bar_width = 50
         bar_height = 6
 
@@ -356,9 +391,10 @@ class Player(pygame.sprite.Sprite):
         pygame.draw.rect(surface, (60, 60, 60), st_bg_rect)
         pygame.draw.rect(surface, st_color, st_fill_rect)
         pygame.draw.rect(surface, (0, 0, 0), st_bg_rect, 1)
+        return [hp_bg_rect, st_bg_rect]
 
     def update(
-        self, tiles: pygame.sprite.Group, create_bullet_callback: Callable
+        self, world: CollisionWorld, create_bullet_callback: Callable
     ) -> None:
         """Main update loop for the player."""
         self.get_input(create_bullet_callback)
@@ -366,8 +402,8 @@ class Player(pygame.sprite.Sprite):
         self.passive_regeneration()
         self.invincibility_timer()
         self.get_status()
-        self.check_horizontal_collisions(tiles)
-        self.check_vertical_collisions(tiles)
+        self.check_horizontal_collisions(world)
+        self.check_vertical_collisions(world)
         self.animate()
 
         self.previous_keys = pygame.key.get_pressed()
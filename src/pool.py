@@ -0,0 +1,70 @@
+from typing import Any, Callable, Dict, List, Set
+
+
+class SpritePool:
+    """
+    Free list of sprites that are reset and reused instead of reallocated.
+
+    Pooled classes take the same arguments in __init__ and reset(), and call
+    pool.release(self) from kill(), so every way a sprite can die hands it
+    back. Releasing twice (e.g. a bullet hitting two tiles in one update) is
+    a no-op.
+    """
+
+    def __init__(self, factory: Callable[..., Any], spare: Callable[[], Any]) -> None:
+        """
+        Args:
+            factory: Builds a new sprite from the acquire() arguments.
+            spare: Builds a placeholder sprite for reserve(); it is reset on use.
+        """
+        self.factory = factory
+        self.spare = spare
+        self.free: List[Any] = []
+        self.active: Set[Any] = set()
+
+        self.hits = 0  # acquired from the free list
+        self.misses = 0  # had to allocate
+        self.high_water = 0  # most sprites in use at once
+
+    def __len__(self) -> int:
+        return len(self.free) + len(self.active)
+
+    def acquire(self, *args: Any, **kwargs: Any) -> Any:
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args, **kwargs)
+            self.hits += 1
+        else:
+            sprite = self.factory(*args, **kwargs)
+            sprite.pool = self
+            self.misses += 1
+        self.active.add(sprite)
+        if len(self.active) > self.high_water:
+            self.high_water = len(self.active)
+        return sprite
+
+    def release(self, sprite: Any) -> None:
+        if sprite in self.active:
+            self.active.remove(sprite)
+            self.free.append(sprite)
+
+    def release_all(self) -> None:
+        """Returns every sprite (used when the groups are emptied without kill())."""
+        self.free.extend(self.active)
+        self.active.clear()
+
+    def reserve(self, count: int) -> None:
+        """Allocates spare sprites until the pool holds at least count of them."""
+        for _ in range(count - len(self)):
+            sprite = self.spare()
+            sprite.pool = self
+            self.free.append(sprite)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "high_water": self.high_water,
+            "in_use": len(self.active),
+            "free": len(self.free),
+        }
@@ -0,0 +1,84 @@
+"""
+Lightweight per-frame phase timing.
+"""
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, List, Sequence
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Returns the pct-th percentile (0-100) using linear interpolation."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    low = int(k)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (k - low)
+
+
+class FrameProfiler:
+    """
+    Records how long each named phase takes per frame (in milliseconds)
+    and keeps a rolling history of the last frames. While disabled, phases
+    are not timed and frames are not recorded.
+    """
+
+    def __init__(self, history: int = 600, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.current: Dict[str, float] = {}
+        self.frames: Deque[Dict[str, float]] = deque(maxlen=history)
+        self.frame_times: Deque[float] = deque(maxlen=history)
+        self._frame_start = time.perf_counter()
+
+    def begin_frame(self) -> None:
+        self.current = {}
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self) -> None:
+        if not self.enabled:
+            return
+        self.frame_times.append((time.perf_counter() - self._frame_start) * 1000)
+        self.frames.append(self.current)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Times the wrapped block and adds it to the current frame."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.current[name] = self.current.get(name, 0.0) + elapsed
+
+    def reset(self) -> None:
+        self.current = {}
+        self.frames.clear()
+        self.frame_times.clear()
+
+    def phase_names(self) -> List[str]:
+        names: Dict[str, None] = {}
+        for frame in self.frames:
+            names.update(dict.fromkeys(frame))
+        return list(names)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Returns p50/p95/p99/mean (ms) for the whole frame and each phase."""
+
+        def stats(values: List[float]) -> Dict[str, float]:
+            return {
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "p99": percentile(values, 99),
+                "mean": sum(values) / len(values) if values else 0.0,
+            }
+
+        result = {"frame": stats(list(self.frame_times))}
+        for name in self.phase_names():
+            result[name] = stats([frame.get(name, 0.0) for frame in self.frames])
+        return result
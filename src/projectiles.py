@@ -0,0 +1,224 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import pygame
+
+from bullet import Bullet
+from collision_world import CollisionWorld
+from game_clock import get_ticks
+
+# per-projectile columns, all kept in spawn order
+FIELDS: Dict[str, Any] = {
+    "x": np.float64,  # left edge
+    "y": np.float64,  # top edge
+    "vx": np.float64,
+    "vy": np.float64,
+    "gravity": np.float64,
+    "damage": np.int64,
+    "direction": np.int8,
+    "spawn_time": np.int64,
+    "w": np.int32,
+    "h": np.int32,
+    "image": np.int32,
+    "alive": np.bool_,
+}
+
+
+class ProjectileArrays:
+    """
+    Structure-of-arrays alternative to a group of Bullet sprites.
+
+    Every projectile is one row in a set of NumPy columns, so moving,
+    tile collision, lifetime and bounds checks are a handful of vectorized
+    operations for the whole batch. Dead rows are compacted away in bulk,
+    which keeps the surviving projectiles in spawn order (the order the
+    sprite group would iterate them in).
+
+    Behaves like Bullet: 12 px per frame horizontally, arced shots start at
+    vy = -6, projectiles die on solid tiles, after 1500 ms or below y = 2000.
+    """
+
+    speed = 12
+    life_time = 1500
+    max_y = 2000
+
+    def __init__(self, capacity: int = 256) -> None:
+        self.count = 0
+        self.capacity = capacity
+        self.columns: Dict[str, np.ndarray] = {
+            name: np.zeros(capacity, dtype) for name, dtype in FIELDS.items()
+        }
+        # oriented bullet images, referenced by index from the "image" column
+        self.images: List[pygame.Surface] = []
+        self.image_ids: Dict[pygame.Surface, int] = {}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        # live view of a column, e.g. arrays.x
+        columns = self.__dict__.get("columns")
+        if columns is None or name not in columns:
+            raise AttributeError(name)
+        return columns[name][: self.count]
+
+    def empty(self) -> None:
+        self.count = 0
+
+    def image_id(self, surf: pygame.Surface, direction: int) -> int:
+        image = Bullet.get_sprite(surf, direction)
+        index = self.image_ids.get(image)
+        if index is None:
+            index = self.image_ids[image] = len(self.images)
+            self.images.append(image)
+        return index
+
+    def grow(self) -> None:
+        self.capacity *= 2
+        for name, column in self.columns.items():
+            grown = np.zeros(self.capacity, column.dtype)
+            grown[: self.count] = column[: self.count]
+            self.columns[name] = grown
+
+    def spawn(
+        self,
+        x: int,
+        y: int,
+        direction: int,
+        surf: pygame.Surface,
+        damage: int = 10,
+        gravity: float = 0,
+    ) -> None:
+        """Adds a projectile centered on (x, y); same arguments as Bullet."""
+        if self.count == self.capacity:
+            self.grow()
+        image = self.image_id(surf, direction)
+        w, h = self.images[image].get_size()
+
+        i = self.count
+        c = self.columns
+        c["x"][i] = x - w // 2
+        c["y"][i] = y - h // 2
+        c["vx"][i] = direction * self.speed
+        c["vy"][i] = -6 if gravity > 0 else 0
+        c["gravity"][i] = gravity
+        c["damage"][i] = damage
+        c["direction"][i] = direction
+        c["spawn_time"][i] = get_ticks()
+        c["w"][i] = w
+        c["h"][i] = h
+        c["image"][i] = image
+        c["alive"][i] = True
+        self.count += 1
+
+    def cull(self) -> None:
+        """Drops every dead projectile in one stable compaction."""
+        n = self.count
+        alive = self.columns["alive"][:n]
+        keep = np.flatnonzero(alive)
+        if len(keep) == n:
+            return
+        for column in self.columns.values():
+            column[: len(keep)] = column[keep]
+        self.count = len(keep)
+
+    def update(self, world: CollisionWorld) -> None:
+        """Moves all projectiles one frame, killing expired ones and wall hits."""
+        if not self.count:
+            return
+        x, y, vy = self.x, self.y, self.vy
+        gravity = self.gravity
+
+        x += self.vx
+        arced = gravity > 0
+        vy += np.where(arced, gravity, 0)
+        y += np.where(arced, vy, 0)
+
+        alive = self.alive
+        alive &= get_ticks() - self.spawn_time <= self.life_time
+        alive &= y <= self.max_y
+        _, _, solid = world.box_cells(x, y, self.w, self.h)
+        alive &= ~solid.any(axis=(1, 2))
+
+        self.cull()
+
+    def collide(self, enemies: Iterable[Any]) -> Dict[Any, List[int]]:
+        """
+        Kills projectiles overlapping enemies and returns enemy -> damages.
+
+        Same pairing as pygame.sprite.groupcollide(enemies, bullets, False, True):
+        enemies are visited in group order and a projectile only counts for
+        the first enemy it overlaps.
+        """
+        hits: Dict[Any, List[int]] = {}
+        if not self.count:
+            return hits
+        enemies = list(enemies)
+        if not enemies:
+            return hits
+
+        # projectiles sorted by left edge; an enemy only has to look at the
+        # ones starting in [enemy.left - widest projectile, enemy.right)
+        x = self.x
+        order = np.argsort(x, kind="stable")
+        sorted_x = x[order]
+        max_w = int(self.w.max())
+        e_left = np.array([e.rect.left for e in enemies], np.float64)
+        e_right = np.array([e.rect.right for e in enemies], np.float64)
+        starts = np.searchsorted(sorted_x, e_left - max_w, side="right")
+        ends = np.searchsorted(sorted_x, e_right, side="left")
+
+        y, w, h, damage = self.y, self.w, self.h, self.damage
+        alive = self.alive
+        for i in np.flatnonzero(ends > starts):
+            enemy = enemies[i]
+            rect = enemy.rect
+            candidates = order[starts[i] : ends[i]]
+            overlap = (
+                alive[candidates]
+                & (x[candidates] + w[candidates] > rect.left)
+                & (y[candidates] < rect.bottom)
+                & (y[candidates] + h[candidates] > rect.top)
+            )
+            if not overlap.any():
+                continue
+            # back to spawn order, as the sprite group iterates bullets
+            collided = np.sort(candidates[overlap])
+            alive[collided] = False
+            hits[enemy] = damage[collided].tolist()
+
+        self.cull()
+        return hits
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        offset_x: float,
+        offset_y: float,
+        tint: Optional[Callable[[pygame.Surface], pygame.Surface]] = None,
+    ) -> None:
+        """Blits every on-screen projectile in one call, tinted if given."""
+        if not self.count:
+            return
+        sx = self.x - offset_x
+        sy = self.y - offset_y
+        screen_w, screen_h = surface.get_size()
+        visible = np.flatnonzero(
+            (sx > -self.w) & (sx < screen_w) & (sy > -self.h) & (sy < screen_h)
+        )
+        if not len(visible):
+            return
+        images = self.images
+        if tint is not None:
+            images = [tint(image) for image in images]
+        surface.blits(
+            [
+                (images[image], (px, py))
+                for image, px, py in zip(
+                    self.image[visible].tolist(),
+                    sx[visible].tolist(),
+                    sy[visible].tolist(),
+                )
+            ],
+            doreturn=False,
+        )
@@ -3,11 +3,35 @@
 Global settings and constants for the game.
 """
 
+from typing import List, Tuple
+
 GAME_HEIGHT: int = 1080
 TILE_SIZE: int = 128
 MAP_WIDTH: int = 150
 BORDER_LEFT_INDEX: int = 10
 BORDER_RIGHT_INDEX: int = 140
+TERRAIN_CHUNK_COLS: int = 8  # tile columns baked into one terrain surface
+STREAM_CHUNK_COLS: int = 16  # map columns whose sprites are created together
+STREAM_MARGIN_CHUNKS: int = 1  # chunks loaded past the view on each side
+STREAM_KEEP_CHUNKS: int = 3  # chunks past the view before one is evicted
+# fog clouds wrap around the view this far past its edges (wider than a cloud)
+CLOUD_VIEW_MARGIN: int = 512
+# enemy x bullet pairs above which collisions go through the spatial hash
+COLLISION_HASH_MIN_PAIRS: int = 20000
+# move projectiles as NumPy arrays (ProjectileArrays) instead of Bullet sprites
+ARRAY_PROJECTILES: bool = False
+# run enemy AI and physics batched in NumPy (EnemyStore) instead of per sprite
+ARRAY_ENEMIES: bool = False
+
+# parallax background layers, back to front: (file in assets/background,
+# speed relative to the camera, has transparency)
+PARALLAX_LAYERS: List[Tuple[str, float, bool]] = [
+    ("background1.png", 0.05, False),
+    ("background4a.png", 0.09, True),
+    ("background4b.png", 0.11, True),
+    ("background3.png", 0.15, True),
+]
+BG_ZOOM_FACTOR: float = 1.2  # background size relative to the screen
 
 # Day/Night cycle settings
 DAY_CYCLE_LENGTH: int = (
@@ -16,4 +40,11 @@ DAY_CYCLE_LENGTH: int = (
 NIGHT_START_THRESHOLD: float = 0.3  # Cycle point (0.0 to 1.0) where dusk begins
 NIGHT_END_THRESHOLD: float = 0.95  # Cycle point where dawn begins
 MAX_DARKNESS: int = 130  # Alpha value (0-255). Higher is darker.
+DARKNESS_COLOR: Tuple[int, int, int] = (10, 10, 35)
+# frames the darkness must hold still before the world is drawn pre-tinted
+DARKNESS_HOLD_FRAMES: int = 30
+# surface pixels tinted per frame ahead of the night (one terrain chunk, a few
+# ms of blits)
+DARKNESS_TINT_PIXELS: int = 1 << 19
+TEXT_CACHE_SIZE: int = 256  # rendered text surfaces kept for the HUD and menus
 CELEBRATION_DURATION: int = 250
@@ -0,0 +1,87 @@
+"""
+Headless simulation runner.
+
+Builds a Level without a window and steps it as fast as the CPU allows, using
+the fixed-step frame clock so in-game timers behave as they would at 60 FPS.
+
+    python simulation.py --days 30
+"""
+
+import argparse
+import os
+import time
+from typing import Optional, Tuple
+
+import pygame
+
+import game_clock
+from level import Level
+from map_loader import Layout, MapFile
+from settings import DAY_CYCLE_LENGTH, GAME_HEIGHT
+from tile import Tile
+
+HEADLESS_SIZE: Tuple[int, int] = (1920, GAME_HEIGHT)
+
+
+def init_headless() -> None:
+    """Initializes pygame with dummy video/audio drivers (no window is opened)."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+
+
+def create_level(
+    level_data: Optional[Layout] = None,
+    size: Tuple[int, int] = HEADLESS_SIZE,
+) -> Level:
+    """Builds a headless Level driven by the frame clock."""
+    if level_data is None:
+        from utils import tower_defense_map
+
+        level_data = tower_defense_map
+
+    game_clock.use_frame_clock()
+    return Level(level_data, pygame.Surface(size), headless=True)
+
+
+def run_frames(level: Level, frames: int, is_menu: bool = False) -> float:
+    """
+    Steps the level for a number of frames without any frame limiting.
+
+    Returns:
+        Wall-clock seconds spent.
+    """
+    start = time.perf_counter()
+    for _ in range(frames):
+        pygame.event.pump()
+        game_clock.tick()
+        level.run(is_menu=is_menu)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the game without a display.")
+    parser.add_argument("--days", type=int, default=1, help="in-game days to run")
+    parser.add_argument("--frames", type=int, help="overrides --days")
+    parser.add_argument("--map", help="binary .map file (default: a generated map)")
+    args = parser.parse_args()
+
+    frames = args.frames if args.frames else args.days * DAY_CYCLE_LENGTH
+
+    init_headless()
+    level = create_level(MapFile(args.map) if args.map else None)
+    elapsed = run_frames(level, frames)
+
+    player = level.player.sprite
+    game_seconds = frames / 60
+    print(f"frames: {frames} ({elapsed:.2f}s, {game_seconds / elapsed:.1f}x real time)")
+    print(f"day: {level.day_count}  score: {player.score}  dead: {player.is_dead}")
+    print(f"enemies: {len(level.enemies)}  bullets: {level.bullet_count()}")
+    for name, stats in level.pool_stats().items():
+        print(f"{name} pool: " + "  ".join(f"{k}: {v}" for k, v in stats.items()))
+    stats = Tile.cache_stats()
+    print("tile cache: " + "  ".join(f"{k}: {v}" for k, v in stats.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+import pygame
+
+
+class SpatialHash:
+    """
+    Uniform grid of world cells used as a collision broadphase.
+
+    Sprites are hashed into every cell their rect overlaps, so a query only
+    looks at sprites sharing a cell with the given rect. Results come back in
+    insertion order, which keeps collision handling as deterministic as
+    iterating the original group.
+    """
+
+    def __init__(self, cell_size: int) -> None:
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[Any]] = {}
+        self.order: Dict[Any, int] = {}
+
+    def cell_keys(self, rect: pygame.Rect) -> List[Tuple[int, int]]:
+        size = self.cell_size
+        left, right = int(rect.left // size), int((rect.right - 1) // size)
+        top, bottom = int(rect.top // size), int((rect.bottom - 1) // size)
+        return [
+            (cx, cy) for cx in range(left, right + 1) for cy in range(top, bottom + 1)
+        ]
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self.order.clear()
+
+    def insert(self, sprite: Any) -> None:
+        self.order[sprite] = len(self.order)
+        for key in self.cell_keys(sprite.rect):
+            bucket = self.cells.get(key)
+            if bucket is None:
+                self.cells[key] = [sprite]
+            else:
+                bucket.append(sprite)
+
+    def rebuild(self, sprites: Iterable[Any]) -> None:
+        """Re-hashes all sprites (called once per frame)."""
+        self.clear()
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def query(self, rect: pygame.Rect) -> List[Any]:
+        """Returns sprites sharing at least one cell with rect (broadphase only)."""
+        found: Dict[Any, None] = {}
+        for key in self.cell_keys(rect):
+            bucket = self.cells.get(key)
+            if bucket:
+                found.update(dict.fromkeys(bucket))
+        if len(found) > 1:
+            return sorted(found, key=self.order.__getitem__)
+        return list(found)
+
+    def collide(self, rect: pygame.Rect) -> List[Any]:
+        """Returns sprites whose rect overlaps the given rect."""
+        return [sprite for sprite in self.query(rect) if rect.colliderect(sprite.rect)]
+
+
+def groupcollide(
+    hash_a: SpatialHash, group_b: Iterable[Any], dokill_b: bool
+) -> Dict[Any, List[Any]]:
+    """
+    Same result as pygame.sprite.groupcollide(group_a, group_b, False, dokill_b)
+    where hash_a holds group_a.
+
+    Each sprite of group_b queries the hash once, then the pairs are replayed
+    in group_a order: with dokill_b, a sprite of group_b only counts for the
+    first sprite of group_a it overlaps.
+    """
+    pairs: Dict[Any, List[Any]] = {}
+    for other in group_b:
+        for sprite in hash_a.collide(other.rect):
+            pairs.setdefault(sprite, []).append(other)
+
+    hits: Dict[Any, List[Any]] = {}
+    killed: Set[Any] = set()
+    for sprite in sorted(pairs, key=hash_a.order.__getitem__):
+        collided = [other for other in pairs[sprite] if other not in killed]
+        if not collided:
+            continue
+        if dokill_b:
+            for other in collided:
+                other.kill()
+            killed.update(collided)
+        hits[sprite] = collided
+    return hits
@@ -0,0 +1,107 @@
+import math
+from typing import Callable, Dict, Optional, Set, Tuple
+
+import pygame
+
+
+class TerrainChunks:
+    """
+    Static tiles baked into fixed-width column chunks.
+
+    Each chunk is one surface holding every tile that overlaps its column range,
+    painted by the tiles' paint_order and then in the order they were added (so
+    overlapping decor keeps the same stacking as per-tile drawing, whichever
+    order streamed tiles arrive in). A chunk is re-baked lazily, the next time
+    it is on screen after one of its tiles was added or removed.
+    """
+
+    def __init__(self, chunk_width: int) -> None:
+        self.chunk_width = chunk_width
+        # chunk index -> tiles overlapping it (dict used as an ordered set)
+        self.chunk_tiles: Dict[int, Dict[pygame.sprite.Sprite, None]] = {}
+        # chunk index -> (baked surface, world y of its top edge)
+        self.surfaces: Dict[int, Tuple[pygame.Surface, int]] = {}
+        self.dirty: Set[int] = set()
+
+    def chunk_range(self, rect: pygame.Rect) -> range:
+        return range(
+            rect.left // self.chunk_width, (rect.right - 1) // self.chunk_width + 1
+        )
+
+    def add(self, tile: pygame.sprite.Sprite) -> None:
+        for index in self.chunk_range(tile.rect):
+            self.chunk_tiles.setdefault(index, {})[tile] = None
+            self.dirty.add(index)
+
+    def remove(self, tile: pygame.sprite.Sprite) -> None:
+        for index in self.chunk_range(tile.rect):
+            tiles = self.chunk_tiles.get(index)
+            if tiles and tile in tiles:
+                del tiles[tile]
+                if tiles:
+                    self.dirty.add(index)
+                else:
+                    # evicted chunks release their surface right away
+                    del self.chunk_tiles[index]
+                    self.surfaces.pop(index, None)
+                    self.dirty.discard(index)
+
+    def clear(self) -> None:
+        self.chunk_tiles.clear()
+        self.surfaces.clear()
+        self.dirty.clear()
+
+    def bake(self, index: int) -> None:
+        """Renders all tiles of a chunk into a single surface."""
+        self.dirty.discard(index)
+        tiles = self.chunk_tiles.get(index)
+        if not tiles:
+            self.chunk_tiles.pop(index, None)
+            self.surfaces.pop(index, None)
+            return
+
+        top = min(tile.rect.top for tile in tiles)
+        bottom = max(tile.rect.bottom for tile in tiles)
+        chunk_x = index * self.chunk_width
+
+        surf = pygame.Surface((self.chunk_width, bottom - top), pygame.SRCALPHA)
+        for tile in sorted(tiles, key=lambda tile: tile.paint_order):
+            surf.blit(tile.image, (tile.rect.x - chunk_x, tile.rect.y - top))
+
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+        # chunks are mostly fully opaque or fully transparent pixels, which
+        # RLE-encoded alpha blits skip or copy instead of blending
+        surf.set_alpha(255, pygame.RLEACCEL)
+        self.surfaces[index] = (surf, top)
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        offset: pygame.math.Vector2,
+        tint: Optional[Callable[[pygame.Surface], pygame.Surface]] = None,
+    ) -> None:
+        """
+        Blits the chunks overlapping the viewport, re-baking dirty ones first.
+        tint maps a baked surface to the one to draw (darkness at night).
+        """
+        screen_w, screen_h = surface.get_size()
+        first = int(offset.x // self.chunk_width)
+        last = int((offset.x + screen_w) // self.chunk_width)
+
+        for index in range(first, last + 1):
+            if index in self.dirty:
+                self.bake(index)
+            baked = self.surfaces.get(index)
+            if baked is None:
+                continue
+
+            chunk_surf, top = baked
+            # floor (not truncate) so chunks starting left of the screen land on
+            # the same pixels as their tiles would
+            pos_x = math.floor(index * self.chunk_width - offset.x)
+            pos_y = math.floor(top - offset.y)
+            if -chunk_surf.get_height() < pos_y < screen_h:
+                if tint is not None:
+                    chunk_surf = tint(chunk_surf)
+                surface.blit(chunk_surf, (pos_x, pos_y))
@@ -71,10 +71,30 @@ class MockRect:
     def centery(self, val):
         self.y = val - self.height // 2
 
+    @property
+    def center(self):
+        return (self.centerx, self.centery)
+
+    @center.setter
+    def center(self, val):
+        self.centerx, self.centery = val
+
+    @property
+    def size(self):
+        return (self.width, self.height)
+
+    @size.setter
+    def size(self, val):
+        self.width, self.height = val
+
     @property
     def topleft(self):
         return (self.x, self.y)
 
+    @topleft.setter
+    def topleft(self, val):
+        self.x, self.y = val
+
     @property
     def midbottom(self):
         return (self.centerx, self.bottom)
@@ -155,16 +175,25 @@ class MockSurface:
     def convert(self):
         return self
 
+    def premul_alpha(self):
+        return self
+
     def subsurface(self, rect):
         return self  # Return self to allow chaining
 
+    def copy(self):
+        return MockSurface(self.get_size())
+
+    def get_flags(self):
+        return 0
+
     def set_colorkey(self, color):
         pass
 
     def get_at(self, pos):
         return (0, 0, 0, 0)
 
-    def set_alpha(self, a):
+    def set_alpha(self, a, flags=0):
         pass
 
     def fill(self, color):
@@ -173,6 +202,9 @@ class MockSurface:
     def blit(self, source, dest, area=None, special_flags=0):
         pass
 
+    def blits(self, blit_sequence, doreturn=True):
+        pass
+
 
 class MockSprite:
     """
@@ -187,6 +219,9 @@ class MockSprite:
     def kill(self):
         pass
 
+    def alive(self):
+        return True
+
     def add(self, *groups):
         pass
 
@@ -204,8 +239,21 @@ class MockGroup(list):
 
     def add(self, *sprites):
         for s in sprites:
-            if s not in self:
-                self.append(s)
+            if isinstance(s, (list, tuple)):
+                self.add(*s)
+            elif s not in self:
+                self.add_internal(s)
+
+    def remove(self, *sprites):
+        for s in sprites:
+            if s in self:
+                self.remove_internal(s)
+
+    def add_internal(self, sprite, layer=None):
+        self.append(sprite)
+
+    def remove_internal(self, sprite):
+        list.remove(self, sprite)
 
     def empty(self):
         self.clear()
@@ -225,6 +273,52 @@ class MockGroup(list):
         pass
 
 
+class MockGroupSingle(MockGroup):
+    """
+    Simulates pygame.sprite.GroupSingle (holds at most one sprite).
+    """
+
+    def add(self, *sprites):
+        if sprites:
+            self.clear()
+            self.append(sprites[-1])
+
+    @property
+    def sprite(self):
+        return self[0] if self else None
+
+
+def make_sprite(x, y, w=128, h=128, **attrs):
+    """
+    MagicMock sprite with a real MockRect, for code that only reads rects.
+    Extra keyword arguments are set as attributes (e.g. current_health=10).
+    """
+    sprite = MagicMock()
+    sprite.rect = MockRect(x, y, w, h)
+    for name, value in attrs.items():
+        setattr(sprite, name, value)
+    return sprite
+
+
+def make_tile(x, y, w=128, h=128, solid=True, paint_order=0):
+    """Tile stand-in for the collision world and terrain chunks."""
+    tile = make_sprite(x, y, w, h, is_solid=solid, paint_order=paint_order)
+    tile.image = MockSurface((w, h))
+    return tile
+
+
+def brute_force_groupcollide(group_a, group_b):
+    """Reference: pygame.sprite.groupcollide(a, b, False, True)."""
+    remaining = list(group_b)
+    hits = {}
+    for a in group_a:
+        collided = [b for b in remaining if a.rect.colliderect(b.rect)]
+        if collided:
+            hits[a] = collided
+            remaining = [b for b in remaining if b not in collided]
+    return hits
+
+
 # --- 3. Mocking Modules ---
 
 # Create the mock pygame module
@@ -233,7 +327,7 @@ mock_pygame = MagicMock()
 # Replace classes with our Dummy implementations
 mock_pygame.sprite.Sprite = MockSprite
 mock_pygame.sprite.Group = MockGroup
-mock_pygame.sprite.GroupSingle = MockGroup
+mock_pygame.sprite.GroupSingle = MockGroupSingle
 mock_pygame.Rect = MockRect
 mock_pygame.Surface = MockSurface
 
@@ -0,0 +1,91 @@
+import random
+from unittest.mock import MagicMock
+
+from camera_group import CameraGroup
+from conftest import MockRect, MockSprite, MockSurface
+
+
+def make_drawable(x, y, z, name):
+    sprite = MockSprite()
+    sprite.rect = MockRect(x, y, 100, 100)
+    sprite.image = MockSurface()
+    sprite.image.name = name
+    sprite.z = z
+    return sprite
+
+
+def drawn_names(group):
+    surface = MagicMock()
+    group.display_surface = surface
+    group.custom_draw(None, show_player=False)
+    return [call.args[0].name for call in surface.blit.call_args_list]
+
+
+def make_group():
+    group = CameraGroup(MockSurface((1920, 1080)))
+    group.terrain = MagicMock()
+    group.update_camera = MagicMock()  # camera stays at (0, 0)
+    return group
+
+
+def test_sprites_are_drawn_in_layer_order():
+    group = make_group()
+    group.add(
+        make_drawable(100, 0, 3, "cloud"),
+        make_drawable(200, 0, 1, "enemy"),
+        make_drawable(300, 0, 2, "bullet"),
+        make_drawable(400, 0, 0, "decor"),
+        make_drawable(500, 0, 1, "tower"),
+        make_drawable(5000, 0, 1, "off screen"),
+    )
+    assert drawn_names(group) == ["decor", "enemy", "tower", "bullet", "cloud"]
+
+    removed = group.sprites()[1]
+    group.remove(removed)
+    assert drawn_names(group) == ["decor", "tower", "bullet", "cloud"]
+
+
+def per_layer_order(sprites, screen_w, screen_h):
+    """Reference: the per-layer render lists, walked in add order and culled."""
+    names = []
+    for z in range(4):
+        for sprite in sprites:
+            rect = sprite.rect
+            if (
+                sprite.z == z
+                and -rect.width < rect.x < screen_w
+                and -rect.height < rect.y < screen_h
+            ):
+                names.append(sprite.image.name)
+    return names
+
+
+def test_draw_order_matches_per_layer_lists_while_sprites_move():
+    rng = random.Random(5)
+    group = make_group()
+    sprites = [
+        make_drawable(rng.randint(-300, 2500), rng.randint(0, 900), z, f"s{i}")
+        for i, z in enumerate(rng.choice((1, 2, 3)) for _ in range(150))
+    ]
+    group.add(*sprites)
+
+    for _ in range(30):
+        for sprite in rng.sample(sprites, 20):
+            sprite.rect.x += rng.randint(-300, 300)
+        assert drawn_names(group) == per_layer_order(sprites, 1920, 1080)
+
+
+def test_only_sprites_that_changed_column_are_moved():
+    group = make_group()
+    still, mover = make_drawable(130, 0, 1, "still"), make_drawable(140, 0, 1, "mover")
+    group.add(still, mover)
+    assert list(group.grid[1]) == [1]
+
+    still.rect.x += 50  # same column
+    mover.rect.x += 500
+    group.refresh_cells()
+    assert group.grid[1] == {
+        1: {still: (0, False, False, still)},
+        5: {mover: (1, False, False, mover)},
+    }
+    assert group.moving_sprites == {still: 1, mover: 5}
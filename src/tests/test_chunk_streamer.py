@@ -0,0 +1,99 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from chunk_streamer import ChunkStreamer
+from settings import STREAM_CHUNK_COLS, TILE_SIZE
+
+W = 100  # chunk width
+
+
+def test_streamer_loads_near_view_and_evicts_with_hysteresis():
+    made = {}
+
+    def load(index):
+        made[index] = [MagicMock()]
+        return made[index]
+
+    streamer = ChunkStreamer(W, load, margin=1, keep=2)
+    streamer.reset(20)
+
+    streamer.update([(500, 650)])
+    assert set(streamer.loaded) == {4, 5, 6, 7}
+
+    # still within keep distance: nothing is evicted
+    streamer.update([(600, 750)])
+    assert set(streamer.loaded) == {4, 5, 6, 7, 8}
+    made[4][0].kill.assert_not_called()
+
+    streamer.update([(1000, 1050)])
+    assert set(streamer.loaded) == {8, 9, 10, 11}
+    for index in (4, 5, 6, 7):
+        made[index][0].kill.assert_called_once()
+    assert streamer.stats()["evictions"] == 4
+
+    # spans are clamped to the map
+    streamer.update([(1900, 2100), (-300, 0)])
+    assert set(streamer.loaded) == {0, 1, 18, 19}
+
+
+def test_level_streams_wide_map():
+    from conftest import MockSurface
+    from level import Level
+    from map_loader import compile_layout
+
+    row = compile_layout(["99," + ",".join(["0"] * 998) + ",99"])
+    ground = np.full((1, 1000), 1, np.uint16)
+    grid = np.vstack([np.zeros((7, 1000), np.uint16), row, ground])
+    # an enemy far away from the view
+    grid[6, 990] = 1001
+
+    lvl = Level(grid, MockSurface((1920, 1080)))
+    chunks = len(lvl.chunks.loaded)
+    assert 0 < chunks < 1000 // STREAM_CHUNK_COLS
+    assert len(lvl.tiles) < 1000
+
+    # collisions and enemies cover the whole map regardless
+    assert lvl.world.cols == 1000
+    assert lvl.world.is_solid(999, 7) and lvl.world.is_solid(999, 8)
+    assert len(lvl.enemies) == 1
+
+    lvl.visible_sprites.offset.x = 900 * TILE_SIZE
+    lvl.player.sprite.rect.centerx = 900 * TILE_SIZE
+    lvl.stream_chunks()
+    # the chunks around the start were evicted
+    assert min(lvl.chunks.loaded) > 800 // STREAM_CHUNK_COLS
+    assert len(lvl.chunks.loaded) <= chunks + 1
+
+
+def test_clouds_keep_covering_the_view():
+    import random
+
+    from conftest import MockSurface
+    from level import Level
+    from map_loader import compile_layout
+
+    random.seed(4)
+    row = compile_layout(["99," + ",".join(["0"] * 298) + ",99"])
+    grid = np.vstack([np.zeros((8, 300), np.uint16), row])
+    lvl = Level(grid, MockSurface((1920, 1080)))
+    camera = lvl.visible_sprites.offset
+    camera.x = 10000
+    viewport = (1920, 1080)
+    clouds = len(lvl.clouds)
+    assert clouds > 0
+
+    def on_screen():
+        return sum(
+            cloud.rect.right > camera.x and cloud.rect.left < camera.x + viewport[0]
+            for cloud in lvl.clouds
+        )
+
+    # a still camera, then one panning along the whole map
+    for frame in range(6000):
+        if frame >= 3000:
+            camera.x += 8
+        lvl.stream_chunks()
+        lvl.clouds.update(1.0, camera, viewport)
+        assert on_screen() >= clouds // 2
+    assert len(lvl.clouds) == clouds
@@ -0,0 +1,53 @@
+import numpy as np
+
+from collision_world import CollisionWorld
+from conftest import MockRect, make_tile
+
+T = 128
+
+
+def make_world():
+    floor = [make_tile(col * T, 8 * T, T, T) for col in range(10)]
+    wall = make_tile(5 * T, 7 * T, T, T)
+    # oversized destroyed tower covering columns 1-3, rows 5-7
+    tower = make_tile(T + 10, 5 * T + 10, 2 * T + 50, 3 * T - 10, solid=False)
+    world = CollisionWorld(T)
+    world.build(floor + [wall, tower])
+    return world
+
+
+def test_solid_cells_skip_non_solid_tiles():
+    world = make_world()
+    assert world.solid_cells(MockRect(T, 5 * T, 3 * T, 3 * T)) == []
+    assert world.solid_cells(MockRect(4 * T + 100, 7 * T + 100, 50, 50)) == [
+        (5, 7),
+        (4, 8),
+        (5, 8),
+    ]
+    # touching edges do not overlap, like pygame rects
+    assert not world.collides(MockRect(4 * T, 7 * T, T, T))
+    assert world.collides(MockRect(4 * T + 1, 7 * T, T, T))
+    assert not world.collides(MockRect(-5000, 8 * T, 100, 100))
+
+
+def test_ground_below():
+    world = make_world()
+    assert world.ground_below(2 * T + 5, 0) == 8 * T
+    assert world.ground_below(5 * T, 0) == 7 * T
+    assert world.ground_below(2 * T, 8 * T - 25, 20) is None
+    assert world.ground_below(2 * T, 8 * T - 15, 20) == 8 * T
+    assert world.ground_below(20 * T, 0) is None
+
+
+def test_box_cells_matches_solid_cells():
+    world = make_world()
+    rng = np.random.default_rng(1)
+    x = rng.integers(-200, 12 * T, 200).astype(np.float64)
+    y = rng.integers(4 * T, 10 * T, 200).astype(np.float64)
+    w = rng.integers(1, 200, 200)
+    h = rng.integers(1, 200, 200)
+
+    _, _, solid = world.box_cells(x, y, w, h)
+    for i in range(200):
+        rect = MockRect(int(x[i]), int(y[i]), int(w[i]), int(h[i]))
+        assert solid[i].any() == bool(world.solid_cells(rect))
@@ -0,0 +1,84 @@
+from unittest.mock import MagicMock
+
+from conftest import MockSurface
+from darkness import DarknessRenderer, tint_factors
+
+
+def test_tint_factors_round_like_an_alpha_blit():
+    color = (10, 10, 35)
+    mul, add = tint_factors(color, 130)
+    for m, a, c in zip(mul, add, color):
+        for x in range(256):
+            # x + ((c - x) * a >> 8), flooring towards the overlay color
+            assert abs(((x * m + 255) >> 8) + a - (x + ((c - x) * 130 >> 8))) <= 1
+
+    assert tint_factors(color, 255) == ((0, 0, 0), color)
+
+
+def make_renderer(**kwargs):
+    renderer = DarknessRenderer((1920, 1080), night_level=130, **kwargs)
+    renderer.tinted_copy = MagicMock(side_effect=lambda image: MockSurface())
+    return renderer
+
+
+def test_night_starts_once_the_level_holds_and_is_tinted_ahead():
+    renderer = make_renderer(hold_frames=3, tint_pixels=100 * 100)
+    screen = MagicMock()
+    images = [MockSurface() for _ in range(6)]
+
+    for darkness in (40, 90, 130, 130, 130, 130):
+        assert renderer.level == 0
+        # drawn in the dark: queued, still drawn as is
+        assert all(renderer.tint(image) is image for image in images)
+        renderer.draw(screen, darkness)
+    assert screen.blit.call_count == 6
+    # one 100x100 image per frame: six frames to get through the queue
+    assert renderer.stats()["tinted_ahead"] == 6
+
+    assert renderer.level == 130
+    screen.reset_mock()
+    tinted = [renderer.tint(image) for image in images]
+    renderer.draw(screen, 130)
+    screen.blit.assert_not_called()
+    assert renderer.tinted_copy.call_count == 6
+
+    # first drawn at night: tinted on the spot
+    late = MockSurface()
+    assert renderer.tint(late) is not late
+    assert renderer.stats()["tinted_late"] == 1
+
+    # dawn, then the next night reuses the copies
+    for darkness in (100, 0, 0, 130, 130, 130, 130):
+        renderer.draw(screen, darkness)
+        assert renderer.tint(images[0]) is (tinted[0] if renderer.level else images[0])
+    assert renderer.level == 130
+    assert renderer.tinted_copy.call_count == 7
+
+
+def test_darkness_held_below_night_keeps_the_overlay():
+    renderer = make_renderer(hold_frames=0)
+    screen = MagicMock()
+    image = MockSurface()
+
+    # e.g. the menu pausing the cycle at dusk
+    for _ in range(5):
+        renderer.tint(image)
+        renderer.draw(screen, 60)
+    assert renderer.level == 0
+    assert screen.blit.call_count == 5
+    renderer.tinted_copy.assert_called_once_with(image)  # ready for the night
+
+    renderer.draw(screen, 0)
+    assert not renderer.active
+
+
+def test_prepared_images_are_not_queued():
+    renderer = make_renderer(hold_frames=0)
+    strips = [MockSurface() for _ in range(3)]
+    renderer.prepare(strips)
+    assert renderer.tinted_copy.call_count == 3
+
+    renderer.queue(strips)
+    renderer.draw(MagicMock(), 130)
+    assert renderer.level == 130
+    assert renderer.stats()["tinted_ahead"] == 0
@@ -0,0 +1,52 @@
+from unittest.mock import MagicMock
+
+from conftest import MockSurface
+from debug_overlay import DebugOverlay
+from profiler import FrameProfiler
+
+
+def make_overlay():
+    overlay = DebugOverlay(MockSurface((1920, 1080)), "font.ttf")
+    overlay.font = MagicMock()
+    overlay.font.render.return_value = MockSurface((50, 20))
+    return overlay
+
+
+def rendered_text(overlay):
+    return [call.args[0] for call in overlay.font.render.call_args_list]
+
+
+def test_profiler_only_runs_while_shown():
+    overlay = make_overlay()
+    profiler = FrameProfiler(enabled=False)
+    profiler.frame_times.append(40.0)
+
+    overlay.toggle(profiler)
+    assert overlay.visible and profiler.enabled
+    assert not profiler.frame_times  # stale frames are dropped
+
+    overlay.toggle(profiler)
+    assert not overlay.visible and not profiler.enabled
+
+
+def test_draws_last_frame_and_counts():
+    overlay = make_overlay()
+    profiler = FrameProfiler()
+    profiler.frame_times.append(10.0)
+    profiler.frames.append({"custom_draw": 4.0, "enemies": 1.5})
+
+    overlay.draw(profiler, {"enemies": 12})
+    assert not rendered_text(overlay)  # hidden
+
+    overlay.visible = True
+    overlay.draw(profiler, {"enemies": 12})
+    assert rendered_text(overlay) == [
+        "frame",
+        "10.00 ms (100 fps)",
+        "custom_draw",
+        "4.00 ms",
+        "enemies",
+        "1.50 ms",
+        "enemies",
+        "12",
+    ]
@@ -0,0 +1,26 @@
+import random
+
+from conftest import make_sprite
+from enemy_index import EnemyIndex
+
+
+def test_nearest_matches_linear_scan():
+    rng = random.Random(7)
+    enemies = [
+        make_sprite(rng.randint(0, 6000) - 40, 900, 80, 100) for _ in range(200)
+    ]
+    index = EnemyIndex()
+    index.rebuild(enemies)
+
+    for _ in range(50):
+        x = rng.randint(0, 6000)
+        x_min, x_max = x - 400, x - 1
+        in_range = [e for e in enemies if x_min <= e.rect.centerx <= x_max]
+
+        nearest = index.nearest(x, x_min, x_max)
+        if not in_range:
+            assert nearest is None
+            continue
+        assert abs(nearest.rect.centerx - x) == min(
+            abs(e.rect.centerx - x) for e in in_range
+        )
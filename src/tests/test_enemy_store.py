@@ -0,0 +1,76 @@
+
+import game_clock
+from collision_world import CollisionWorld
+from conftest import make_sprite, make_tile
+from enemy import Enemy
+from enemy_store import EnemyStore
+
+T = 128
+
+
+def make_world():
+    """Floor on row 8 from column 0 to 19, with a wall block at column 15."""
+    world = CollisionWorld(T)
+    floor = [make_tile(col * T, 8 * T) for col in range(20)]
+    world.build(floor + [make_tile(15 * T, 7 * T)])
+    return world
+
+
+def make_player(x, y):
+    return make_sprite(x, y, 60, 100)
+
+
+def run_both(player, spawns, frames):
+    game_clock.use_frame_clock()
+    try:
+        world = make_world()
+        reference = [Enemy(x, 8 * T, "enemy03", facing_right=f) for x, f in spawns]
+        views = [Enemy(x, 8 * T, "enemy03", facing_right=f) for x, f in spawns]
+        store = EnemyStore()
+        store.set_world(world)
+        for enemy in views:
+            store.add(enemy)
+
+        for _ in range(frames):
+            game_clock.tick()
+            for enemy in reference:
+                enemy.update(world, player)
+            store.update(player)
+        return reference, views, store
+    finally:
+        game_clock.use_real_clock()
+
+
+def test_patrol_turns_at_walls_and_ledges_like_enemy_update():
+    player = make_player(-5000, 0)
+    spawns = [(14 * T, True), (2 * T, False), (10 * T, True)]
+    reference, views, store = run_both(player, spawns, 240)
+
+    assert store.x.tolist() == [e.hitbox.x for e in reference]
+    assert store.y.tolist() == [e.hitbox.y for e in reference]
+    assert store.facing_right.tolist() == [e.facing_right for e in reference]
+    for view, enemy in zip(views, reference):
+        assert view.rect.midbottom == enemy.rect.midbottom
+        assert view.image is enemy.image
+
+
+def test_chase_switches_on_sight_range():
+    player = make_player(6 * T, 7 * T)
+    spawns = [(8 * T, True), (4 * T, True), (19 * T, False)]
+    reference, _, store = run_both(player, spawns, 30)
+
+    assert store.chasing.tolist() == [e.state == "chase" for e in reference]
+    assert store.x.tolist() == [e.hitbox.x for e in reference]
+    assert store.dir_x.tolist() == [e.direction.x for e in reference]
+
+
+def test_killed_enemies_are_culled():
+    store = EnemyStore()
+    enemies = [Enemy(x * T, 8 * T) for x in range(3)]
+    for enemy in enemies:
+        store.add(enemy)
+    enemies[1].alive = lambda: False
+
+    store.cull()
+    assert store.enemies == [enemies[0], enemies[2]]
+    assert store.x.tolist() == [enemies[0].hitbox.x, enemies[2].hitbox.x]
@@ -54,3 +54,21 @@ def test_rain_spawn():
     surf = MockSurface((800, 600))
     rain = Rain(surf)
     assert len(rain.drops) > 0
+
+
+def test_sprite_assets_are_not_reused_unconverted(monkeypatch):
+    import pygame
+
+    from bullet import Bullet
+    from enemy import Enemy
+    from player import Player
+
+    with_display = pygame.display.get_surface
+    monkeypatch.setattr(pygame.display, "get_surface", lambda: None)
+    headless = (Enemy(0, 0, "enemy04").animations, Bullet.load_source("arrow.png"))
+    player = Player(0, 0, 3)
+    monkeypatch.setattr(pygame.display, "get_surface", with_display)
+
+    assert Enemy(0, 0, "enemy04").animations is not headless[0]
+    assert Bullet.load_source("arrow.png") is not headless[1]
+    assert Player(0, 0, 3).animations is not player.animations
@@ -0,0 +1,73 @@
+import io
+
+import numpy as np
+
+from map_loader import (
+    DECOR,
+    ENEMY,
+    TERRAIN,
+    WALL,
+    compile_layout,
+    occupied_cells,
+)
+
+
+def test_compile_layout_ids():
+    grid = compile_layout(["0,99,e03", " 1 ,101,x"])
+    assert grid.dtype == np.uint16
+    assert grid.tolist() == [[0, 99, 1003], [1, 101, 0]]
+
+
+def test_compile_layout_is_cached_and_passes_grids_through():
+    layout = ["0,1", "2,3"]
+    grid = compile_layout(layout)
+    assert compile_layout(list(layout)) is grid
+    assert compile_layout(grid) is grid
+    assert not grid.flags.writeable
+
+
+def test_occupied_cells_skips_empty_in_row_major_order():
+    grid = compile_layout(["0,99,0,0", "105,0,e01,2", "0,0,0,0"])
+    rows, cols, ids, kinds = occupied_cells(grid)
+    assert list(zip(rows, cols)) == [(0, 1), (1, 0), (1, 2), (1, 3)]
+    assert ids == [99, 105, 1001, 2]
+    assert kinds == [WALL, DECOR, ENEMY, TERRAIN]
+
+
+def test_map_file_round_trip(tmp_path, monkeypatch):
+    import pytest
+
+    from map_loader import MapFile, save_map
+
+    # the autouse mock_env fixture replaces open()
+    monkeypatch.setattr("builtins.open", io.open)
+    layout = ["0,0,99,0", "e02,1,2,3"]
+    path = str(tmp_path / "level.map")
+    save_map(path, layout)
+
+    map_file = MapFile(path)
+    assert (map_file.width, map_file.height) == (4, 2)
+    assert (compile_layout(map_file) == compile_layout(layout)).all()
+    assert map_file.columns(1, 3).tolist() == [[0, 99], [1, 2]]
+
+    (tmp_path / "bad.map").write_bytes(b"not a map at all")
+    with pytest.raises(ValueError):
+        MapFile(str(tmp_path / "bad.map"))
+
+
+def test_level_from_map_file(tmp_path, monkeypatch):
+    from conftest import MockSurface
+    from level import Level
+    from map_loader import MapFile, save_map
+
+    monkeypatch.setattr("builtins.open", io.open)
+    layout = ["99,0,0,99", "1,2,3,1"]
+    path = str(tmp_path / "level.map")
+    save_map(path, layout)
+
+    from_rows = Level(layout, MockSurface(), headless=True)
+    from_file = Level(MapFile(path), MockSurface(), headless=True)
+    assert from_file.map_width == from_rows.map_width
+    assert sorted(t.rect.topleft for t in from_file.tiles) == sorted(
+        t.rect.topleft for t in from_rows.tiles
+    )
@@ -0,0 +1,41 @@
+from unittest.mock import MagicMock
+
+import menu as menu_module
+from conftest import MockSurface
+from menu import Menu
+
+
+def make_menu(monkeypatch):
+    bake = MagicMock(side_effect=lambda size, alpha, pieces: MockSurface(size))
+    monkeypatch.setattr(menu_module, "bake_overlay", bake)
+    menu = Menu(MockSurface((1920, 1080)), "font.ttf")
+    menu.draw_buttons = MagicMock()
+    return menu, bake
+
+
+def test_pages_are_baked_once(monkeypatch):
+    menu, bake = make_menu(monkeypatch)
+    menu.state = "CREDITS"
+    menu.draw()
+    menu.draw()
+
+    bake.assert_called_once()
+    size, alpha, pieces = bake.call_args[0]
+    assert (size, alpha, len(pieces)) == ((1920, 1080), 120, 4)
+
+    menu.state = "MAIN"
+    menu.draw()
+    assert bake.call_count == 2
+    assert set(menu.layers) == {"CREDITS", "MAIN"}
+
+
+def test_only_changed_text_is_rendered_again(monkeypatch):
+    menu, _ = make_menu(monkeypatch)
+    menu.state = "SOUND"
+    menu.draw()
+    menu.draw()
+    assert menu.text_cache.stats()["misses"] == 1
+
+    menu.volume = 0.6
+    menu.draw()
+    assert menu.text_cache.stats() == {"surfaces": 2, "hits": 1, "misses": 2}
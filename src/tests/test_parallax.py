@@ -0,0 +1,65 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from conftest import MockSurface
+from parallax import EMPTY, MIXED, OPAQUE, ParallaxCompositor, merge_layers, row_runs
+
+
+def make_screen(size=(1000, 600)):
+    screen = MagicMock()
+    screen.get_size.return_value = size
+    return screen
+
+
+def test_layers_with_the_same_speed_are_merged():
+    back, mid, front = MockSurface(), MockSurface(), MockSurface()
+    merged = merge_layers([(back, 0.1), (mid, 0.2), (front, 0.2)])
+    assert [speed for _, speed in merged] == [0.1, 0.2]
+    assert merged[0][0] is back
+    # drawn into a copy, the loaded layer stays untouched
+    assert merged[1][0] is not mid
+
+
+def test_placements_match_looping_blits():
+    comp = ParallaxCompositor([(MockSurface(), 0.5)], 1200, 720)
+    # -(1000 * 0.5) % 1200 = 700: left copy at -500, right copy at 700
+    assert comp.placements(1000, 100, 1000, 600) == ((-500, 700, -110),)
+    # right copy starts past the screen
+    assert comp.placements(-2200, 0, 1000, 600) == ((-100, None, -60),)
+
+
+def test_composite_is_reused_while_camera_holds_still():
+    layers = [(MockSurface(), 0.05), (MockSurface(), 0.15)]
+    comp = ParallaxCompositor(layers, 1200, 720)
+    screen = make_screen()
+
+    comp.draw(screen, 100, 0)
+    comp.draw(screen, 100, 0)  # settled: layers drawn once more and captured
+    screen.reset_mock()
+    comp.draw(screen, 100.2, 0)  # same pixels
+    screen.blits.assert_not_called()
+    assert screen.blit.call_args[0][0] is comp.composite
+    assert comp.stats() == {"reused": 1, "redrawn": 2}
+
+    screen.reset_mock()
+    comp.draw(screen, 300, 0)
+    # moved: both layers again, their right copies are off screen
+    screen.blit.assert_not_called()
+    assert len(screen.blits.call_args[0][0]) == 2
+
+
+def test_draw_is_timed_as_background():
+    profiler = MagicMock()
+    comp = ParallaxCompositor([(MockSurface(), 0.05)], 1200, 720)
+    comp.draw(make_screen(), 0, 0, profiler)
+    profiler.phase.assert_called_once_with("background")
+
+
+def test_row_runs_fold_short_runs_into_mixed():
+    kinds = np.array(
+        [EMPTY] * 20 + [MIXED] * 5 + [OPAQUE] * 3 + [MIXED] * 2 + [OPAQUE] * 30,
+        np.int8,
+    )
+    assert row_runs(kinds, 16) == [(EMPTY, 0, 20), (MIXED, 20, 30), (OPAQUE, 30, 60)]
+    assert row_runs(kinds, 1)[2] == (OPAQUE, 25, 28)
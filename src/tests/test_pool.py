@@ -0,0 +1,83 @@
+from conftest import MockSurface
+from bullet import Bullet
+from enemy import Enemy
+from level import Level
+from pool import SpritePool
+
+
+def make_bullet_pool():
+    return SpritePool(Bullet, lambda: Bullet(0, 0, 1, MockSurface()))
+
+
+def test_pool_reuses_released_sprites_and_counts():
+    pool = make_bullet_pool()
+    surf = MockSurface()
+    first = pool.acquire(0, 0, 1, surf, damage=5)
+    second = pool.acquire(0, 0, 1, surf)
+    first.kill()
+    first.kill()  # dying twice only frees it once
+
+    rect = first.rect
+    third = pool.acquire(300, 200, -1, surf, damage=7, gravity=1.5)
+    assert third is first
+    assert third.rect is rect and third.rect.center == (300, 200)
+    assert third.damage == 7
+    assert third.vy == -6
+    assert third.direction == -1
+    assert pool.stats() == {
+        "hits": 1,
+        "misses": 2,
+        "high_water": 2,
+        "in_use": 2,
+        "free": 0,
+    }
+    second.kill()
+    assert pool.stats()["free"] == 1
+
+
+def test_reserve_fills_free_list_without_misses():
+    pool = make_bullet_pool()
+    pool.reserve(10)
+    assert len(pool.free) == 10
+    for _ in range(10):
+        pool.acquire(0, 0, 1, MockSurface())
+    assert pool.misses == 0
+    assert pool.hits == 10
+
+
+def test_reused_enemy_is_fully_reset():
+    pool = SpritePool(Enemy, lambda: Enemy(0, 0))
+    enemy = pool.acquire(0, 0, "enemy06", health_mult=2.0)
+    enemy.get_damage(100)
+    enemy.state = "chase"
+    enemy.get_damage(10**6)
+
+    rect, hitbox, animations = enemy.rect, enemy.hitbox, enemy.animations
+    again = pool.acquire(50, 0, "enemy01", facing_right=False)
+    assert again is enemy
+    # updated in place, not reallocated
+    assert again.rect is rect and again.hitbox is hitbox
+    assert (again.rect.centerx, again.rect.bottom) == (50, 0)
+    assert (again.hitbox.x, again.hitbox.width) == (again.rect.x + 10, 80)
+    assert again.animations is Enemy._ASSET_CACHE[("enemy01", 1.0, True)]
+    assert animations is Enemy._ASSET_CACHE[("enemy06", 1.0, True)]
+    assert again.current_health == again.max_health == 30
+    assert again.state == "patrol"
+    assert again.direction.x == -1
+
+
+def test_level_recycles_through_pools():
+    level = Level(["0,1"], MockSurface())
+    level.generate_night_queue()
+    stats = level.pool_stats()
+    assert stats["enemies"]["free"] >= len(level.night_enemy_queue)
+    assert stats["bullets"]["free"] > 0
+
+    level.create_bullet(0, 0, 1, MockSurface())
+    enemy = level.spawn_enemy("enemy02", 0, 0)
+    assert level.pool_stats()["bullets"]["misses"] == 0
+    assert level.pool_stats()["enemies"]["misses"] == 0
+
+    level.setup_level(level.level_data)
+    assert enemy not in level.enemy_pool.active
+    assert not level.bullet_pool.active
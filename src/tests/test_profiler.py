@@ -0,0 +1,35 @@
+from profiler import FrameProfiler, percentile
+
+
+def test_percentile_interpolates():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.5
+    assert percentile(values, 99) == 99.01
+    assert percentile([], 50) == 0.0
+
+
+def test_profiler_records_phases_per_frame():
+    profiler = FrameProfiler(history=10)
+    for _ in range(3):
+        profiler.begin_frame()
+        with profiler.phase("draw"):
+            pass
+        with profiler.phase("draw"):
+            pass
+        profiler.end_frame()
+
+    assert len(profiler.frames) == 3
+    assert set(profiler.frames[0]) == {"draw"}
+    summary = profiler.summary()
+    assert set(summary) == {"frame", "draw"}
+    assert summary["draw"]["p99"] >= summary["draw"]["p50"] >= 0
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = FrameProfiler()
+    profiler.enabled = False
+    profiler.begin_frame()
+    with profiler.phase("draw"):
+        pass
+    profiler.end_frame()
+    assert not profiler.frames
@@ -0,0 +1,66 @@
+import random
+
+import game_clock
+from collision_world import CollisionWorld
+from conftest import MockSurface, brute_force_groupcollide, make_sprite, make_tile
+from projectiles import ProjectileArrays
+
+
+def test_update_moves_culls_and_keeps_spawn_order():
+    game_clock.use_frame_clock()
+    try:
+        arrays = ProjectileArrays(capacity=2)
+        surf = MockSurface()
+        arrays.spawn(0, 0, 1, surf, damage=1)
+        arrays.spawn(0, 0, -1, surf, damage=2, gravity=1.5)
+        arrays.spawn(5000, 0, 1, surf, damage=3)  # flies into the wall
+        assert len(arrays) == 3
+
+        wall = make_tile(5050, -500, 1000, 1000)
+        floor = make_tile(0, 5000, 100, 100)
+        decor = make_tile(-500, -500, 1000, 1000, solid=False)
+        world = CollisionWorld()
+        world.build([wall, floor, decor])
+        arrays.update(world)
+
+        assert arrays.damage.tolist() == [1, 2]
+        assert arrays.x.tolist() == [-50 + 12, -50 - 12]
+        assert arrays.y.tolist() == [-50, -50 - 6 + 1.5]
+
+        game_clock.tick(1501)
+        arrays.update(CollisionWorld())
+        assert len(arrays) == 0
+    finally:
+        game_clock.use_real_clock()
+
+
+def test_collide_matches_groupcollide():
+    rng = random.Random(7)
+    arrays = ProjectileArrays()
+    surf = MockSurface()
+    for _ in range(400):
+        arrays.spawn(
+            rng.randint(-500, 3000), rng.randint(0, 1200), 1, surf, rng.randint(1, 9)
+        )
+    enemies = [
+        make_sprite(rng.randint(-500, 3000), rng.randint(0, 1200), 80, 100)
+        for _ in range(60)
+    ]
+    bullets = [
+        make_sprite(x, y, w, h, damage=damage)
+        for x, y, w, h, damage in zip(
+            arrays.x.tolist(),
+            arrays.y.tolist(),
+            arrays.w.tolist(),
+            arrays.h.tolist(),
+            arrays.damage.tolist(),
+        )
+    ]
+    expected = brute_force_groupcollide(enemies, bullets)
+
+    hits = arrays.collide(enemies)
+
+    assert list(hits) == list(expected)
+    for enemy, collided in expected.items():
+        assert hits[enemy] == [bullet.damage for bullet in collided]
+    assert len(arrays) == len(bullets) - sum(len(c) for c in expected.values())
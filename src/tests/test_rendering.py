@@ -0,0 +1,30 @@
+from unittest.mock import MagicMock
+
+from conftest import MockSurface, make_tile
+from terrain_chunks import TerrainChunks
+
+
+def test_terrain_chunks_rebake_only_changed_chunks():
+    chunks = TerrainChunks(256)
+    ground = make_tile(0, 512)
+    tree = make_tile(200, 256, 128, 256)  # overlaps chunks 0 and 1
+    far = make_tile(1024, 512)  # chunk 4, off screen
+    for tile in (ground, tree, far):
+        chunks.add(tile)
+
+    assert list(chunks.chunk_range(tree.rect)) == [0, 1]
+    assert chunks.dirty == {0, 1, 4}
+
+    chunks.draw(MockSurface((512, 1080)), MagicMock(x=0, y=0))
+    # only chunks in view are baked, the rest stays dirty until it shows up
+    assert set(chunks.surfaces) == {0, 1}
+    assert chunks.dirty == {4}
+    assert chunks.surfaces[0][1] == 256  # top edge of the tallest tile
+
+    chunks.remove(tree)
+    # chunk 1 is empty now and dropped right away
+    assert chunks.dirty == {0, 4}
+    assert 1 not in chunks.chunk_tiles
+    chunks.draw(MockSurface((512, 1080)), MagicMock(x=0, y=0))
+    assert set(chunks.surfaces) == {0}
+    assert chunks.surfaces[0][1] == 512
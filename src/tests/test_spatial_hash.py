@@ -0,0 +1,38 @@
+import random
+
+from conftest import MockRect, brute_force_groupcollide, make_sprite
+from spatial_hash import SpatialHash, groupcollide
+
+
+def test_query_returns_each_sprite_once_in_insertion_order():
+    grid = SpatialHash(100)
+    big = make_sprite(50, 50, 300, 300)  # spans 16 cells
+    small = make_sprite(120, 120, 10, 10)
+    grid.rebuild([big, small])
+
+    assert grid.query(MockRect(0, 0, 400, 400)) == [big, small]
+    assert grid.collide(MockRect(125, 125, 2, 2)) == [big, small]
+    assert grid.collide(MockRect(1000, 1000, 5, 5)) == []
+
+
+def test_groupcollide_matches_brute_force():
+    rng = random.Random(3)
+    enemies = [
+        make_sprite(rng.randint(-500, 3000), rng.randint(0, 1200), 80, 100)
+        for _ in range(60)
+    ]
+    bullets = [
+        make_sprite(rng.randint(-500, 3000), rng.randint(0, 1200), 24, 24)
+        for _ in range(300)
+    ]
+    expected = brute_force_groupcollide(enemies, bullets)
+
+    grid = SpatialHash(128)
+    grid.rebuild(enemies)
+    hits = groupcollide(grid, bullets, True)
+
+    assert list(hits) == list(expected)
+    for enemy, collided in hits.items():
+        assert collided == expected[enemy]
+        for bullet in collided:
+            bullet.kill.assert_called_once()
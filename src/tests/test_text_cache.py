@@ -0,0 +1,52 @@
+from unittest.mock import MagicMock
+
+from conftest import MockSurface
+from text_cache import TextCache
+
+
+def make_font():
+    font = MagicMock()
+    font.render.side_effect = lambda text, aa, color: MockSurface((10 * len(text), 20))
+    return font
+
+
+def test_text_is_rendered_once_per_key():
+    cache = TextCache()
+    font = make_font()
+
+    first = cache.render(font, "$100", (255, 215, 0))
+    assert cache.render(font, "$100", (255, 215, 0)) is first
+    assert font.render.call_count == 1
+
+    # a new value or color is a new surface
+    cache.render(font, "$120", (255, 215, 0))
+    cache.render(font, "$120", (0, 0, 0))
+    assert font.render.call_count == 3
+    assert cache.stats() == {"surfaces": 3, "hits": 1, "misses": 3}
+
+
+def test_least_recently_used_text_is_evicted():
+    cache = TextCache(size=2)
+    font = make_font()
+    cache.render(font, "a", "White")
+    cache.render(font, "b", "White")
+    cache.render(font, "a", "White")  # "b" is now the oldest
+    cache.render(font, "c", "White")
+
+    assert [key[1] for key in cache.surfaces] == ["a", "c"]
+
+
+def test_shadowed_text_is_one_surface_placed_like_the_text():
+    cache = TextCache()
+    font = make_font()
+    screen = MagicMock()
+
+    rect = cache.draw(screen, font, "day 3", (255, 215, 0), (4, 4), center=(500, 400))
+    # the text and its shadow are rendered once, drawn with one blit
+    assert font.render.call_count == 2
+    screen.blit.assert_called_once()
+    assert (rect.width, rect.height) == (50, 20)
+    assert rect.center == (500, 400)
+
+    cache.draw(screen, font, "day 3", (255, 215, 0), (4, 4), center=(500, 400))
+    assert font.render.call_count == 2
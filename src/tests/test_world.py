@@ -54,3 +54,61 @@ def test_rain_spawn():
     surf = MockSurface((800, 600))
     rain = Rain(surf)
     assert len(rain.drops) > 0
+
+
+def test_headless_level_runs_on_frame_clock():
+    from conftest import MockSurface
+    import game_clock
+
+    game_clock.use_frame_clock()
+    try:
+        lvl = Level(["0,0", "101,1"], MockSurface(), headless=True)
+        # decor is skipped without rendering, no rain or clouds are created
+        assert lvl.rain is None
+        assert len(lvl.clouds) == 0
+        assert all(getattr(s, "tile_type", "") != "101" for s in lvl.visible_sprites)
+        # nor fonts, sounds or the darkness overlay
+        assert lvl.font is None and lvl.text_cache is None
+        assert lvl.darkness is None
+        assert lvl.player.sprite.shoot_sound is None
+
+        for _ in range(3):
+            game_clock.tick()
+            lvl.run()
+        assert lvl.day_timer == 3
+        assert game_clock.get_ticks() == 50
+    finally:
+        game_clock.use_real_clock()
+
+
+def test_tile_images_are_cached():
+    from conftest import MockSurface
+
+    a = Tile((0, 0), 64, "1")
+    b = Tile((64, 0), 64, "1")
+    assert a.image is b.image
+    assert Tile((0, 0), 64, "200", flip_x=True).image is not Tile(
+        (0, 0), 64, "200"
+    ).image
+
+    lvl = Level(["0,1,2", "1,1,1"], MockSurface())
+    loads = Tile.cache_stats()["loads"]
+    lvl.setup_level(["0,1,2", "1,1,1"])
+    # rebuilding the level does not touch the disk again
+    assert Tile.cache_stats()["loads"] == loads
+
+
+def test_headless_tile_images_are_not_reused_with_a_display(monkeypatch):
+    import pygame
+
+    with_display = pygame.display.get_surface
+    monkeypatch.setattr(pygame.display, "get_surface", lambda: None)
+    Tile.get_image("2", 96)
+    loads = Tile.cache_stats()["loads"]
+    Tile.get_image("2", 96)
+    assert Tile.cache_stats()["loads"] == loads
+
+    # a display exists now: load (and convert) again
+    monkeypatch.setattr(pygame.display, "get_surface", with_display)
+    Tile.get_image("2", 96)
+    assert Tile.cache_stats()["loads"] == loads + 1
@@ -0,0 +1,112 @@
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import pygame
+
+from settings import TEXT_CACHE_SIZE
+
+Color = Any  # anything font.render accepts: "White", (r, g, b), ...
+
+
+def premultiplied(image: pygame.Surface) -> pygame.Surface:
+    """Premultiplied alpha copy of an image, for BLEND_PREMULTIPLIED blits."""
+    # convert_alpha() first: premul_alpha() misreads the padded rows of
+    # freshly rendered text
+    return image.convert_alpha().premul_alpha()
+
+
+class TextCache:
+    """
+    Least recently used cache of rendered text.
+
+    Surfaces are keyed by (font, text, color), so a HUD line is only
+    rasterized again when its value changes. Text with a drop shadow is
+    composited once into a single premultiplied surface (shadow under text)
+    and drawn with one blit instead of two.
+    """
+
+    def __init__(self, size: int = TEXT_CACHE_SIZE) -> None:
+        self.size = size
+        self.surfaces: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key: Hashable) -> Optional[pygame.Surface]:
+        surf = self.surfaces.get(key)
+        if surf is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+        return surf
+
+    def store(self, key: Hashable, surf: pygame.Surface) -> pygame.Surface:
+        self.surfaces[key] = surf
+        if len(self.surfaces) > self.size:
+            self.surfaces.popitem(last=False)
+        return surf
+
+    def render(
+        self, font: pygame.font.Font, text: str, color: Color
+    ) -> pygame.Surface:
+        """Same as font.render(text, True, color), rendered once per key."""
+        key = (font, text, color)
+        surf = self.lookup(key)
+        if surf is None:
+            surf = self.store(key, font.render(text, True, color))
+        return surf
+
+    def render_shadowed(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color: Color,
+        offset: Tuple[int, int],
+        shadow: Color = (0, 0, 0),
+    ) -> pygame.Surface:
+        """
+        Text over its shadow moved by offset (positive x, y), premultiplied;
+        blit with BLEND_PREMULTIPLIED. The text starts at the top left corner.
+        """
+        key = (font, text, color, offset, shadow)
+        surf = self.lookup(key)
+        if surf is None:
+            text_surf = premultiplied(font.render(text, True, color))
+            shadow_surf = premultiplied(font.render(text, True, shadow))
+            width, height = text_surf.get_size()
+            surf = pygame.Surface(
+                (width + offset[0], height + offset[1]), pygame.SRCALPHA
+            )
+            flags = pygame.BLEND_PREMULTIPLIED
+            surf.blit(shadow_surf, offset, special_flags=flags)
+            surf.blit(text_surf, (0, 0), special_flags=flags)
+            surf = self.store(key, surf)
+        return surf
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        font: pygame.font.Font,
+        text: str,
+        color: Color,
+        shadow_offset: Tuple[int, int],
+        **anchor: Tuple[int, int],
+    ) -> pygame.Rect:
+        """
+        Draws shadowed text placed like text.get_rect(**anchor), e.g.
+        topleft=(20, 0), and returns the rect of the text.
+        """
+        surf = self.render_shadowed(font, text, color, shadow_offset)
+        width, height = surf.get_size()
+        rect = pygame.Rect(0, 0, width - shadow_offset[0], height - shadow_offset[1])
+        for name, pos in anchor.items():
+            setattr(rect, name, pos)
+        surface.blit(surf, rect.topleft, special_flags=pygame.BLEND_PREMULTIPLIED)
+        return rect
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "surfaces": len(self.surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
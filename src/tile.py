@@ -4,20 +4,106 @@ from typing import Tuple, Optional, Dict, Any
 
 import pygame
 
+from utils import has_display, load_image
+
+TILES_PATH = os.path.join("assets", "tiles")
+TOWERS_PATH = os.path.join("assets", "towers")
+
+# Definition of tile properties for cleaner logic
+TILE_DEFS: Dict[str, Dict[str, Any]] = {
+    "1": {"file": "floor1.png", "dir": TILES_PATH},
+    "2": {"file": "floor2.png", "dir": TILES_PATH},
+    "3": {"file": "floor3.png", "dir": TILES_PATH},
+    "4": {"file": "inn1.png", "dir": TILES_PATH},
+    "5": {"file": "inn2.png", "dir": TILES_PATH},
+    "6": {"file": "inn3.png", "dir": TILES_PATH},
+    "7": {"file": "inn4.png", "dir": TILES_PATH},
+    "101": {"file": "grass_cliff.png", "dir": TILES_PATH, "scale": 2},
+    "102": {
+        "file": "small_tree.png",
+        "dir": TILES_PATH,
+        "scale": 2,
+        "anchor": "midtop",
+    },
+    "103": {
+        "file": "bigger_tree.png",
+        "dir": TILES_PATH,
+        "scale": 2,
+        "anchor": "midtop",
+    },
+    "104": {
+        "file": "tree.png",
+        "dir": TILES_PATH,
+        "scale": 2,
+        "anchor": "center",
+    },
+    "105": {
+        "file": "big_tree.png",
+        "dir": TILES_PATH,
+        "scale": 2,
+        "anchor": "center",
+    },
+    "106": {
+        "file": "big_cliff.png",
+        "dir": TILES_PATH,
+        "scale": 2,
+        "anchor": "center",
+    },
+    "107": {
+        "file": "small_cliff.png",
+        "dir": TILES_PATH,
+        "scale": 2,
+        "anchor": "center",
+    },
+    "200": {
+        "file": "cannon_destroyed.png",
+        "dir": TOWERS_PATH,
+        "price": 50,
+        "buyable": True,
+        "solid": False,
+        "scale": 4,
+        "anchor": "midbottom",
+    },
+    "201": {
+        "file": "archer1_destroyed.png",
+        "dir": TOWERS_PATH,
+        "price": 30,
+        "buyable": True,
+        "solid": False,
+        "scale": 4,
+        "anchor": "midbottom",
+    },
+    "202": {
+        "file": "archer2_destroyed.png",
+        "dir": TOWERS_PATH,
+        "price": 70,
+        "buyable": True,
+        "solid": False,
+        "scale": 4,
+        "anchor": "midbottom",
+    },
+}
+
 
 class Tile(pygame.sprite.Sprite):
     """
     Represents a static object in the world (floor, decor, destroyed towers).
     """
 
+    # Shared by every tile of the process:
+    # (tile type, size, flip_x, converted to the display format) -> image.
+    # Tiles never modify their image, so equal tiles can share one surface.
+    _IMAGE_CACHE: Dict[Tuple[str, int, bool, bool], pygame.Surface] = {}
+    _CACHE_STATS: Dict[str, int] = {"hits": 0, "misses": 0, "loads": 0}
+
+    # terrain chunks paint tiles with a lower paint_order first
+    paint_order = 0
+
     def __init__(
         self, pos: Tuple[int, int], size: int, tile_type: str, flip_x: bool = False
     ) -> None:
         super().__init__()
         self.z = 0
-        self.image = pygame.Surface((size, size))
-        self.rect = self.image.get_rect(topleft=pos)
-
         self.tile_type = tile_type
         self.flip_x = flip_x
         self.price = 0
@@ -26,122 +112,74 @@ class Tile(pygame.sprite.Sprite):
 
         self._setup_tile(pos, size)
 
-    def _setup_tile(self, pos: Tuple[int, int], size: int) -> None:
-        full_path = os.path.join("assets", "tiles")
-        tower_path = os.path.join("assets", "towers")
-
-        # Definition of tile properties for cleaner logic
-        tile_defs: Dict[str, Dict[str, Any]] = {
-            "1": {"file": "floor1.png", "dir": full_path},
-            "2": {"file": "floor2.png", "dir": full_path},
-            "3": {"file": "floor3.png", "dir": full_path},
-            "4": {"file": "inn1.png", "dir": full_path},
-            "5": {"file": "inn2.png", "dir": full_path},
-            "6": {"file": "inn3.png", "dir": full_path},
-            "7": {"file": "inn4.png", "dir": full_path},
-            "101": {"file": "grass_cliff.png", "dir": full_path, "scale": 2},
-            "102": {
-                "file": "small_tree.png",
-                "dir": full_path,
-                "scale": 2,
-                "anchor": "midtop",
-            },
-            "103": {
-                "file": "bigger_tree.png",
-                "dir": full_path,
-                "scale": 2,
-                "anchor": "midtop",
-            },
-            "104": {
-                "file": "tree.png",
-                "dir": full_path,
-                "scale": 2,
-                "anchor": "center",
-            },
-            "105": {
-                "file": "big_tree.png",
-                "dir": full_path,
-                "scale": 2,
-                "anchor": "center",
-            },
-            "106": {
-                "file": "big_cliff.png",
-                "dir": full_path,
-                "scale": 2,
-                "anchor": "center",
-            },
-            "107": {
-                "file": "small_cliff.png",
-                "dir": full_path,
-                "scale": 2,
-                "anchor": "center",
-            },
-            "200": {
-                "file": "cannon_destroyed.png",
-                "dir": tower_path,
-                "price": 50,
-                "buyable": True,
-                "solid": False,
-                "scale": 4,
-                "anchor": "midbottom",
-            },
-            "201": {
-                "file": "archer1_destroyed.png",
-                "dir": tower_path,
-                "price": 30,
-                "buyable": True,
-                "solid": False,
-                "scale": 4,
-                "anchor": "midbottom",
-            },
-            "202": {
-                "file": "archer2_destroyed.png",
-                "dir": tower_path,
-                "price": 70,
-                "buyable": True,
-                "solid": False,
-                "scale": 4,
-                "anchor": "midbottom",
-            },
-        }
-
-        if self.tile_type in tile_defs:
-            data = tile_defs[self.tile_type]
-            self.price = data.get("price", 0)
-            self.is_buyable = data.get("buyable", False)
-            self.is_solid = data.get("solid", True)
+    @classmethod
+    def get_image(
+        cls, tile_type: str, size: int, flip_x: bool = False
+    ) -> pygame.Surface:
+        """
+        Returns the scaled (and flipped) image of a tile type.
+
+        Each image is loaded from disk and scaled only once per process, so
+        rebuilding a level (restart, new game) reuses the cached surfaces.
+        Undefined tile types get a translucent placeholder of the tile size.
+        Images loaded before a display existed (headless) are not reused
+        once one does, since load_image() only converts with a display.
+        """
+        key = (tile_type, size, flip_x, has_display())
+        image = cls._IMAGE_CACHE.get(key)
+        if image is not None:
+            cls._CACHE_STATS["hits"] += 1
+            return image
+        cls._CACHE_STATS["misses"] += 1
 
+        data = TILE_DEFS.get(tile_type)
+        if flip_x and data is not None:
+            image = pygame.transform.flip(cls.get_image(tile_type, size), True, False)
+        elif data is None:
+            # Fallback for undefined tiles
+            image = pygame.Surface((size, size))
+            image.set_alpha(100)
+        else:
             img_path = os.path.join(data["dir"], data["file"])
 
             # Destroyed Towers are interactive/buyable
-            if self.is_buyable or int(self.tile_type) > 100:
-                self.image = pygame.image.load(img_path).convert_alpha()
-            else:
-                self.image = pygame.image.load(img_path).convert()
+            transparency = data.get("buyable", False) or int(tile_type) > 100
+            image = load_image(img_path, transparency)
+            cls._CACHE_STATS["loads"] += 1
 
             scale = data.get("scale", 1)
             if scale != 1:
-                w, h = self.image.get_size()
-                self.image = pygame.transform.scale(
-                    self.image, (int(w * scale), int(h * scale))
-                )
-            else:
-                self.image = pygame.transform.scale(self.image, (size, size))
-
-            if self.flip_x:
-                self.image = pygame.transform.flip(self.image, True, False)
-
-            anchor = data.get("anchor", "topleft")
-            if anchor == "midtop":
-                self.rect = self.image.get_rect(midtop=pos)
-            elif anchor == "midbottom":
-                self.rect = self.image.get_rect(midbottom=pos)
-            elif anchor == "center":
-                self.rect = self.image.get_rect(center=pos)
+                w, h = image.get_size()
+                image = pygame.transform.scale(image, (int(w * scale), int(h * scale)))
             else:
-                self.rect = self.image.get_rect(topleft=pos)
+                image = pygame.transform.scale(image, (size, size))
+
+        cls._IMAGE_CACHE[key] = image
+        return image
+
+    @classmethod
+    def cache_stats(cls) -> Dict[str, int]:
+        """Returns hit/miss counters, disk loads and size of the image cache."""
+        return {**cls._CACHE_STATS, "images": len(cls._IMAGE_CACHE)}
+
+    def _setup_tile(self, pos: Tuple[int, int], size: int) -> None:
+        self.image = self.get_image(self.tile_type, size, self.flip_x)
+
+        data = TILE_DEFS.get(self.tile_type)
+        if data is None:
+            self.rect = self.image.get_rect(topleft=pos)
+            return
 
+        self.price = data.get("price", 0)
+        self.is_buyable = data.get("buyable", False)
+        self.is_solid = data.get("solid", True)
+
+        anchor = data.get("anchor", "topleft")
+        if anchor == "midtop":
+            self.rect = self.image.get_rect(midtop=pos)
+        elif anchor == "midbottom":
+            self.rect = self.image.get_rect(midbottom=pos)
+        elif anchor == "center":
+            self.rect = self.image.get_rect(center=pos)
         else:
-            # Fallback for undefined tiles
-            self.image.set_alpha(100)
             self.rect = self.image.get_rect(topleft=pos)
@@ -1,9 +1,14 @@
 # @generated "partially" Gemini: Added docstrings and type annotations
 import os
-from typing import Tuple, Callable
+from typing import Tuple, Callable, Optional, Any
 
 import pygame
 
+from bullet import Bullet
+from enemy_index import EnemyIndex
+from game_clock import get_ticks
+from utils import load_image
+
 
 class Tower(pygame.sprite.Sprite):
     """
@@ -41,9 +46,7 @@ class Tower(pygame.sprite.Sprite):
             self.bullet_speed = 10
             self.bullet_gravity = 0
             self.bullet_offset = (59, 39)
-            self.bullet_surf = pygame.image.load(
-                os.path.join("assets", "bullet.png")
-            ).convert_alpha()
+            self.bullet_surf = Bullet.load_source("bullet.png")
         elif tower_type == "201":
             asset_name = "archer1.png"
             self.damage = 10
@@ -51,9 +54,7 @@ class Tower(pygame.sprite.Sprite):
             self.bullet_speed = 12
             self.bullet_gravity = 1.5
             self.bullet_offset = (47, 11)
-            self.bullet_surf = pygame.image.load(
-                os.path.join("assets", "arrow.png")
-            ).convert_alpha()
+            self.bullet_surf = Bullet.load_source("arrow.png")
         elif tower_type == "202":
             asset_name = "archer2.png"
             self.damage = 20
@@ -61,12 +62,10 @@ class Tower(pygame.sprite.Sprite):
             self.bullet_speed = 15
             self.bullet_gravity = 1.8
             self.bullet_offset = (48, 13)
-            self.bullet_surf = pygame.image.load(
-                os.path.join("assets", "arrow.png")
-            ).convert_alpha()
+            self.bullet_surf = Bullet.load_source("arrow.png")
 
         img_path = os.path.join("assets", "towers", asset_name)
-        self.original_image = pygame.image.load(img_path).convert_alpha()
+        self.original_image = load_image(img_path)
 
         w, h = self.original_image.get_size()
         self.image = pygame.transform.scale(
@@ -83,31 +82,30 @@ class Tower(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(midbottom=pos)
 
         self.create_bullet = create_bullet_callback
-        self.last_shot_time = pygame.time.get_ticks()
+        self.last_shot_time = get_ticks()
 
-    def update(self, enemies: pygame.sprite.Group) -> None:
+    def update(self, enemy_index: EnemyIndex) -> None:
         """
-        Finds the closest enemy and shoots if cooldown is ready.
+        Shoots if cooldown is ready and an enemy is in range.
         """
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
 
         if current_time - self.last_shot_time >= self.cooldown:
-            for enemy in enemies:
-                dist = abs(enemy.rect.centerx - self.rect.centerx)
-
-                if self.flip_x:  # left
-                    facing_target = enemy.rect.centerx < self.rect.centerx
-                else:  # right
-                    facing_target = enemy.rect.centerx > self.rect.centerx
-
-                if (
-                    dist <= self.range
-                    and facing_target
-                    and not getattr(enemy, "is_dead", False)
-                ):
-                    self.shoot()
-                    self.last_shot_time = current_time
-                    break
+            if self.find_target(enemy_index) is not None:
+                self.shoot()
+                self.last_shot_time = current_time
+
+    def find_target(self, enemy_index: EnemyIndex) -> Optional[Any]:
+        """
+        Returns the nearest enemy in range in front of the tower. Shots fly
+        along the tower's facing, so this only decides whether to fire.
+        """
+        x = self.rect.centerx
+        if self.flip_x:  # left
+            x_min, x_max = x - self.range, x - 1
+        else:  # right
+            x_min, x_max = x + 1, x + self.range
+        return enemy_index.nearest(x, x_min, x_max)
 
     def shoot(self) -> None:
         """Calculates spawn position and triggers the bullet creation callback."""
@@ -1,7 +1,7 @@
 # @generated "partially" Gemini: Added docstrings and type annotations
 import os
 import random
-from typing import Tuple
+from typing import List, Optional, Tuple
 
 import pygame
 
@@ -56,19 +56,64 @@ def generate_row(row_type: str) -> str:
     return ",".join(row)
 
 
-tower_defense_map = [
-    generate_row("sky"),
-    generate_row("sky"),
-    generate_row("sky"),
-    generate_row("sky"),
-    generate_row("sky"),
-    generate_row("sky"),
-    generate_row("sky"),
-    generate_row("decor"),
-    generate_row("ground"),
-    generate_row("underground"),
-    generate_row("underground"),
-]
+def generate_map() -> List[str]:
+    """Generates a random tower defense map (sky, decor, ground and underground rows)."""
+    return [
+        generate_row("sky"),
+        generate_row("sky"),
+        generate_row("sky"),
+        generate_row("sky"),
+        generate_row("sky"),
+        generate_row("sky"),
+        generate_row("sky"),
+        generate_row("decor"),
+        generate_row("ground"),
+        generate_row("underground"),
+        generate_row("underground"),
+    ]
+
+
+tower_defense_map = generate_map()
+
+
+def has_display() -> bool:
+    """
+    Whether a video mode is set, i.e. whether load_image() converts images.
+    Image caches include it in their keys, so images loaded before set_mode
+    (headless, tests) are not reused unconverted afterwards.
+    """
+    return pygame.display.get_surface() is not None
+
+
+def load_image(path: str, transparency: bool = True) -> pygame.Surface:
+    """
+    Loads an image and converts it to the display format when a display exists.
+
+    Without a display (headless simulation) the image is returned as decoded,
+    since convert()/convert_alpha() require a video mode.
+
+    Args:
+        path: Path to the image file.
+        transparency: Whether to use convert_alpha() or convert().
+
+    Returns:
+        Loaded pygame Surface.
+    """
+    img = pygame.image.load(path)
+    if not has_display():
+        return img
+    if transparency:
+        return img.convert_alpha()
+    return img.convert()
+
+
+def load_sound(path: str, volume: float) -> Optional[pygame.mixer.Sound]:
+    """Loads a sound effect, or returns None if the mixer isn't initialized."""
+    if not pygame.mixer.get_init():
+        return None
+    sound = pygame.mixer.Sound(path)
+    sound.set_volume(volume)
+    return sound
 
 
 def load_bg(
@@ -86,40 +131,10 @@ def load_bg(
         Scaled pygame Surface.
     """
     path = os.path.join("assets", "background", filename)
-    if transparency:
-        img = pygame.image.load(path).convert_alpha()
-    else:
-        img = pygame.image.load(path).convert()
+    img = load_image(path, transparency)
     return pygame.transform.scale(img, bg_size)
 
 
-def draw_bg(
-    surface: pygame.Surface,
-    img: pygame.Surface,
-    x_pos: float,
-    y_pos: float,
-    bg_w: int,
-    screen_w: int,
-) -> None:
-    """
-    Draws a parallax background image that loops.
-
-    Args:
-        surface: The target display surface.
-        img: The background image surface.
-        x_pos: Current X position (parallax offset).
-        y_pos: Current Y position.
-        bg_w: Width of the background image.
-        screen_w: Width of the screen.
-    """
-    relative_x = x_pos % bg_w
-
-    surface.blit(img, (relative_x - bg_w, y_pos))
-
-    if relative_x < screen_w:
-        surface.blit(img, (relative_x, y_pos))
-
-
 SCORE_FILE = os.path.join("assets", "score")
 
 